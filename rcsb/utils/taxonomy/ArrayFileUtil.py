@@ -0,0 +1,171 @@
+##
+# File: ArrayFileUtil.py
+# Date: 16-Oct-2026
+#
+# Updates:
+# 16-Oct-2026 add size() and writeBuffer() to serialize array bundles into an existing buffer
+# 16-Oct-2026 add memoryUsage() to report the size and backing of array sections
+##
+"""
+Read and write bundles of flat typed arrays stored in a single memory-mappable file.
+
+File layout:  8-byte magic, 8-byte little-endian header length, JSON header, then each
+array section aligned on an 8-byte boundary.  Sections are returned as memoryviews over
+the mapped file so no data is copied on open.
+
+"""
+
+import array
+import json
+import logging
+import mmap
+import os
+import struct
+import sys
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"RCSBARR1"
+ALIGNMENT = 8
+
+
+class ArrayFileUtil(object):
+    """Utilities to serialize typed array sections to a memory-mappable file."""
+
+    def __init__(self, **kwargs):
+        _ = kwargs
+
+    def write(self, filePath, arrayD, attributeD=None):
+        """Write the input dictionary of typed arrays to a single file.
+
+        Args:
+            filePath (str): output file path
+            arrayD (dict): {sectionName: array.array | bytes | memoryview, ...}
+            attributeD (dict, optional): JSON serializable attributes stored in the file header. Defaults to None.
+
+        Returns:
+            bool: True for success or False otherwise
+        """
+        try:
+            prefix, bufL, _ = self.__layout(arrayD, attributeD)
+            tmpPath = filePath + ".tmp"
+            with open(tmpPath, "wb") as ofh:
+                ofh.write(prefix)
+                for mv, nBytes in bufL:
+                    ofh.write(mv)
+                    ofh.write(b"\0" * self.__padding(nBytes))
+            os.replace(tmpPath, filePath)
+            return True
+        except Exception as e:
+            logger.exception("Failing writing %r with %s", filePath, str(e))
+        return False
+
+    def size(self, arrayD, attributeD=None):
+        """Return the size in bytes of the serialized array bundle."""
+        return self.__layout(arrayD, attributeD)[2]
+
+    def writeBuffer(self, buf, arrayD, attributeD=None):
+        """Serialize the input dictionary of typed arrays into a writable buffer of at least size() bytes.
+
+        Args:
+            buf (object): writable buffer (e.g. a shared memory buffer)
+            arrayD (dict): {sectionName: array.array | bytes | memoryview, ...}
+            attributeD (dict, optional): JSON serializable attributes stored in the header. Defaults to None.
+
+        Returns:
+            bool: True for success or False otherwise
+        """
+        try:
+            prefix, bufL, _ = self.__layout(arrayD, attributeD)
+            with memoryview(buf).cast("B") as outMv:
+                outMv[: len(prefix)] = prefix
+                offset = len(prefix)
+                for mv, nBytes in bufL:
+                    outMv[offset : offset + nBytes] = mv.cast("B") if mv.format != "B" else mv
+                    offset += nBytes + self.__padding(nBytes)
+            return True
+        except Exception as e:
+            logger.exception("Failing writing array buffer with %s", str(e))
+        return False
+
+    def __layout(self, arrayD, attributeD):
+        """Return the serialized prefix (magic, header length and header), the section buffers and the total size."""
+        sectionD = {}
+        offset = 0
+        bufL = []
+        for name, arr in arrayD.items():
+            mv = self.__toMemoryview(arr)
+            nBytes = mv.nbytes
+            sectionD[name] = {"offset": offset, "typecode": mv.format, "itemsize": mv.itemsize, "length": len(mv)}
+            bufL.append((mv, nBytes))
+            offset += nBytes + self.__padding(nBytes)
+        headerD = {"byteorder": sys.byteorder, "attributes": attributeD if attributeD else {}, "sections": sectionD}
+        header = json.dumps(headerD).encode("utf-8")
+        header += b" " * self.__padding(len(MAGIC) + 8 + len(header))
+        prefix = MAGIC + struct.pack("<Q", len(header)) + header
+        return prefix, bufL, len(prefix) + offset
+
+    def read(self, filePath):
+        """Open the input array file as a read-only memory map.
+
+        Args:
+            filePath (str): input file path
+
+        Returns:
+            (dict, dict): attribute dictionary, {sectionName: memoryview, ...}
+        """
+        with open(filePath, "rb") as ifh:
+            mm = mmap.mmap(ifh.fileno(), 0, access=mmap.ACCESS_READ)
+        return self.fromBuffer(mm)
+
+    def fromBuffer(self, buf):
+        """Return the attributes and typed array sections stored in the input buffer.
+
+        Args:
+            buf (object): any object supporting the buffer protocol (mmap, bytes, shared memory buffer)
+
+        Returns:
+            (dict, dict): attribute dictionary, {sectionName: memoryview, ...}
+        """
+        mv = memoryview(buf)
+        if bytes(mv[: len(MAGIC)]) != MAGIC:
+            raise ValueError("Unrecognized array file format")
+        (headerLength,) = struct.unpack("<Q", mv[len(MAGIC) : len(MAGIC) + 8])
+        start = len(MAGIC) + 8
+        headerD = json.loads(bytes(mv[start : start + headerLength]).decode("utf-8"))
+        if headerD["byteorder"] != sys.byteorder:
+            raise ValueError("Array file byte order %r does not match this platform" % headerD["byteorder"])
+        start += headerLength
+        sectionD = {}
+        for name, sD in headerD["sections"].items():
+            if array.array(sD["typecode"]).itemsize != sD["itemsize"]:
+                raise ValueError("Array file section %r has incompatible item size" % name)
+            begin = start + sD["offset"]
+            sectionD[name] = mv[begin : begin + sD["length"] * sD["itemsize"]].cast(sD["typecode"])
+        return headerD["attributes"], sectionD
+
+    def memoryUsage(self, sectionD):
+        """Return the total size and backing of the input array sections.
+
+        Args:
+            sectionD (dict): {sectionName: array.array | bytes | memoryview, ...}
+
+        Returns:
+            dict: {"bytes": <total section bytes>, "backing": "mapped" (views over a memory map) or "heap"}
+        """
+        nBytes = 0
+        isMapped = False
+        for arr in sectionD.values():
+            mv = arr if isinstance(arr, memoryview) else memoryview(arr)
+            nBytes += mv.nbytes
+            isMapped = isMapped or isinstance(mv.obj, mmap.mmap)
+        return {"bytes": nBytes, "backing": "mapped" if isMapped else "heap"}
+
+    def __toMemoryview(self, arr):
+        if isinstance(arr, (bytes, bytearray)):
+            return memoryview(arr)
+        mv = memoryview(arr)
+        return mv if mv.ndim == 1 else mv.cast("B")
+
+    def __padding(self, nBytes):
+        return (ALIGNMENT - nBytes % ALIGNMENT) % ALIGNMENT
@@ -0,0 +1,350 @@
+##
+# File: TaxonomyBatchQuery.py
+# Date: 16-Oct-2026
+#
+# Updates:
+##
+"""
+NumPy vectorized batch queries (merged identifiers, parents, ranks, depths, ancestors and lineages)
+over the node store and LCA index arrays.
+
+The node store and LCA index sections are wrapped as NumPy arrays without copying, so batch
+queries run as array operations over the whole input rather than as per-identifier Python calls.
+Unknown taxonomy identifiers give -1 in the returned arrays.
+
+"""
+
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# compareTaxons() status values (index is the status code returned by compareTaxonPairs())
+COMPARE_STATUS_LIST = [
+    None,
+    "matched",
+    "query is ancestor",
+    "query is descendant",
+    "lowest common ancestor",
+    "alternate variants",
+    "orthologous match (by lca)",
+    "alternate subspecies",
+    "alternate strain/serotype/isolate/genotype",
+    "alternate strain",
+]
+# compareTaxons() rank categories
+VARIANT_LCA_RANKS = ["serotype", "serogroup"]
+ORTHOLOGOUS_LCA_RANKS = [
+    "clade",
+    "class",
+    "family",
+    "genotype",
+    "genus",
+    "infraorder",
+    "isolate",
+    "kingdom",
+    "order",
+    "parvorder",
+    "phylum",
+    "subfamily",
+    "subgenus",
+    "superkingdom",
+    "superorder",
+    "tribe",
+    "species group",
+]
+STRAIN_LIKE_RANKS = ["strain", "serotype", "serovar", "serogroup", "biotype", "isolate", "no rank", "genotype"]
+
+
+class TaxonomyBatchQuery(object):
+    """Vectorized batch queries over the taxonomy node store and LCA index."""
+
+    def __init__(self, nodeStore, lcaIndex, mergeD):
+        """Vectorized batch queries over the taxonomy node store and LCA index.
+
+        Args:
+            nodeStore (TaxonomyNodeStore): node store
+            lcaIndex (TaxonomyLcaIndex): LCA index over the node store
+            mergeD (dict): {taxId: mergedTaxId, ...}
+        """
+        self.__taxIds = np.frombuffer(nodeStore.section("taxId"), dtype=np.int32)
+        self.__lookup = np.frombuffer(nodeStore.section("lookup"), dtype=np.int32)
+        self.__parentIndex = np.frombuffer(nodeStore.section("parentIndex"), dtype=np.int32)
+        self.__rankCodes = np.frombuffer(nodeStore.section("rank"), dtype=np.uint8)
+        self.__orphanParentTaxIds = np.frombuffer(nodeStore.section("orphanParentTaxId"), dtype=np.int32)
+        self.__depth = np.frombuffer(lcaIndex.section("depth"), dtype=np.int32)
+        self.__rankL = nodeStore.getRankList()
+        self.__upL = [np.frombuffer(lcaIndex.section("up%d" % kk), dtype=np.int32) for kk in range(lcaIndex.levels())]
+        #
+        mergeKeys = np.fromiter(mergeD.keys(), dtype=np.int64, count=len(mergeD))
+        order = np.argsort(mergeKeys, kind="stable")
+        self.__mergeKeys = mergeKeys[order]
+        self.__mergeVals = np.fromiter((mergeD[taxId] for taxId in self.__mergeKeys.tolist()), dtype=np.int64, count=len(mergeD))
+        logger.debug("Taxonomy batch query over %d nodes %d merged taxa", len(self.__taxIds), len(self.__mergeKeys))
+
+    def memoryUsage(self):
+        """Return the size and backing of the sorted merged identifier arrays (the node and LCA arrays are views over their stores)."""
+        return {"bytes": self.__mergeKeys.nbytes + self.__mergeVals.nbytes, "backing": "heap"}
+
+    def toArray(self, taxIds):
+        """Return the input NumPy array or iterable of taxonomy identifiers as an int64 array."""
+        if isinstance(taxIds, np.ndarray):
+            return taxIds.astype(np.int64, copy=False).ravel()
+        return np.fromiter((int(taxId) for taxId in taxIds), dtype=np.int64)
+
+    def mergedTaxIds(self, taxIds):
+        """Return the array of taxonomy identifiers with merged identifiers replaced by their targets."""
+        tA = self.toArray(taxIds)
+        if not len(self.__mergeKeys):
+            return tA.copy()
+        pos = np.minimum(np.searchsorted(self.__mergeKeys, tA), len(self.__mergeKeys) - 1)
+        return np.where(self.__mergeKeys[pos] == tA, self.__mergeVals[pos], tA)
+
+    def indices(self, taxIds):
+        """Return the array of node indices (or -1) for the merged resolved taxonomy identifiers."""
+        return self.__lookupIndices(self.mergedTaxIds(taxIds))
+
+    def __lookupIndices(self, tA):
+        """Return the node indices (or -1) of the taxonomy identifier array tA (nodes unreachable from a root are excluded)."""
+        idxA = np.full(len(tA), -1, dtype=np.int64)
+        ok = (tA >= 0) & (tA < len(self.__lookup))
+        idxA[ok] = self.__lookup[tA[ok]]
+        known = idxA >= 0
+        idxA[known] = np.where(self.__depth[idxA[known]] >= 0, idxA[known], -1)
+        return idxA
+
+    def __orphanTaxIds(self, rootIdxA):
+        """Return the parent taxonomy identifiers missing from the node table for the root node indices (or 1 for a table root)."""
+        rootParentA = self.__parentIndex[rootIdxA].astype(np.int64)
+        isOrphan = rootParentA < 0
+        orphanTaxIdA = np.full(len(rootIdxA), 1, dtype=np.int64)
+        orphanTaxIdA[isOrphan] = self.__orphanParentTaxIds[-rootParentA[isOrphan] - 2]
+        return orphanTaxIdA
+
+    def parentTaxIds(self, taxIds):
+        """Return the array of parent taxonomy identifiers (or -1)."""
+        idxA = self.indices(taxIds)
+        pA = np.full(len(idxA), -1, dtype=np.int64)
+        known = idxA >= 0
+        pIdxA = self.__parentIndex[idxA[known]].astype(np.int64)
+        inTable = pIdxA >= 0
+        kA = pA[known]
+        kA[inTable] = self.__taxIds[pIdxA[inTable]]
+        kA[~inTable] = self.__orphanParentTaxIds[-pIdxA[~inTable] - 2]
+        pA[known] = kA
+        return pA
+
+    def rankCodes(self, taxIds):
+        """Return the array of rank codes (or -1) indexing the node store rank table."""
+        idxA = self.indices(taxIds)
+        rA = np.full(len(idxA), -1, dtype=np.int16)
+        known = idxA >= 0
+        rA[known] = self.__rankCodes[idxA[known]]
+        return rA
+
+    def indexedTaxIds(self, taxIds, indexColumn):
+        """Return the array of taxonomy identifiers (or -1) of the node indices held in a per-node index column for the input taxonomy identifiers.
+
+        Args:
+            taxIds (np.ndarray or iterable): taxonomy identifiers (merged identifiers are resolved)
+            indexColumn (array.array or memoryview): int32 node index (or -1) for each node index
+
+        Returns:
+            np.ndarray: int64 taxonomy identifiers (or -1)
+        """
+        idxA = self.indices(taxIds)
+        tA = np.full(len(idxA), -1, dtype=np.int64)
+        known = idxA >= 0
+        colIdxA = np.frombuffer(indexColumn, dtype=np.int32)[idxA[known]]
+        tA[known] = np.where(colIdxA >= 0, self.__taxIds[np.maximum(colIdxA, 0)], -1)
+        return tA
+
+    def selectTaxIds(self, idxA, rank=None, baseIndex=None, maxDepth=None):
+        """Return the taxonomy identifiers of the input node indices, optionally filtered by rank and depth.
+
+        Args:
+            idxA (np.ndarray): node indices
+            rank (str, optional): keep only nodes with this rank. Defaults to None.
+            baseIndex (int, optional): node index from which maxDepth is measured. Defaults to None (the root).
+            maxDepth (int, optional): keep only nodes at most maxDepth levels below baseIndex. Defaults to None.
+
+        Returns:
+            np.ndarray: int64 taxonomy identifiers
+        """
+        keep = np.ones(len(idxA), dtype=bool)
+        if rank is not None:
+            keep &= (self.__rankCodes[idxA] == self.__rankL.index(rank)) if rank in self.__rankL else False
+        if maxDepth is not None:
+            keep &= self.__depth[idxA] <= (self.__depth[baseIndex] if baseIndex is not None else 0) + maxDepth
+        return self.__taxIds[idxA[keep]].astype(np.int64)
+
+    def depths(self, taxIds):
+        """Return the array of node depths below the root (or -1)."""
+        idxA = self.indices(taxIds)
+        dA = np.full(len(idxA), -1, dtype=np.int32)
+        known = idxA >= 0
+        dA[known] = self.__depth[idxA[known]]
+        return dA
+
+    def __ancestorIndices(self, idxA, depthA):
+        """Lift the (known) node indices idxA to the ancestors at the input depths."""
+        deltaA = self.__depth[idxA] - depthA
+        for kk, up in enumerate(self.__upL):
+            lift = ((deltaA >> kk) & 1).astype(bool)
+            idxA[lift] = up[idxA[lift]]
+        return idxA
+
+    def ancestorTaxIds(self, taxIds, depth):
+        """Return the array of ancestor taxonomy identifiers at the input depth (or -1)."""
+        idxA = self.indices(taxIds)
+        aA = np.full(len(idxA), -1, dtype=np.int64)
+        known = idxA >= 0
+        known[known] = (self.__depth[idxA[known]] >= depth) & (depth >= 0)
+        aA[known] = self.__taxIds[self.__ancestorIndices(idxA[known], depth)]
+        return aA
+
+    def lineages(self, taxIds):
+        """Return the lineages (as returned by TaxonomyProvider.getLineage()) as a flattened array and offsets.
+
+        Returns:
+            (np.ndarray, np.ndarray): taxonomy identifiers, offsets (the lineage of the i-th input is flat[offsets[i]:offsets[i + 1]])
+        """
+        tA = self.mergedTaxIds(taxIds)
+        idxA = self.__lookupIndices(tA)
+        known = idxA >= 0
+        kIdxA = idxA[known]
+        depthA = self.__depth[kIdxA].astype(np.int64)
+        rootIdxA = self.__ancestorIndices(kIdxA.copy(), 0)
+        # the synthetic root 1 is excluded (except from its own lineage) and a parent missing from the node table is included
+        numNodeA = depthA + 1 - ((self.__taxIds[rootIdxA] == 1) & (depthA > 0))
+        orphanTaxIdA = self.__orphanTaxIds(rootIdxA)
+        hasOrphan = orphanTaxIdA != 1
+        #
+        lengthA = np.ones(len(tA), dtype=np.int64)
+        lengthA[known] = numNodeA + hasOrphan
+        offsetA = np.zeros(len(tA) + 1, dtype=np.int64)
+        np.cumsum(lengthA, out=offsetA[1:])
+        flatA = np.empty(offsetA[-1], dtype=np.int64)
+        flatA[offsetA[:-1][~known]] = tA[~known]
+        kStartA = offsetA[:-1][known]
+        flatA[kStartA[hasOrphan]] = orphanTaxIdA[hasOrphan]
+        # fill each lineage bottom up one level at a time
+        endA = offsetA[1:][known] - 1
+        curA = kIdxA.copy()
+        up0 = self.__upL[0]
+        for level in range(int(numNodeA.max()) if len(numNodeA) else 0):
+            act = numNodeA > level
+            flatA[endA[act] - level] = self.__taxIds[curA[act]]
+            curA[act] = up0[curA[act]]
+        return flatA, offsetA
+
+    def __lcaIndices(self, idxA, jdxA):
+        """Return the lowest common ancestor node indices (or -1) of the (known) node index arrays idxA and jdxA."""
+        depthA = np.minimum(self.__depth[idxA], self.__depth[jdxA])
+        idxA = self.__ancestorIndices(idxA.copy(), depthA)
+        jdxA = self.__ancestorIndices(jdxA.copy(), depthA)
+        for up in reversed(self.__upL):
+            move = up[idxA] != up[jdxA]
+            idxA[move] = up[idxA[move]]
+            jdxA[move] = up[jdxA[move]]
+        up0 = self.__upL[0]
+        return np.where(idxA == jdxA, idxA, np.where(up0[idxA] == up0[jdxA], up0[idxA], -1))
+
+    def __rankFlags(self, test):
+        """Return a boolean array over the rank codes for the input rank test (the extra last element serves rank code -1)."""
+        return np.array([bool(rank) and test(rank) for rank in self.__rankL] + [False])
+
+    def __inLineage(self, tA, tIdxA, vA, vIdxA, vOrphanA):
+        """Return True where taxonomy identifier tA (node index tIdxA) is in the lineage of the merged resolved identifier vA."""
+        inL = np.where(vIdxA < 0, tA == vA, (tA == vOrphanA) & (tA != 1))
+        both = (vIdxA >= 0) & (tIdxA >= 0)
+        inL[both] |= (self.__lcaIndices(tIdxA[both], vIdxA[both]) == tIdxA[both]) & ((tA[both] != 1) | (vA[both] == 1))
+        return inL
+
+    def compareTaxonPairs(self, queryTaxIds, refTaxIds):
+        """Compare query and reference taxonomy identifier pairs (as TaxonomyProvider.compareTaxons()).
+
+        Args:
+            queryTaxIds (np.ndarray or iterable): query taxonomy identifiers
+            refTaxIds (np.ndarray or iterable): reference taxonomy identifiers
+
+        Returns:
+            (np.ndarray, np.ndarray, np.ndarray): status codes (see COMPARE_STATUS_LIST), lowest common ancestor taxonomy identifiers (or -1)
+                                                  and lowest common ancestor rank codes (or -1)
+        """
+        qA = self.toArray(queryTaxIds)
+        rA = self.toArray(refTaxIds)
+        if len(qA) != len(rA):
+            raise ValueError("Query and reference lengths differ (%d != %d)" % (len(qA), len(rA)))
+        qRawIdxA = self.__lookupIndices(qA)
+        rRawIdxA = self.__lookupIndices(rA)
+        qMrgA = self.mergedTaxIds(qA)
+        rMrgA = self.mergedTaxIds(rA)
+        qIdxA = self.__lookupIndices(qMrgA)
+        rIdxA = self.__lookupIndices(rMrgA)
+        qOrphanA = np.ones(len(qA), dtype=np.int64)
+        qOrphanA[qIdxA >= 0] = self.__orphanTaxIds(self.__ancestorIndices(qIdxA[qIdxA >= 0], 0))
+        rOrphanA = np.ones(len(rA), dtype=np.int64)
+        rOrphanA[rIdxA >= 0] = self.__orphanTaxIds(self.__ancestorIndices(rIdxA[rIdxA >= 0], 0))
+        #
+        isMatched = qA == rA
+        isAncestor = ~isMatched & self.__inLineage(qA, qRawIdxA, rMrgA, rIdxA, rOrphanA)
+        isDescendant = ~isMatched & ~isAncestor & self.__inLineage(rA, rRawIdxA, qMrgA, qIdxA, qOrphanA)
+        isOther = ~(isMatched | isAncestor | isDescendant)
+        # deepest common member of the query and reference lineages
+        lcaA = np.full(len(qA), -1, dtype=np.int64)
+        both = isOther & (qIdxA >= 0) & (rIdxA >= 0)
+        lcaIdxA = self.__lcaIndices(qIdxA[both], rIdxA[both])
+        bothLcaA = np.where(lcaIdxA >= 0, self.__taxIds[np.maximum(lcaIdxA, 0)], -1)
+        bothLcaA[(bothLcaA == 1) & ((qMrgA[both] != 1) | (rMrgA[both] != 1))] = -1
+        lcaA[both] = bothLcaA
+        shareOrphan = isOther & (lcaA < 0) & (qOrphanA == rOrphanA) & (qOrphanA != 1)
+        lcaA[shareOrphan] = qOrphanA[shareOrphan]
+        for sel in [isOther & (qIdxA >= 0) & (rIdxA < 0) & (rMrgA == qOrphanA) & (rMrgA != 1), isOther & (qIdxA < 0) & (rIdxA >= 0) & (qMrgA == rOrphanA) & (qMrgA != 1)]:
+            lcaA[sel] = np.where(rIdxA[sel] < 0, rMrgA[sel], qMrgA[sel])
+        sel = isOther & (qIdxA < 0) & (rIdxA < 0) & (qMrgA == rMrgA)
+        lcaA[sel] = qMrgA[sel]
+        lcaA[isMatched | isAncestor] = qA[isMatched | isAncestor]
+        lcaA[isDescendant] = rA[isDescendant]
+        #
+        lcaRawIdxA = np.where(lcaA >= 0, self.__lookupIndices(lcaA), -1)
+        lcaRankA = np.where(lcaRawIdxA >= 0, self.__rankCodes[np.maximum(lcaRawIdxA, 0)].astype(np.int16), -1)
+        qRankA = np.where(qRawIdxA >= 0, self.__rankCodes[np.maximum(qRawIdxA, 0)].astype(np.int16), -1)
+        rRankA = np.where(rRawIdxA >= 0, self.__rankCodes[np.maximum(rRawIdxA, 0)].astype(np.int16), -1)
+        #
+        isVariant = self.__rankFlags(lambda rank: rank in VARIANT_LCA_RANKS)
+        isOrthologous = self.__rankFlags(lambda rank: rank in ORTHOLOGOUS_LCA_RANKS)
+        hasSpecies = self.__rankFlags(lambda rank: "species" in rank)
+        hasSubspecies = self.__rankFlags(lambda rank: "subspecies" in rank)
+        isStrainLike = self.__rankFlags(lambda rank: rank in STRAIN_LIKE_RANKS)
+        hasNoRank = self.__rankFlags(lambda rank: "no rank" in rank)
+        isSpeciesOrStrain = self.__rankFlags(lambda rank: rank in ["species", "strain"])
+        isStrain = self.__rankFlags(lambda rank: rank in ["strain"])
+        isNoRankOrStrain = self.__rankFlags(lambda rank: rank in ["no rank", "strain"])
+        statusIndex = COMPARE_STATUS_LIST.index
+        otherStatusA = np.select(
+            [
+                isVariant[lcaRankA],
+                isOrthologous[lcaRankA],
+                hasSpecies[lcaRankA] & hasSubspecies[rRankA] & hasSubspecies[qRankA],
+                hasSpecies[lcaRankA] & isStrainLike[rRankA] & isStrainLike[qRankA],
+                hasNoRank[lcaRankA] & isSpeciesOrStrain[rRankA] & isSpeciesOrStrain[qRankA],
+                isStrain[lcaRankA] & isNoRankOrStrain[rRankA] & isNoRankOrStrain[qRankA],
+            ],
+            [
+                statusIndex("alternate variants"),
+                statusIndex("orthologous match (by lca)"),
+                statusIndex("alternate subspecies"),
+                statusIndex("alternate strain/serotype/isolate/genotype"),
+                statusIndex("orthologous match (by lca)"),
+                statusIndex("alternate strain"),
+            ],
+            default=np.where(lcaA >= 0, statusIndex("lowest common ancestor"), 0),
+        )
+        statusA = np.select(
+            [isMatched, isAncestor, isDescendant],
+            [statusIndex("matched"), statusIndex("query is ancestor"), statusIndex("query is descendant")],
+            default=otherStatusA,
+        ).astype(np.int8)
+        return statusA, lcaA, lcaRankA
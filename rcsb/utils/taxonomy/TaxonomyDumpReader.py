@@ -0,0 +1,263 @@
+##
+# File: TaxonomyDumpReader.py
+# Date: 16-Oct-2026
+#
+# Updates:
+# 16-Oct-2026 stream line aligned blocks of the dump members to the parse workers (no temporary member copies), merge partial name results in bulk
+##
+"""
+Generator-based readers for the NCBI taxonomy dump files (names.dmp, nodes.dmp and merged.dmp).
+
+Dump records are parsed row by row straight from the taxdump.tar.gz stream (or from the
+individually gzipped fallback files) into the final name, node and merged dictionaries, so
+neither extracted member files nor intermediate row lists are created.
+
+Optionally (numProc > 1), the decompressed dump stream is cut into blocks aligned to line
+boundaries that are parsed in a process pool while the stream is read.  Partial results are
+merged in block order, so the result is identical to the sequential parse.  Each parsed record
+is returned from a worker to the parent process, so this mode pays off only with several idle
+cores (see benchTaxonomyProvider.py --parse-num-proc) and sequential parsing is the default.
+
+"""
+
+import collections
+import concurrent.futures
+import contextlib
+import gzip
+import logging
+import os
+import tarfile
+
+logger = logging.getLogger(__name__)
+
+NAME_TYPES = frozenset(["scientific name", "common name", "synonym", "genbank common name", "equivalent name", "acronym", "genbank acronym"])
+
+
+class TaxonomyDumpReader(object):
+    """Stream parser for NCBI taxonomy dump data."""
+
+    def __init__(self, **kwargs):
+        """Stream parser for NCBI taxonomy dump data.
+
+        Args:
+            numProc (int, optional): number of worker processes used to parse names and nodes. Defaults to 1.
+            blockSize (int, optional): approximate size (bytes) of the dump blocks parsed by each worker task. Defaults to 4194304.
+            stats (TaxonomyStats, optional): record the parse phase timings. Defaults to None.
+        """
+        self.__numProc = kwargs.get("numProc", 1)
+        self.__blockSize = kwargs.get("blockSize", 4194304)
+        self.__stats = kwargs.get("stats", None)
+
+    def readTarDump(self, tarPath):
+        """Stream-parse names, nodes and merged taxa from a taxdump tar bundle (e.g. taxdump.tar.gz).
+
+        Args:
+            tarPath (str): path to the taxonomy dump tar bundle
+
+        Returns:
+            (dict, dict, dict): name dictionary, node dictionary, merged taxon dictionary
+        """
+        if self.__numProc > 1:
+            return self.__readParallel(self.__iterTarMembers(tarPath))
+        tD = nD = mD = {}
+        with tarfile.open(tarPath, mode="r|*") as tarF:
+            for member in tarF:
+                fn = os.path.basename(member.name)
+                if fn not in ["names.dmp", "nodes.dmp", "merged.dmp"] or not member.isfile():
+                    continue
+                with tarF.extractfile(member) as ifh:
+                    if fn == "names.dmp":
+                        with self.__phase("parseNames"):
+                            tD = self.extractNames(self.iterRows(ifh))
+                    elif fn == "nodes.dmp":
+                        with self.__phase("parseNodes"):
+                            nD = self.extractNodes(self.iterRows(ifh))
+                    else:
+                        with self.__phase("parseMerged"):
+                            mD = self.extractMerged(self.iterRows(ifh))
+        return tD, nD, mD
+
+    def readDumpFiles(self, namesPath, nodesPath, mergedPath):
+        """Stream-parse names, nodes and merged taxa from individual dump files (plain or gzipped).
+
+        Args:
+            namesPath (str): path to names.dmp[.gz]
+            nodesPath (str): path to nodes.dmp[.gz]
+            mergedPath (str): path to merged.dmp[.gz]
+
+        Returns:
+            (dict, dict, dict): name dictionary, node dictionary, merged taxon dictionary
+        """
+        if self.__numProc > 1:
+            return self.__readParallel(self.__iterFiles([("names", namesPath), ("nodes", nodesPath), ("merged", mergedPath)]))
+        with self.__phase("parseNames"), self.__open(namesPath) as ifh:
+            tD = self.extractNames(self.iterRows(ifh))
+        with self.__phase("parseNodes"), self.__open(nodesPath) as ifh:
+            nD = self.extractNodes(self.iterRows(ifh))
+        with self.__phase("parseMerged"), self.__open(mergedPath) as ifh:
+            mD = self.extractMerged(self.iterRows(ifh))
+        return tD, nD, mD
+
+    def iterRows(self, lineIterable):
+        """Generate the list of stripped tab-separated fields for each input dump line (UTF-8 bytes or text)."""
+        for line in lineIterable:
+            if isinstance(line, bytes):
+                line = line.decode("utf-8")
+            yield [field.strip() for field in line.split("\t")]
+
+    def extractNames(self, rowIt):
+        """Extract taxonomy names and synonyms from NCBI taxonomy database dump file rows."""
+        tD = {}
+        try:
+            for tV in rowIt:
+                if len(tV) < 7:
+                    continue
+                nameType = tV[6]
+                if nameType not in NAME_TYPES:
+                    continue
+                taxId = int(tV[0])
+                name = tV[2].strip("'")
+                nmD = tD.setdefault(taxId, {})
+                if nameType == "scientific name":
+                    nmD["sn"] = name
+                    continue
+                # take first common name
+                if nameType == "common name" and "alt" not in nmD:
+                    nmD["alt"] = name
+                #
+                nmD.setdefault("cn", []).append(name)
+            logger.debug("Taxonomy dictionary length %d", len(tD))
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+        return tD
+
+    def extractNodes(self, rowIt):
+        """Extract taxonomy parent relationships from NCBI taxonomy database dump rows."""
+        nD = {}
+        try:
+            for fields in rowIt:
+                if len(fields) < 5:
+                    continue
+                nD[int(fields[0])] = (int(fields[2]), fields[4])
+            logger.debug("Taxonomy parent dictionary length %d", len(nD))
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+        return nD
+
+    def extractMerged(self, rowIt):
+        """Extract merged taxonomy identifiers from NCBI taxonomy database dump rows."""
+        mD = {}
+        try:
+            for tV in rowIt:
+                if len(tV) < 3:
+                    continue
+                mD[int(tV[0])] = int(tV[2])
+            logger.debug("Taxon merged dictionary length %d", len(mD))
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+        return mD
+
+    def iterBlocks(self, ifh, blockSize=None):
+        """Generate blocks of about blockSize bytes ending on line boundaries from the input binary stream."""
+        blockSize = blockSize if blockSize else self.__blockSize
+        rest = b""
+        while True:
+            data = ifh.read(blockSize)
+            if not data:
+                break
+            data = rest + data if rest else data
+            cut = data.rfind(b"\n") + 1
+            if cut:
+                yield data[:cut]
+                rest = data[cut:]
+            else:
+                rest = data
+        if rest:
+            yield rest
+
+    def __iterTarMembers(self, tarPath):
+        """Generate (kind, binary stream) for the names, nodes and merged members of the input tar bundle."""
+        kindD = {"names.dmp": "names", "nodes.dmp": "nodes", "merged.dmp": "merged"}
+        with tarfile.open(tarPath, mode="r|*") as tarF:
+            for member in tarF:
+                fn = os.path.basename(member.name)
+                if fn in kindD and member.isfile():
+                    with tarF.extractfile(member) as ifh:
+                        yield kindD[fn], ifh
+
+    def __iterFiles(self, pathList):
+        """Generate (kind, binary stream) for the input [(kind, file path), ...] (plain or gzipped files)."""
+        for kind, filePath in pathList:
+            with self.__open(filePath) as ifh:
+                yield kind, ifh
+
+    def __readParallel(self, streamIt):
+        """Parse line aligned blocks of the input (kind, stream) dump data in a process pool as the streams are read.
+
+        Partial results are merged in block order while later blocks are read and parsed (at most
+        two blocks per process are pending).
+        """
+        resultD = {"names": {}, "nodes": {}, "merged": {}}
+        pendingQ = collections.deque()
+        numBlocks = 0
+
+        def mergeNext():
+            kind, future = pendingQ.popleft()
+            if kind == "names":
+                self.__mergeNames(resultD["names"], future.result())
+            else:
+                resultD[kind].update(future.result())
+
+        with self.__phase("parseParallel"), concurrent.futures.ProcessPoolExecutor(max_workers=self.__numProc) as executor:
+            for kind, ifh in streamIt:
+                for block in self.iterBlocks(ifh):
+                    pendingQ.append((kind, executor.submit(parseDumpBlock, (kind, block))))
+                    numBlocks += 1
+                    while len(pendingQ) > 2 * self.__numProc:
+                        mergeNext()
+            while pendingQ:
+                mergeNext()
+        logger.info("Parsed taxonomy dump data in %d blocks with %d processes", numBlocks, self.__numProc)
+        if not resultD["names"] or not resultD["nodes"]:
+            logger.error("Taxonomy dump data are missing names or nodes")
+        return resultD["names"], resultD["nodes"], resultD["merged"]
+
+    def __mergeNames(self, tD, cD):
+        """Merge a partial name dictionary from a later block preserving the sequential parse semantics."""
+        # (only taxa with names on both sides of a block boundary are merged one by one)
+        for taxId in cD.keys() & tD.keys():
+            oD = tD[taxId]
+            for ky, val in cD.pop(taxId).items():
+                if ky == "sn":
+                    oD["sn"] = val
+                elif ky == "alt":
+                    # first common name wins
+                    oD.setdefault("alt", val)
+                else:
+                    oD.setdefault("cn", []).extend(val)
+        tD.update(cD)
+
+    def __open(self, filePath):
+        return gzip.open(filePath, "rb") if filePath.endswith(".gz") else open(filePath, "rb")
+
+    def __phase(self, name):
+        return self.__stats.phase(name) if self.__stats is not None else contextlib.nullcontext()
+
+
+def parseDumpBlock(task):
+    """Process pool worker - parse a block of dump lines.
+
+    Args:
+        task (tuple): (kind, block) where kind is one of "names", "nodes" or "merged" and block is a bytes object of complete lines
+
+    Returns:
+        dict: partial name, node or merged taxon dictionary
+    """
+    kind, block = task
+    tdR = TaxonomyDumpReader()
+    rowIt = tdR.iterRows(block.split(b"\n"))
+    if kind == "names":
+        return tdR.extractNames(rowIt)
+    elif kind == "nodes":
+        return tdR.extractNodes(rowIt)
+    return tdR.extractMerged(rowIt)
@@ -0,0 +1,237 @@
+##
+# File: TaxonomyFetcher.py
+# Date: 16-Oct-2026
+#
+# Updates:
+# 16-Oct-2026 fetch other (e.g. ftp) sources with FileUtil, treat only bare paths and file:// urls as local sources
+##
+"""
+Conditional, resumable and checksum verified fetching of NCBI taxonomy source files.
+
+HTTP(S) sources are requested with the validators (ETag/Last-Modified) and the MD5 digest
+recorded for the previous download, so an unchanged source is detected without transferring
+it again.  Downloads are written to a <file>.part file which is resumed with a range request
+after an interruption, and the completed file is checked against the published MD5 digest
+(e.g. taxdump.tar.gz.md5) before it replaces the target file.  Local sources (file paths and
+file:// urls) are copied and compared by their MD5 digest.  Sources with other schemes (e.g. ftp)
+are fetched with FileUtil, without conditional or resumable requests.
+
+The per-source state is kept in a small JSON file (e.g. taxonomy_source.json):
+
+    {<url>: {"etag": ..., "lastModified": ..., "md5": ..., "partial": {"etag": ..., "lastModified": ...}}, ...}
+
+"""
+
+import concurrent.futures
+import hashlib
+import logging
+import os
+import threading
+
+import requests
+
+from rcsb.utils.io.FileUtil import FileUtil
+from rcsb.utils.io.MarshalUtil import MarshalUtil
+
+logger = logging.getLogger(__name__)
+
+FETCH_STATUS_FETCHED = "fetched"
+FETCH_STATUS_UNCHANGED = "unchanged"
+FETCH_STATUS_FAILED = "failed"
+
+
+class TaxonomyFetcher(object):
+    """Conditional, concurrent and resumable fetching of taxonomy source files."""
+
+    def __init__(self, **kwargs):
+        """Conditional, concurrent and resumable fetching of taxonomy source files.
+
+        Args:
+            statePath (str, optional): JSON file recording the validators and digests of fetched sources. Defaults to None (no state).
+            timeout (int, optional): HTTP request timeout (seconds). Defaults to 60.
+            maxAttempts (int, optional): number of attempts for each download (later attempts resume the partial file). Defaults to 3.
+            chunkSize (int, optional): download chunk size (bytes). Defaults to 1048576.
+            numThreads (int, optional): number of concurrent downloads in fetchAll(). Defaults to 3.
+        """
+        self.__statePath = kwargs.get("statePath", None)
+        self.__timeout = kwargs.get("timeout", 60)
+        self.__maxAttempts = kwargs.get("maxAttempts", 3)
+        self.__chunkSize = kwargs.get("chunkSize", 1048576)
+        self.__numThreads = kwargs.get("numThreads", 3)
+        self.__mU = MarshalUtil()
+        self.__lock = threading.Lock()
+
+    def fetch(self, url, filePath, md5Url=None, conditional=False):
+        """Fetch the source url to the local file path.
+
+        Args:
+            url (str): source locator (http(s), file or other (e.g. ftp) url or local file path)
+            filePath (str): local target file path
+            md5Url (str, optional): locator of the published MD5 digest of the source. Defaults to None.
+            conditional (bool, optional): skip the download if the source is unchanged since the previous fetch. Defaults to False.
+
+        Returns:
+            str: FETCH_STATUS_FETCHED, FETCH_STATUS_UNCHANGED or FETCH_STATUS_FAILED
+        """
+        try:
+            md5 = self.getPublishedMd5(md5Url) if md5Url else None
+            if not self.__isHttp(url) and not FileUtil().isLocal(url):
+                return self.__fetchOther(url, filePath, md5)
+            stateD = self.__getState(url)
+            if conditional and md5 and stateD.get("md5") == md5:
+                logger.info("Source %s is unchanged (md5 %s)", url, md5)
+                return FETCH_STATUS_UNCHANGED
+            if self.__isHttp(url):
+                return self.__fetchHttp(url, filePath, md5, stateD if conditional else {})
+            return self.__fetchLocal(url, filePath, md5, stateD if conditional else {})
+        except Exception as e:
+            logger.exception("Failing fetching %r with %s", url, str(e))
+        return FETCH_STATUS_FAILED
+
+    def fetchAll(self, taskList, conditional=False):
+        """Fetch several sources concurrently.
+
+        Args:
+            taskList (list): [(url, filePath, md5Url), ...] (md5Url may be None)
+            conditional (bool, optional): skip the download of unchanged sources. Defaults to False.
+
+        Returns:
+            list: fetch status for each task in input order
+        """
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, min(self.__numThreads, len(taskList)))) as executor:
+            futL = [executor.submit(self.fetch, url, filePath, md5Url, conditional) for url, filePath, md5Url in taskList]
+            return [fut.result() for fut in futL]
+
+    def getPublishedMd5(self, md5Url):
+        """Return the MD5 digest from a published checksum file (e.g. "<md5>  taxdump.tar.gz") or None."""
+        try:
+            if self.__isHttp(md5Url):
+                response = requests.get(md5Url, timeout=self.__timeout)
+                if response.status_code != 200:
+                    logger.warning("Checksum %s not available (status %r)", md5Url, response.status_code)
+                    return None
+                text = response.text
+            elif FileUtil().isLocal(md5Url):
+                with open(FileUtil().getFilePath(md5Url), "r", encoding="utf-8") as ifh:
+                    text = ifh.read()
+            else:
+                logger.warning("Checksum %s not read (unsupported scheme)", md5Url)
+                return None
+            md5 = text.split()[0].lower() if text.split() else None
+            return md5 if md5 and len(md5) == 32 else None
+        except Exception as e:
+            logger.warning("Failing reading checksum %r with %s", md5Url, str(e))
+        return None
+
+    def hash(self, filePath):
+        """Return the MD5 digest of the input file."""
+        hObj = hashlib.md5()
+        with open(filePath, "rb") as ifh:
+            for chunk in iter(lambda: ifh.read(self.__chunkSize), b""):
+                hObj.update(chunk)
+        return hObj.hexdigest()
+
+    def __fetchLocal(self, url, filePath, md5, stateD):
+        srcMd5 = self.hash(FileUtil().getFilePath(url))
+        if stateD.get("md5") == srcMd5 and (not md5 or md5 == srcMd5):
+            logger.info("Source %s is unchanged (md5 %s)", url, srcMd5)
+            return FETCH_STATUS_UNCHANGED
+        if md5 and md5 != srcMd5:
+            logger.error("Checksum mismatch for %s (%s != %s)", url, srcMd5, md5)
+            return FETCH_STATUS_FAILED
+        if not FileUtil().get(url, filePath):
+            return FETCH_STATUS_FAILED
+        self.__setState(url, {"md5": srcMd5})
+        return FETCH_STATUS_FETCHED
+
+    def __fetchOther(self, url, filePath, md5):
+        """Fetch a source with another scheme (e.g. ftp) with FileUtil (no conditional or resumable requests)."""
+        partPath = filePath + ".part"
+        if not FileUtil().get(url, partPath):
+            if os.path.exists(partPath):
+                os.remove(partPath)
+            return FETCH_STATUS_FAILED
+        fileMd5 = self.hash(partPath)
+        if md5 and fileMd5 != md5:
+            logger.error("Checksum mismatch for %s (%s != %s)", url, fileMd5, md5)
+            os.remove(partPath)
+            return FETCH_STATUS_FAILED
+        os.replace(partPath, filePath)
+        return FETCH_STATUS_FETCHED
+
+    def __fetchHttp(self, url, filePath, md5, stateD):
+        partPath = filePath + ".part"
+        for attempt in range(1, self.__maxAttempts + 1):
+            try:
+                status, validatorD = self.__download(url, partPath, stateD)
+                if status == FETCH_STATUS_UNCHANGED:
+                    logger.info("Source %s is unchanged (not modified)", url)
+                    return status
+                fileMd5 = self.hash(partPath)
+                if md5 and fileMd5 != md5:
+                    logger.error("Checksum mismatch for %s (%s != %s)", url, fileMd5, md5)
+                    os.remove(partPath)
+                    self.__setState(url, {"partial": None})
+                    return FETCH_STATUS_FAILED
+                os.replace(partPath, filePath)
+                self.__setState(url, dict(validatorD, md5=fileMd5, partial=None))
+                return FETCH_STATUS_FETCHED
+            except requests.exceptions.RequestException as e:
+                logger.warning("Download attempt %d of %s failed with %s", attempt, url, str(e))
+        return FETCH_STATUS_FAILED
+
+    def __download(self, url, partPath, stateD):
+        """Download (or resume downloading) url to partPath and return the status and the response validators."""
+        headerD = {}
+        if stateD.get("etag"):
+            headerD["If-None-Match"] = stateD["etag"]
+        if stateD.get("lastModified"):
+            headerD["If-Modified-Since"] = stateD["lastModified"]
+        offset = os.path.getsize(partPath) if os.path.exists(partPath) else 0
+        partialD = self.__getState(url).get("partial") or {}
+        validator = partialD.get("etag") or partialD.get("lastModified")
+        if offset and validator:
+            # resume only if the source still matches the partial download
+            headerD["Range"] = "bytes=%d-" % offset
+            headerD["If-Range"] = validator
+        with requests.get(url, headers=headerD, stream=True, allow_redirects=True, timeout=self.__timeout) as response:
+            if response.status_code == 304:
+                return FETCH_STATUS_UNCHANGED, {}
+            if response.status_code == 416:
+                # stale or complete partial file - restart
+                os.remove(partPath)
+                self.__setState(url, {"partial": None})
+                return self.__download(url, partPath, stateD)
+            response.raise_for_status()
+            isResume = response.status_code == 206
+            validatorD = {"etag": response.headers.get("ETag"), "lastModified": response.headers.get("Last-Modified")}
+            self.__setState(url, {"partial": validatorD})
+            logger.info("Downloading %s (%s)", url, "resuming at byte %d" % offset if isResume else "full")
+            with open(partPath, "ab" if isResume else "wb") as ofh:
+                for chunk in response.iter_content(chunk_size=self.__chunkSize):
+                    ofh.write(chunk)
+        return FETCH_STATUS_FETCHED, validatorD
+
+    def __isHttp(self, url):
+        return url.lower().startswith(("http://", "https://"))
+
+    def __getState(self, url):
+        if not self.__statePath or not os.path.exists(self.__statePath):
+            return {}
+        with self.__lock:
+            sD = self.__mU.doImport(self.__statePath, fmt="json") or {}
+        return sD.get(url, {})
+
+    def __setState(self, url, updateD):
+        if not self.__statePath:
+            return
+        with self.__lock:
+            sD = self.__mU.doImport(self.__statePath, fmt="json") if os.path.exists(self.__statePath) else {}
+            sD = sD or {}
+            uD = sD.setdefault(url, {})
+            for ky, val in updateD.items():
+                if val is None:
+                    uD.pop(ky, None)
+                else:
+                    uD[ky] = val
+            self.__mU.doExport(self.__statePath, sD, fmt="json", indent=1)
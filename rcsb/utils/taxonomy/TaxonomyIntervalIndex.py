@@ -0,0 +1,162 @@
+##
+# File: TaxonomyIntervalIndex.py
+# Date: 16-Oct-2026
+#
+# Updates:
+# 16-Oct-2026 build the preorder intervals and subtree counts in vectorized NumPy passes over the breadth-first levels
+##
+"""
+DFS interval (nested set) index over the dense node indices of a TaxonomyNodeStore.
+
+Nodes are numbered in depth-first preorder (children in node store order).  The subtree of a
+node then occupies the contiguous preorder range [pre[idx], pre[idx] + size[idx]), so the
+ancestor test is two integer comparisons:
+
+    pre[idx]           preorder position of node idx (-1 if unreachable from a root)
+    size[idx]          number of nodes in the subtree of idx (including idx)
+    order[pos]         node index at preorder position pos
+    leafCount[idx]     number of leaf nodes in the subtree of idx
+    speciesCount[idx]  number of species rank nodes in the subtree of idx
+
+The descendants of a node are the contiguous slice order[pre[idx]:pre[idx] + size[idx]].
+
+The index is built once from the node store (subtree counts bottom-up and preorder positions
+top-down in vectorized passes over its breadth-first levels) and may be written to (and
+memory-mapped from) a single array file (see ArrayFileUtil).
+
+"""
+
+import array
+import logging
+
+import numpy as np
+
+from rcsb.utils.taxonomy.ArrayFileUtil import ArrayFileUtil
+
+logger = logging.getLogger(__name__)
+
+INTERVAL_INDEX_VERSION = 2
+
+
+class TaxonomyIntervalIndex(object):
+    """Preorder interval index for constant time ancestor tests on the taxonomy tree."""
+
+    def __init__(self, filePath=None, nodeStore=None, buffer=None):
+        """Open an interval index file (memory-mapped) or buffer, or build the index from a node store.
+
+        Args:
+            filePath (str, optional): interval index file path. Defaults to None.
+            nodeStore (TaxonomyNodeStore, optional): node store. Defaults to None.
+            buffer (object, optional): buffer containing interval index data. Defaults to None.
+        """
+        if filePath or buffer is not None:
+            attributeD, sD = ArrayFileUtil().read(filePath) if filePath else ArrayFileUtil().fromBuffer(buffer)
+            if attributeD.get("version") != INTERVAL_INDEX_VERSION:
+                raise ValueError("Unsupported taxonomy interval index version %r" % attributeD.get("version"))
+        else:
+            sD = self.__build(nodeStore)
+        self.__sectionD = sD
+        self.__pre = sD["pre"]
+        self.__size = sD["size"]
+        self.__order = sD["order"]
+        self.__leafCount = sD["leafCount"]
+        self.__speciesCount = sD["speciesCount"]
+
+    def __build(self, nodeStore):
+        numNodes = len(nodeStore)
+        rootA = nodeStore.rootIndices()
+        levelL = nodeStore.bfsLevels(rootA) if numNodes else []
+        parentIndexA = np.frombuffer(nodeStore.section("parentIndex"), dtype=np.int32)
+        childStartA = np.frombuffer(nodeStore.section("childStart"), dtype=np.int32)
+        childIndexA = np.frombuffer(nodeStore.section("childIndex"), dtype=np.int32)
+        rankList = nodeStore.getRankList()
+        speciesCode = rankList.index("species") if "species" in rankList else -1
+        #
+        # subtree sizes and counts accumulated bottom-up one breadth-first level at a time
+        sizeA = np.ones(numNodes, dtype=np.int32)
+        speciesCountA = (np.frombuffer(nodeStore.section("rank"), dtype=np.uint8) == speciesCode).astype(np.int32)
+        for levelA in reversed(levelL[1:]):
+            np.add.at(sizeA, parentIndexA[levelA], sizeA[levelA])
+            np.add.at(speciesCountA, parentIndexA[levelA], speciesCountA[levelA])
+        leafCountA = (sizeA == 1).astype(np.int32)
+        for levelA in reversed(levelL[1:]):
+            np.add.at(leafCountA, parentIndexA[levelA], leafCountA[levelA])
+        #
+        # preorder positions assigned top-down - a child follows its parent and the subtrees of its preceding siblings
+        childSizeA = np.where(childIndexA == parentIndexA[childIndexA], 0, sizeA[childIndexA]).astype(np.int64)
+        sizeSumA = np.concatenate(([0], np.cumsum(childSizeA)))
+        siblingOffsetA = np.empty(numNodes, dtype=np.int64)
+        siblingOffsetA[childIndexA] = sizeSumA[:-1] - sizeSumA[childStartA[parentIndexA[childIndexA]]]
+        preA = np.full(numNodes, -1, dtype=np.int32)
+        if levelL:
+            preA[rootA] = np.cumsum(sizeA[rootA]) - sizeA[rootA]
+        for levelA in levelL[1:]:
+            preA[levelA] = preA[parentIndexA[levelA]] + 1 + siblingOffsetA[levelA]
+        reachedA = np.flatnonzero(preA >= 0)
+        orderA = np.empty(len(reachedA), dtype=np.int32)
+        orderA[preA[reachedA]] = reachedA
+        # (nodes unreachable from a root are excluded from the counts)
+        leafCountA[preA < 0] = 0
+        speciesCountA[preA < 0] = 0
+        if len(orderA) < numNodes:
+            logger.warning("Taxonomy interval index skips %d nodes unreachable from a root", numNodes - len(orderA))
+        logger.debug("Built taxonomy interval index with %d nodes %d roots", len(orderA), len(rootA))
+        return {
+            "pre": array.array("i", preA.tobytes()),
+            "size": array.array("i", sizeA.tobytes()),
+            "order": array.array("i", orderA.tobytes()),
+            "leafCount": array.array("i", leafCountA.tobytes()),
+            "speciesCount": array.array("i", speciesCountA.tobytes()),
+        }
+
+    def write(self, filePath):
+        """Write the interval index to a memory-mappable array file.
+
+        Args:
+            filePath (str): output file path
+
+        Returns:
+            bool: True for success or False otherwise
+        """
+        return ArrayFileUtil().write(filePath, self.__sectionD, {"version": INTERVAL_INDEX_VERSION})
+
+    def close(self):
+        """Release array views over a memory-mapped index (the index is unusable afterwards)."""
+        for arr in self.__sectionD.values():
+            if isinstance(arr, memoryview):
+                arr.release()
+        self.__sectionD = {}
+
+    def memoryUsage(self):
+        """Return the size and backing of the index arrays (see ArrayFileUtil.memoryUsage())."""
+        return ArrayFileUtil().memoryUsage(self.__sectionD)
+
+    def __len__(self):
+        return len(self.__pre)
+
+    def section(self, name):
+        """Return the named array section (array.array or memoryview) for use in bulk (e.g. NumPy) operations."""
+        return self.__sectionD[name]
+
+    def isDescendant(self, idx, ancestorIdx):
+        """Return True if node idx is in the subtree of node ancestorIdx (including ancestorIdx itself)."""
+        pos = self.__pre[idx]
+        start = self.__pre[ancestorIdx]
+        return start >= 0 and start <= pos < start + self.__size[ancestorIdx]
+
+    def preorder(self, idx):
+        return self.__pre[idx]
+
+    def subtreeSize(self, idx):
+        return self.__size[idx]
+
+    def leafCount(self, idx):
+        return self.__leafCount[idx]
+
+    def speciesCount(self, idx):
+        return self.__speciesCount[idx]
+
+    def subtreeIndices(self, idx):
+        """Return the node indices in the subtree of idx (in preorder, starting with idx)."""
+        start = self.__pre[idx]
+        return self.__order[start : start + self.__size[idx]] if start >= 0 else self.__order[0:0]
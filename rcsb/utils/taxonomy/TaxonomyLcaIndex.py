@@ -0,0 +1,141 @@
+##
+# File: TaxonomyLcaIndex.py
+# Date: 16-Oct-2026
+#
+# Updates:
+# 16-Oct-2026 build the depth and binary lifting tables in vectorized NumPy passes (breadth-first levels and up[up] gathers)
+##
+"""
+Lowest common ancestor (LCA) index over the dense node indices of a TaxonomyNodeStore.
+
+The index stores the depth of each node and binary lifting (jump pointer) tables, where
+up<k>[idx] is the ancestor 2**k levels above node idx (a root is its own ancestor).  An LCA
+query lifts the deeper node to the depth of the other and then lifts both nodes together in
+O(log(depth)) steps.  The tables are built once from the node store (in vectorized passes over
+its breadth-first levels) and may be written to (and memory-mapped from) a single array file
+(see ArrayFileUtil).
+
+"""
+
+import array
+import logging
+
+import numpy as np
+
+from rcsb.utils.taxonomy.ArrayFileUtil import ArrayFileUtil
+
+logger = logging.getLogger(__name__)
+
+LCA_INDEX_VERSION = 1
+
+
+class TaxonomyLcaIndex(object):
+    """Binary lifting lowest common ancestor index for the taxonomy tree."""
+
+    def __init__(self, filePath=None, nodeStore=None, buffer=None):
+        """Open an LCA index file (memory-mapped) or buffer, or build the index from a node store.
+
+        Args:
+            filePath (str, optional): LCA index file path. Defaults to None.
+            nodeStore (TaxonomyNodeStore, optional): node store. Defaults to None.
+            buffer (object, optional): buffer containing LCA index data. Defaults to None.
+        """
+        if filePath or buffer is not None:
+            attributeD, sD = ArrayFileUtil().read(filePath) if filePath else ArrayFileUtil().fromBuffer(buffer)
+            if attributeD.get("version") != LCA_INDEX_VERSION:
+                raise ValueError("Unsupported taxonomy LCA index version %r" % attributeD.get("version"))
+        else:
+            sD = self.__build(nodeStore)
+        self.__sectionD = sD
+        self.__depth = sD["depth"]
+        self.__upL = [sD["up%d" % kk] for kk in range(len(sD) - 1)]
+
+    def __build(self, nodeStore):
+        numNodes = len(nodeStore)
+        # breadth-first levels from each root (self-parented or with a parent missing from the node table)
+        levelL = nodeStore.bfsLevels(nodeStore.rootIndices()) if numNodes else []
+        depthA = np.full(numNodes, -1, dtype=np.int32)
+        for dp, levelA in enumerate(levelL):
+            depthA[levelA] = dp
+        maxDepth = max(0, len(levelL) - 1)
+        if (depthA < 0).any():
+            logger.warning("Taxonomy LCA index skips %d nodes unreachable from a root", int((depthA < 0).sum()))
+        # roots (and unreachable nodes) are their own ancestor
+        upA = np.where(depthA > 0, np.frombuffer(nodeStore.section("parentIndex"), dtype=np.int32), np.arange(numNodes, dtype=np.int32))
+        sD = {"depth": array.array("i", depthA.tobytes()), "up0": array.array("i", upA.tobytes())}
+        for kk in range(1, max(1, maxDepth.bit_length())):
+            upA = upA[upA]
+            sD["up%d" % kk] = array.array("i", upA.tobytes())
+        logger.debug("Built taxonomy LCA index with %d nodes maximum depth %d (%d levels)", numNodes, maxDepth, len(sD) - 1)
+        return sD
+
+    def write(self, filePath):
+        """Write the LCA index to a memory-mappable array file.
+
+        Args:
+            filePath (str): output file path
+
+        Returns:
+            bool: True for success or False otherwise
+        """
+        return ArrayFileUtil().write(filePath, self.__sectionD, {"version": LCA_INDEX_VERSION})
+
+    def close(self):
+        """Release array views over a memory-mapped index (the index is unusable afterwards)."""
+        for arr in self.__sectionD.values():
+            if isinstance(arr, memoryview):
+                arr.release()
+        self.__sectionD = {}
+
+    def memoryUsage(self):
+        """Return the size and backing of the index arrays (see ArrayFileUtil.memoryUsage())."""
+        return ArrayFileUtil().memoryUsage(self.__sectionD)
+
+    def __len__(self):
+        return len(self.__depth)
+
+    def section(self, name):
+        """Return the named array section (array.array or memoryview) for use in bulk (e.g. NumPy) operations."""
+        return self.__sectionD[name]
+
+    def levels(self):
+        """Return the number of binary lifting levels (sections up0 ... up<levels - 1>)."""
+        return len(self.__upL)
+
+    def depth(self, idx):
+        """Return the depth of node idx below its root (root depth is 0, -1 if unreachable)."""
+        return self.__depth[idx]
+
+    def ancestor(self, idx, depth):
+        """Return the ancestor of node idx at the input depth (or -1 if depth exceeds the depth of idx)."""
+        delta = self.__depth[idx] - depth
+        if delta < 0 or depth < 0:
+            return -1
+        kk = 0
+        while delta:
+            if delta & 1:
+                idx = self.__upL[kk][idx]
+            delta >>= 1
+            kk += 1
+        return idx
+
+    def lca(self, idx1, idx2):
+        """Return the dense index of the lowest common ancestor of nodes idx1 and idx2 or -1 (no common root)."""
+        depth = self.__depth
+        if depth[idx1] < 0 or depth[idx2] < 0:
+            return -1
+        if depth[idx1] < depth[idx2]:
+            idx1, idx2 = idx2, idx1
+        idx1 = self.ancestor(idx1, depth[idx2])
+        if idx1 == idx2:
+            return idx1
+        for up in reversed(self.__upL):
+            if up[idx1] != up[idx2]:
+                idx1 = up[idx1]
+                idx2 = up[idx2]
+        up0 = self.__upL[0]
+        return up0[idx1] if up0[idx1] == up0[idx2] else -1
+
+    def lcaList(self, idxPairList):
+        """Return the list of lowest common ancestor indices (or -1) for the input list of node index pairs."""
+        return [self.lca(idx1, idx2) for idx1, idx2 in idxPairList]
@@ -0,0 +1,88 @@
+##
+# File: TaxonomyLruCache.py
+# Date: 16-Oct-2026
+#
+# Updates:
+##
+"""
+Bounded least recently used (LRU) memo for taxonomy query results with hit/miss/eviction counters.
+
+"""
+
+import collections
+import itertools
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class TaxonomyLruCache(object):
+    """Bounded LRU memo (results should be immutable as they are shared by all callers)."""
+
+    def __init__(self, maxSize=65536):
+        """Bounded LRU memo.
+
+        Args:
+            maxSize (int, optional): maximum number of memoized results. Defaults to 65536.
+        """
+        self.__maxSize = max(1, int(maxSize))
+        self.__cacheD = collections.OrderedDict()
+        self.__lock = threading.Lock()
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+
+    def getOrCompute(self, key, func, *args):
+        """Return the memoized result for key or compute, memoize and return func(*args).
+
+        Args:
+            key (object): hashable memo key
+            func (callable): function computing the result on a miss
+            *args: arguments passed to func
+
+        Returns:
+            object: memoized or computed result
+        """
+        try:
+            with self.__lock:
+                val = self.__cacheD[key]
+                self.__cacheD.move_to_end(key)
+                self.__hits += 1
+            return val
+        except KeyError:
+            pass
+        except TypeError:
+            # unhashable key - not memoized
+            return func(*args)
+        val = func(*args)
+        with self.__lock:
+            self.__misses += 1
+            self.__cacheD[key] = val
+            self.__cacheD.move_to_end(key)
+            while len(self.__cacheD) > self.__maxSize:
+                self.__cacheD.popitem(last=False)
+                self.__evictions += 1
+        return val
+
+    def clear(self):
+        """Remove all memoized results (the counters are retained)."""
+        with self.__lock:
+            self.__cacheD.clear()
+
+    def getStats(self):
+        """Return the memo counters.
+
+        Returns:
+            dict: {"hits": ..., "misses": ..., "evictions": ..., "size": ..., "maxSize": ...}
+        """
+        with self.__lock:
+            return {"hits": self.__hits, "misses": self.__misses, "evictions": self.__evictions, "size": len(self.__cacheD), "maxSize": self.__maxSize}
+
+    def sample(self, num):
+        """Return up to num memoized (key, result) pairs (most recently used last)."""
+        with self.__lock:
+            return list(itertools.islice(reversed(self.__cacheD.items()), num))[::-1]
+
+    def __len__(self):
+        return len(self.__cacheD)
@@ -0,0 +1,179 @@
+##
+# File: TaxonomyNameIndex.py
+# Date: 16-Oct-2026
+#
+# Updates:
+##
+"""
+Sorted organism name to taxonomy identifier index built from a TaxonomyNameStore.
+
+The normalized (stripped and upper case) scientific, alternate and common names are stored
+once in a UTF-8 key pool sorted in byte order, so lookups are binary searches over the
+(memory-mapped) pool.  Each key holds the range of taxonomy identifiers that carry the name:
+
+    keyPool/keyOffset[k]       normalized name k
+    taxStart[k]/taxIdList      taxonomy identifiers of name k (the preferred identifier first)
+
+The preferred identifier of a name shared by several taxa is the last taxon (in name store
+order) carrying the name, as in the name map formerly built on first use by TaxonomyProvider.
+
+"""
+
+import array
+import logging
+
+from rcsb.utils.taxonomy.ArrayFileUtil import ArrayFileUtil
+
+logger = logging.getLogger(__name__)
+
+NAME_INDEX_VERSION = 1
+
+
+class TaxonomyNameIndex(object):
+    """Binary search index of normalized organism names."""
+
+    def __init__(self, filePath=None, nameStore=None, buffer=None):
+        """Open a name index file (memory-mapped) or buffer, or build the index from a name store.
+
+        Args:
+            filePath (str, optional): name index file path. Defaults to None.
+            nameStore (TaxonomyNameStore, optional): name store. Defaults to None.
+            buffer (object, optional): buffer containing name index data. Defaults to None.
+        """
+        if filePath or buffer is not None:
+            attributeD, sD = ArrayFileUtil().read(filePath) if filePath else ArrayFileUtil().fromBuffer(buffer)
+            if attributeD.get("version") != NAME_INDEX_VERSION:
+                raise ValueError("Unsupported taxonomy name index version %r" % attributeD.get("version"))
+        else:
+            sD = self.__build(nameStore)
+        self.__sectionD = sD
+        self.__pool = sD["keyPool"]
+        self.__keyOffsets = sD["keyOffset"]
+        self.__taxStart = sD["taxStart"]
+        self.__taxIds = sD["taxIdList"]
+
+    @staticmethod
+    def normalize(name):
+        """Return the normalized lookup key for the input name."""
+        return name.strip().upper()
+
+    def __build(self, nameStore):
+        keyD = {}
+
+        def addName(name, taxId):
+            tL = keyD.setdefault(self.normalize(name).encode("utf-8"), [])
+            # (the names of a taxon are added consecutively)
+            if not tL or tL[-1] != taxId:
+                tL.append(taxId)
+
+        for idx in range(len(nameStore) if nameStore is not None else 0):
+            taxId = nameStore.taxId(idx)
+            # common names are indexed only for taxa with both scientific and alternate names
+            sn = nameStore.scientificName(idx)
+            if sn is None:
+                continue
+            addName(sn, taxId)
+            alt = nameStore.alternateName(idx)
+            if alt is None:
+                continue
+            addName(alt, taxId)
+            for cn in nameStore.sortedCommonNames(idx):
+                addName(cn, taxId)
+        #
+        pool = bytearray()
+        keyOffsets = array.array("q", [0])
+        taxStart = array.array("i", [0])
+        taxIds = array.array("i")
+        for key in sorted(keyD):
+            pool.extend(key)
+            keyOffsets.append(len(pool))
+            tL = keyD[key]
+            taxIds.append(tL[-1])
+            taxIds.extend(tL[:-1])
+            taxStart.append(len(taxIds))
+        logger.debug("Built taxonomy name index with %d names (%d bytes)", len(keyD), len(pool))
+        return {"keyPool": bytes(pool), "keyOffset": keyOffsets, "taxStart": taxStart, "taxIdList": taxIds}
+
+    def write(self, filePath):
+        """Write the name index to a memory-mappable array file.
+
+        Args:
+            filePath (str): output file path
+
+        Returns:
+            bool: True for success or False otherwise
+        """
+        return ArrayFileUtil().write(filePath, self.__sectionD, {"version": NAME_INDEX_VERSION})
+
+    def close(self):
+        """Release array views over a memory-mapped index (the index is unusable afterwards)."""
+        for arr in self.__sectionD.values():
+            if isinstance(arr, memoryview):
+                arr.release()
+        self.__sectionD = {}
+
+    def memoryUsage(self):
+        """Return the size and backing of the index arrays (see ArrayFileUtil.memoryUsage())."""
+        return ArrayFileUtil().memoryUsage(self.__sectionD)
+
+    def __len__(self):
+        return len(self.__keyOffsets) - 1 if self.__sectionD else 0
+
+    def section(self, name):
+        """Return the named index section (array.array, bytes or memoryview) for use in bulk (e.g. NumPy) operations."""
+        return self.__sectionD[name]
+
+    def key(self, kk):
+        """Return the normalized name at key index kk."""
+        return str(self.__pool[self.__keyOffsets[kk] : self.__keyOffsets[kk + 1]], "utf-8")
+
+    def find(self, name):
+        """Return the key index of the input name (normalized) or -1."""
+        try:
+            target = self.normalize(name).encode("utf-8")
+        except Exception:
+            return -1
+        return self.findKey(target)
+
+    def findKey(self, target):
+        """Return the key index of the input normalized name (UTF-8 bytes) or -1."""
+        lo, hi = 0, len(self)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if bytes(self.__pool[self.__keyOffsets[mid] : self.__keyOffsets[mid + 1]]) < target:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < len(self) and bytes(self.__pool[self.__keyOffsets[lo] : self.__keyOffsets[lo + 1]]) == target:
+            return lo
+        return -1
+
+    def taxId(self, name):
+        """Return the preferred taxonomy identifier for the input name or None."""
+        kk = self.find(name)
+        return self.__taxIds[self.__taxStart[kk]] if kk >= 0 else None
+
+    def taxIds(self, name):
+        """Return all taxonomy identifiers carrying the input name (the preferred identifier first)."""
+        kk = self.find(name)
+        return list(self.__taxIds[self.__taxStart[kk] : self.__taxStart[kk + 1]]) if kk >= 0 else []
+
+    def isAmbiguous(self, name):
+        """Return True if the input name is carried by more than one taxon."""
+        kk = self.find(name)
+        return kk >= 0 and self.__taxStart[kk + 1] - self.__taxStart[kk] > 1
+
+    def resolveKeys(self, keyList):
+        """Resolve normalized names (UTF-8 bytes).
+
+        Args:
+            keyList (list): normalized names (UTF-8 bytes)
+
+        Returns:
+            list: [(preferred taxonomy identifier or None, number of taxa carrying the name), ...] in input order
+        """
+        rL = []
+        for key in keyList:
+            kk = self.findKey(key)
+            rL.append((self.__taxIds[self.__taxStart[kk]], self.__taxStart[kk + 1] - self.__taxStart[kk]) if kk >= 0 else (None, 0))
+        return rL
@@ -0,0 +1,237 @@
+##
+# File: TaxonomyNameMatcher.py
+# Date: 16-Oct-2026
+#
+# Updates:
+# 16-Oct-2026 build the name keys from the TaxonomyNameStore with every common name (not the exact name index keys)
+##
+"""
+Approximate organism name matching with a trigram inverted index over the names of a TaxonomyNameStore.
+
+Every scientific, alternate and common name of each taxon is a key (unlike the exact TaxonomyNameIndex,
+which indexes common names only for taxa with an alternate name).
+
+Names are compared in a match form (the normalized name with ASCII punctuation replaced by blanks) and
+each name contributes the trigrams of its blank padded match form.  The index holds:
+
+    keyPool/keyOffset[k]        normalized name k (see TaxonomyNameIndex.normalize()) in byte order
+    keyTaxId[k]                 preferred taxonomy identifier of name k (the last taxon carrying the name)
+    gram[g]                     sorted trigram codes (three bytes packed in an unsigned integer)
+    gramStart[g]/posting        sorted indices of the names containing trigram g
+
+A query counts the shared trigrams of each name over the query trigram postings, keeps the names passing the
+q-gram count filter (a name within edit distance k of the query shares all but at most 3k of the query trigrams),
+ranks them by trigram overlap and scores the best by edit distance:  score = 1 - distance / max(length).
+
+"""
+
+import array
+import logging
+
+import numpy as np
+
+from rcsb.utils.taxonomy.ArrayFileUtil import ArrayFileUtil
+from rcsb.utils.taxonomy.TaxonomyNameIndex import TaxonomyNameIndex
+
+logger = logging.getLogger(__name__)
+
+NAME_MATCHER_VERSION = 2
+# ASCII characters other than letters and digits are blanked in the match form of a name
+_MATCH_TABLE = bytes(ch if (48 <= ch <= 57 or 65 <= ch <= 90 or ch >= 128) else 32 for ch in range(256))
+
+
+class TaxonomyNameMatcher(object):
+    """Trigram index for approximate (edit distance) organism name matching."""
+
+    def __init__(self, filePath=None, nameStore=None, buffer=None):
+        """Open a name matcher file (memory-mapped) or buffer, or build the matcher from a name store.
+
+        Args:
+            filePath (str, optional): name matcher file path. Defaults to None.
+            nameStore (TaxonomyNameStore, optional): name store. Defaults to None.
+            buffer (object, optional): buffer containing name matcher data. Defaults to None.
+        """
+        if filePath or buffer is not None:
+            attributeD, sD = ArrayFileUtil().read(filePath) if filePath else ArrayFileUtil().fromBuffer(buffer)
+            if attributeD.get("version") != NAME_MATCHER_VERSION:
+                raise ValueError("Unsupported taxonomy name matcher version %r" % attributeD.get("version"))
+        else:
+            sD = self.__build(nameStore)
+        self.__sectionD = sD
+        self.__pool = sD["keyPool"]
+        self.__keyOffsets = sD["keyOffset"]
+        self.__keyTaxIds = sD["keyTaxId"]
+        self.__offsetA = np.frombuffer(sD["keyOffset"], dtype=np.int64)
+        self.__lengthA = np.diff(self.__offsetA)
+        self.__gramA = np.frombuffer(sD["gram"], dtype=np.uint32)
+        self.__gramStartA = np.frombuffer(sD["gramStart"], dtype=np.int64)
+        self.__postingA = np.frombuffer(sD["posting"], dtype=np.int32)
+
+    @staticmethod
+    def matchForm(name):
+        """Return the match form (UTF-8 bytes) of the input name."""
+        return name.strip().upper().encode("utf-8").translate(_MATCH_TABLE)
+
+    def __build(self, nameStore):
+        keyD = {}
+        for idx in range(len(nameStore) if nameStore is not None else 0):
+            taxId = nameStore.taxId(idx)
+            for name in [nameStore.scientificName(idx), nameStore.alternateName(idx)] + nameStore.sortedCommonNames(idx):
+                if name is not None:
+                    keyD[TaxonomyNameIndex.normalize(name).encode("utf-8")] = taxId
+        keyL = sorted(keyD)
+        pool = b"".join(keyL)
+        offsetA = np.zeros(len(keyL) + 1, dtype=np.int64)
+        np.cumsum([len(key) for key in keyL], out=offsetA[1:])
+        keyTaxIdA = np.fromiter((keyD[key] for key in keyL), dtype=np.int32, count=len(keyL))
+        numKeys = len(keyL)
+        # padded match forms " <name> " are laid out back to back - the trigrams of name k start at its bytes
+        lengthA = np.diff(offsetA)
+        keyOfByteA = np.repeat(np.arange(numKeys, dtype=np.int64), lengthA)
+        padA = np.full(len(pool) + 2 * numKeys, 32, dtype=np.uint8)
+        startA = np.arange(len(pool), dtype=np.int64) + 2 * keyOfByteA
+        padA[startA + 1] = np.frombuffer(pool.translate(_MATCH_TABLE), dtype=np.uint8)
+        codeA = (padA[startA].astype(np.uint64) << 16) | (padA[startA + 1].astype(np.uint64) << 8) | padA[startA + 2].astype(np.uint64)
+        # distinct (trigram, name) pairs in trigram then name order
+        pairA = np.sort((codeA << 32) | keyOfByteA.astype(np.uint64))
+        del keyOfByteA, startA, padA, codeA
+        pairA = pairA[np.concatenate(([True], pairA[1:] != pairA[:-1]))] if len(pairA) else pairA
+        pairCodeA = (pairA >> 32).astype(np.uint32)
+        gramStartA = np.flatnonzero(np.concatenate(([True], pairCodeA[1:] != pairCodeA[:-1]))) if len(pairA) else np.zeros(0, dtype=np.int64)
+        gramA = pairCodeA[gramStartA]
+        gramStartA = np.append(gramStartA, len(pairA)).astype(np.int64)
+        postingA = (pairA & 0xFFFFFFFF).astype(np.int32)
+        logger.debug("Built taxonomy name matcher with %d names %d trigrams %d postings", numKeys, len(gramA), len(postingA))
+        return {
+            "keyPool": pool,
+            "keyOffset": array.array("q", offsetA.tobytes()),
+            "keyTaxId": array.array("i", keyTaxIdA.astype(np.int32).tobytes()),
+            "gram": array.array("I", gramA.tobytes()),
+            "gramStart": array.array("q", gramStartA.tobytes()),
+            "posting": array.array("i", postingA.tobytes()),
+        }
+
+    def write(self, filePath):
+        """Write the name matcher to a memory-mappable array file.
+
+        Args:
+            filePath (str): output file path
+
+        Returns:
+            bool: True for success or False otherwise
+        """
+        return ArrayFileUtil().write(filePath, self.__sectionD, {"version": NAME_MATCHER_VERSION})
+
+    def close(self):
+        """Release array views over a memory-mapped matcher (the matcher is unusable afterwards)."""
+        self.__offsetA = self.__lengthA = self.__gramA = self.__gramStartA = self.__postingA = None
+        for arr in self.__sectionD.values():
+            if isinstance(arr, memoryview):
+                arr.release()
+        self.__sectionD = {}
+
+    def memoryUsage(self):
+        """Return the size and backing of the matcher arrays (see ArrayFileUtil.memoryUsage()), including the key length array."""
+        uD = ArrayFileUtil().memoryUsage(self.__sectionD)
+        uD["bytes"] += self.__lengthA.nbytes if self.__lengthA is not None else 0
+        return uD
+
+    def __len__(self):
+        return len(self.__keyTaxIds) if self.__sectionD else 0
+
+    def key(self, kk):
+        """Return the normalized name at key index kk."""
+        return str(self.__pool[self.__keyOffsets[kk] : self.__keyOffsets[kk + 1]], "utf-8")
+
+    def match(self, name, maxResults=5, minScore=0.8, maxCandidates=200):
+        """Return the names closest to the input name (at most one name per taxon).
+
+        Args:
+            name (str): organism name
+            maxResults (int, optional): maximum number of returned matches. Defaults to 5.
+            minScore (float, optional): minimum score (1 - edit distance / max(length)) in (0, 1]. Defaults to 0.8.
+            maxCandidates (int, optional): number of candidates (by trigram overlap) scored by edit distance. Defaults to 200.
+
+        Returns:
+            list: [{"taxId": ..., "name": <normalized name>, "score": ...}, ...] by decreasing score
+        """
+        try:
+            query = self.matchForm(name)
+        except Exception:
+            return []
+        qLen = len(query)
+        if not qLen or not len(self):
+            return []
+        minScore = min(max(minScore, 1.0e-3), 1.0)
+        maxCandidates = max(maxCandidates, 1)
+        # maximum edit distance for which score >= minScore is possible (for names up to qLen + maxDist long)
+        maxDist = int((1.0 - minScore) * qLen / minScore + 1.0e-9)
+        padded = b" " + query + b" "
+        postingL = []
+        codeS = {(padded[ii] << 16) | (padded[ii + 1] << 8) | padded[ii + 2] for ii in range(qLen)}
+        for code in codeS:
+            jj = int(np.searchsorted(self.__gramA, code))
+            if jj < len(self.__gramA) and self.__gramA[jj] == code:
+                postingL.append(self.__postingA[self.__gramStartA[jj] : self.__gramStartA[jj + 1]])
+        if not postingL:
+            return []
+        # count filter - shared query trigrams per name
+        sharedA = np.bincount(np.concatenate(postingL))
+        minShared = max(len(codeS) - 3 * maxDist, 1)
+        candA = np.flatnonzero(sharedA >= minShared)
+        candA = candA[np.abs(self.__lengthA[candA] - qLen) <= maxDist]
+        if not len(candA):
+            return []
+        sharedA = sharedA[candA]
+        # trigram (Jaccard) similarity ranking of the candidates
+        simA = sharedA / (self.__lengthA[candA] + len(codeS) - sharedA)
+        if len(candA) > maxCandidates:
+            topA = np.argpartition(-simA, maxCandidates - 1)[:maxCandidates]
+            candA, simA = candA[topA], simA[topA]
+        candA = candA[np.argsort(-simA, kind="stable")]
+        #
+        peqD = {}
+        for ii, ch in enumerate(query):
+            peqD[ch] = peqD.get(ch, 0) | (1 << ii)
+        resultD = {}
+        for kk in candA.tolist():
+            keyBytes = bytes(self.__pool[self.__keyOffsets[kk] : self.__keyOffsets[kk + 1]])
+            cLen = len(keyBytes)
+            dist = self.__editDistance(peqD, qLen, keyBytes.translate(_MATCH_TABLE))
+            score = 1.0 - dist / max(qLen, cLen)
+            if dist > maxDist or score < minScore:
+                continue
+            taxId = self.__keyTaxIds[kk]
+            if taxId not in resultD or score > resultD[taxId]["score"]:
+                resultD[taxId] = {"taxId": taxId, "name": str(keyBytes, "utf-8"), "score": round(score, 4)}
+        return sorted(resultD.values(), key=lambda rD: (-rD["score"], rD["name"], rD["taxId"]))[:maxResults]
+
+    def matchList(self, nameList, maxResults=5, minScore=0.8, maxCandidates=200):
+        """Return the match lists for the input names (see match())."""
+        return [self.match(name, maxResults=maxResults, minScore=minScore, maxCandidates=maxCandidates) for name in nameList]
+
+    def __editDistance(self, peqD, qLen, text):
+        """Return the Levenshtein distance between the query (of length qLen with byte position masks peqD) and text.
+
+        Bit-parallel computation of the distance matrix columns (Myers 1999, Hyyro 2001) - one pass over text.
+        """
+        mask = (1 << qLen) - 1
+        high = 1 << (qLen - 1)
+        pv = mask
+        mv = 0
+        dist = qLen
+        for ch in text:
+            eq = peqD.get(ch, 0)
+            xv = eq | mv
+            xh = ((((eq & pv) + pv) ^ pv) | eq) & mask
+            ph = (mv | ~(xh | pv)) & mask
+            mh = pv & xh
+            if ph & high:
+                dist += 1
+            elif mh & high:
+                dist -= 1
+            ph = ((ph << 1) | 1) & mask
+            mh = (mh << 1) & mask
+            pv = (mh | ~(xv | ph)) & mask
+            mv = ph & xv
+        return dist
@@ -0,0 +1,126 @@
+##
+# File: TaxonomyNameResolver.py
+# Date: 16-Oct-2026
+#
+# Updates:
+##
+"""
+Bulk resolution of organism names to taxonomy identifiers over a TaxonomyNameIndex.
+
+Input names are read in batches.  Within a batch, names are deduplicated, each distinct name is
+normalized once and the distinct normalized names are resolved (optionally, numProc > 1, in chunks
+over a process pool whose workers memory-map the persisted name index file, so the index pages are
+shared through the page cache rather than copied).  Results are generated in input order as:
+
+    (organismName, taxId, status)
+
+where status is one of "resolved", "ambiguous" (the name is carried by several taxa and taxId is the
+preferred identifier as returned by TaxonomyProvider.getTaxId()) or "unresolved" (taxId is None).
+
+"""
+
+import concurrent.futures
+import gzip
+import logging
+
+from rcsb.utils.taxonomy.TaxonomyNameIndex import TaxonomyNameIndex
+
+logger = logging.getLogger(__name__)
+
+# name index opened by each process pool worker
+_workerNameIndex = None
+
+
+class TaxonomyNameResolver(object):
+    """Deduplicating, optionally multi-process, bulk organism name resolver."""
+
+    def __init__(self, nameIndex=None, filePath=None, **kwargs):
+        """Deduplicating, optionally multi-process, bulk organism name resolver.
+
+        Args:
+            nameIndex (TaxonomyNameIndex, optional): name index used in process. Defaults to None.
+            filePath (str, optional): persisted name index file path (required for numProc > 1). Defaults to None.
+            numProc (int, optional): number of worker processes. Defaults to 1.
+            batchSize (int, optional): number of input names read (and deduplicated) per batch. Defaults to 200000.
+            chunkSize (int, optional): number of distinct names per worker task. Defaults to 20000.
+        """
+        self.__nameIndex = nameIndex
+        self.__filePath = filePath
+        self.__numProc = kwargs.get("numProc", 1)
+        self.__batchSize = max(1, kwargs.get("batchSize", 200000))
+        self.__chunkSize = max(1, kwargs.get("chunkSize", 20000))
+        if self.__nameIndex is None and self.__filePath:
+            self.__nameIndex = TaxonomyNameIndex(self.__filePath)
+
+    def resolve(self, nameIterable):
+        """Generate (organismName, taxId, status) for each input name in input order (see module notes).
+
+        Args:
+            nameIterable (iterable): organism names
+
+        Yields:
+            tuple: (organismName, taxId or None, "resolved" | "ambiguous" | "unresolved")
+        """
+        useProc = self.__numProc > 1 and self.__filePath
+        if self.__numProc > 1 and not self.__filePath:
+            logger.warning("No persisted name index file - resolving organism names in process")
+        if useProc:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=self.__numProc, initializer=openWorkerNameIndex, initargs=(self.__filePath,)) as executor:
+                yield from self.__resolve(nameIterable, executor)
+        else:
+            yield from self.__resolve(nameIterable, None)
+
+    def resolveFile(self, filePath):
+        """Generate (organismName, taxId, status) for each line of the input text file (plain or gzipped, one name per line)."""
+        with gzip.open(filePath, "rt", encoding="utf-8") if filePath.endswith(".gz") else open(filePath, "r", encoding="utf-8") as ifh:
+            yield from self.resolve(line.rstrip("\r\n") for line in ifh)
+
+    def __resolve(self, nameIterable, executor):
+        batchL = []
+        for name in nameIterable:
+            batchL.append(name)
+            if len(batchL) >= self.__batchSize:
+                yield from self.__resolveBatch(batchL, executor)
+                batchL = []
+        if batchL:
+            yield from self.__resolveBatch(batchL, executor)
+
+    def __resolveBatch(self, nameList, executor):
+        # distinct input names -> position of the distinct normalized name (or -1 for names that cannot be normalized)
+        posD = {}
+        keyD = {}
+        for name in nameList:
+            if not isinstance(name, str) or name in posD:
+                continue
+            try:
+                key = TaxonomyNameIndex.normalize(name).encode("utf-8")
+            except Exception:
+                posD[name] = -1
+                continue
+            posD[name] = keyD.setdefault(key, len(keyD))
+        keyL = list(keyD)
+        if executor is not None and len(keyL) > self.__chunkSize:
+            resultL = []
+            for rL in executor.map(resolveKeyChunk, [keyL[ii : ii + self.__chunkSize] for ii in range(0, len(keyL), self.__chunkSize)]):
+                resultL.extend(rL)
+        else:
+            resultL = self.__nameIndex.resolveKeys(keyL)
+        logger.debug("Resolved %d names (%d distinct normalized names)", len(nameList), len(keyL))
+        for name in nameList:
+            pos = posD[name] if isinstance(name, str) else -1
+            if pos < 0:
+                yield name, None, "unresolved"
+                continue
+            taxId, numTaxa = resultL[pos]
+            yield name, taxId, "unresolved" if numTaxa == 0 else "ambiguous" if numTaxa > 1 else "resolved"
+
+
+def openWorkerNameIndex(filePath):
+    """Process pool worker initializer - memory-map the persisted name index."""
+    global _workerNameIndex  # pylint: disable=global-statement
+    _workerNameIndex = TaxonomyNameIndex(filePath)
+
+
+def resolveKeyChunk(keyList):
+    """Process pool worker - resolve a chunk of normalized names (see TaxonomyNameIndex.resolveKeys())."""
+    return _workerNameIndex.resolveKeys(keyList)
@@ -0,0 +1,201 @@
+##
+# File: TaxonomyNameStore.py
+# Date: 16-Oct-2026
+#
+# Updates:
+##
+"""
+Compact string-pool store for the NCBI taxonomy scientific, alternate and common names.
+
+All distinct names are stored once in a UTF-8 string pool addressed by an offset array.  Per
+taxon (dense index in name dictionary order) the store holds the string index of the scientific
+and alternate names and two ranges of string indices for the common names - in source order
+(as parsed from names.dmp) and deduplicated and sorted (as returned by getCommonNames()):
+
+    taxId[idx]                 taxonomy identifier at dense index idx
+    lookup[taxId]              dense index of taxId or -1
+    snStr[idx], altStr[idx]    string index or -1
+    cnStart/cnStr              common names of idx in source order
+    cnSortedStart/cnSortedStr  distinct common names of idx in sorted order
+
+The store is built in memory from a name dictionary and may be written to (and memory-mapped
+from) a single array file (see ArrayFileUtil).
+
+"""
+
+import array
+import logging
+from collections.abc import Mapping
+
+from rcsb.utils.taxonomy.ArrayFileUtil import ArrayFileUtil
+
+logger = logging.getLogger(__name__)
+
+NAME_STORE_VERSION = 1
+
+
+class TaxonomyNameStore(object):
+    """Compact taxonomy name tables backed by a shared UTF-8 string pool."""
+
+    def __init__(self, filePath=None, nameD=None, buffer=None):
+        """Open a name store file (memory-mapped) or buffer, or build the store from a name dictionary.
+
+        Args:
+            filePath (str, optional): name store file path. Defaults to None.
+            nameD (dict, optional): {taxId: {"sn": ..., "alt": ..., "cn": [...]}, ...}. Defaults to None.
+            buffer (object, optional): buffer containing name store data. Defaults to None.
+        """
+        if filePath or buffer is not None:
+            attributeD, sD = ArrayFileUtil().read(filePath) if filePath else ArrayFileUtil().fromBuffer(buffer)
+            if attributeD.get("version") != NAME_STORE_VERSION:
+                raise ValueError("Unsupported taxonomy name store version %r" % attributeD.get("version"))
+        else:
+            sD = self.__build(nameD if nameD is not None else {})
+        self.__sectionD = sD
+        self.__taxIds = sD["taxId"]
+        self.__lookup = sD["lookup"]
+        self.__pool = sD["namePool"]
+        self.__strOffsets = sD["strOffset"]
+        self.__snStr = sD["snStr"]
+        self.__altStr = sD["altStr"]
+        self.__cnStart = sD["cnStart"]
+        self.__cnStr = sD["cnStr"]
+        self.__cnSortedStart = sD["cnSortedStart"]
+        self.__cnSortedStr = sD["cnSortedStr"]
+        #
+        self.nameD = _NameStoreView(self)
+
+    def __build(self, nameD):
+        taxIds = array.array("i", nameD.keys())
+        maxTaxId = max(taxIds) if taxIds else 0
+        lookup = array.array("i", [-1]) * (maxTaxId + 1)
+        for ii, taxId in enumerate(taxIds):
+            lookup[taxId] = ii
+        #
+        strD = {}
+        pool = bytearray()
+        strOffsets = array.array("q", [0])
+
+        def internString(name):
+            jj = strD.get(name)
+            if jj is None:
+                jj = strD[name] = len(strD)
+                pool.extend(name.encode("utf-8"))
+                strOffsets.append(len(pool))
+            return jj
+
+        snStr = array.array("i")
+        altStr = array.array("i")
+        cnStart = array.array("i", [0])
+        cnStr = array.array("i")
+        cnSortedStart = array.array("i", [0])
+        cnSortedStr = array.array("i")
+        for nmD in nameD.values():
+            snStr.append(internString(nmD["sn"]) if "sn" in nmD else -1)
+            altStr.append(internString(nmD["alt"]) if "alt" in nmD else -1)
+            cnL = nmD.get("cn", [])
+            cnStr.extend([internString(cn) for cn in cnL])
+            cnStart.append(len(cnStr))
+            cnSortedStr.extend([strD[cn] for cn in sorted(set(cnL))])
+            cnSortedStart.append(len(cnSortedStr))
+        logger.debug("Built taxonomy name store with %d taxa %d distinct names (%d bytes)", len(taxIds), len(strD), len(pool))
+        return {
+            "taxId": taxIds,
+            "lookup": lookup,
+            "namePool": bytes(pool),
+            "strOffset": strOffsets,
+            "snStr": snStr,
+            "altStr": altStr,
+            "cnStart": cnStart,
+            "cnStr": cnStr,
+            "cnSortedStart": cnSortedStart,
+            "cnSortedStr": cnSortedStr,
+        }
+
+    def write(self, filePath):
+        """Write the name store to a memory-mappable array file.
+
+        Args:
+            filePath (str): output file path
+
+        Returns:
+            bool: True for success or False otherwise
+        """
+        return ArrayFileUtil().write(filePath, self.__sectionD, {"version": NAME_STORE_VERSION})
+
+    def close(self):
+        """Release array views over a memory-mapped store (the store is unusable afterwards)."""
+        for arr in self.__sectionD.values():
+            if isinstance(arr, memoryview):
+                arr.release()
+        self.__sectionD = {}
+
+    def memoryUsage(self):
+        """Return the size and backing of the store arrays (see ArrayFileUtil.memoryUsage())."""
+        return ArrayFileUtil().memoryUsage(self.__sectionD)
+
+    def __len__(self):
+        return len(self.__taxIds)
+
+    def index(self, taxId):
+        """Return the dense index of the input (integer) taxId or -1."""
+        return self.__lookup[taxId] if isinstance(taxId, int) and 0 <= taxId < len(self.__lookup) else -1
+
+    def taxId(self, idx):
+        return self.__taxIds[idx]
+
+    def string(self, jj):
+        return str(self.__pool[self.__strOffsets[jj] : self.__strOffsets[jj + 1]], "utf-8")
+
+    def scientificName(self, idx):
+        jj = self.__snStr[idx]
+        return self.string(jj) if jj >= 0 else None
+
+    def alternateName(self, idx):
+        jj = self.__altStr[idx]
+        return self.string(jj) if jj >= 0 else None
+
+    def commonNames(self, idx):
+        """Return the common names of node idx in source order (with any duplicates)."""
+        return [self.string(jj) for jj in self.__cnStr[self.__cnStart[idx] : self.__cnStart[idx + 1]]]
+
+    def sortedCommonNames(self, idx):
+        """Return the distinct common names of node idx in sorted order."""
+        return [self.string(jj) for jj in self.__cnSortedStr[self.__cnSortedStart[idx] : self.__cnSortedStart[idx + 1]]]
+
+    def hasCommonNames(self, idx):
+        return self.__cnStart[idx + 1] > self.__cnStart[idx]
+
+    def names(self, idx):
+        """Return the name dictionary {"sn": ..., "alt": ..., "cn": [...]} of node idx."""
+        nmD = {}
+        if self.__snStr[idx] >= 0:
+            nmD["sn"] = self.string(self.__snStr[idx])
+        if self.__altStr[idx] >= 0:
+            nmD["alt"] = self.string(self.__altStr[idx])
+        if self.hasCommonNames(idx):
+            nmD["cn"] = self.commonNames(idx)
+        return nmD
+
+
+class _NameStoreView(Mapping):
+    """Read-only mapping view taxId -> {"sn": ..., "alt": ..., "cn": [...]} in dense index order"""
+
+    def __init__(self, store):
+        self.__store = store
+
+    def __getitem__(self, taxId):
+        idx = self.__store.index(taxId)
+        if idx < 0:
+            raise KeyError(taxId)
+        return self.__store.names(idx)
+
+    def __contains__(self, taxId):
+        return self.__store.index(taxId) >= 0
+
+    def __iter__(self):
+        for idx in range(len(self.__store)):
+            yield self.__store.taxId(idx)
+
+    def __len__(self):
+        return len(self.__store)
@@ -0,0 +1,313 @@
+##
+# File: TaxonomyNodeStore.py
+# Date: 16-Oct-2026
+#
+# Updates:
+# 16-Oct-2026 build the store arrays in vectorized NumPy passes over the parent array, add breadth-first traversal bfsTaxIds()
+# 16-Oct-2026 hold the merged taxonomy identifiers (mergedTaxId/mergedToTaxId sections and mergeD view)
+# 16-Oct-2026 add rootIndices() and level-by-level breadth-first traversal bfsLevels() for the vectorized index builds
+##
+"""
+Compact array-backed store for the NCBI taxonomy node (parent and rank) data.
+
+Taxonomy identifiers are remapped to dense indices (in node dictionary order) and the tree
+is held as flat typed arrays:
+
+    taxId[idx]             taxonomy identifier at dense index idx
+    lookup[taxId]          dense index of taxId or -1
+    parentIndex[idx]       dense index of the parent node (or -(k + 2) for a parent missing from the node table,
+                           where k indexes the orphanParentTaxId section)
+    rank[idx]              uint8 code into the interned rank table (file attribute "ranks")
+    childStart/childIndex  compressed child adjacency, children of idx are childIndex[childStart[idx]:childStart[idx + 1]]
+    mergedTaxId            merged (obsolete) taxonomy identifiers in ascending order
+    mergedToTaxId          taxonomy identifier replacing mergedTaxId[k]
+
+The store is built in memory from a node dictionary (the lookup, parent index and child adjacency
+are computed in vectorized passes over the parent array) and may be written to (and memory-mapped
+from) a single array file (see ArrayFileUtil).
+
+"""
+
+import array
+import bisect
+import logging
+from collections.abc import Mapping
+
+import numpy as np
+
+from rcsb.utils.taxonomy.ArrayFileUtil import ArrayFileUtil
+
+logger = logging.getLogger(__name__)
+
+NODE_STORE_VERSION = 2
+
+
+class TaxonomyNodeStore(object):
+    """Compact node (parent, rank and child) tables over dense taxonomy node indices."""
+
+    def __init__(self, filePath=None, nodeD=None, buffer=None, mergeD=None):
+        """Open a node store file (memory-mapped) or buffer, or build the store from node and merged taxon dictionaries.
+
+        Args:
+            filePath (str, optional): node store file path. Defaults to None.
+            nodeD (dict, optional): {taxId: (parentTaxId, rank), ...}. Defaults to None.
+            buffer (object, optional): buffer containing node store data. Defaults to None.
+            mergeD (dict, optional): {taxId: mergedTaxId, ...}. Defaults to None.
+        """
+        if filePath or buffer is not None:
+            attributeD, sD = ArrayFileUtil().read(filePath) if filePath else ArrayFileUtil().fromBuffer(buffer)
+            if attributeD.get("version") != NODE_STORE_VERSION:
+                raise ValueError("Unsupported taxonomy node store version %r" % attributeD.get("version"))
+            self.__rankL = attributeD["ranks"]
+        else:
+            sD, self.__rankL = self.__build(nodeD if nodeD is not None else {}, mergeD if mergeD is not None else {})
+        self.__sectionD = sD
+        self.__taxIds = sD["taxId"]
+        self.__lookup = sD["lookup"]
+        self.__parentIndex = sD["parentIndex"]
+        self.__rankCodes = sD["rank"]
+        self.__childStart = sD["childStart"]
+        self.__childIndex = sD["childIndex"]
+        self.__orphanParentTaxIds = sD["orphanParentTaxId"]
+        self.__orphanSortedTaxIds = sD["orphanSortedTaxId"]
+        self.__orphanSortedChild = sD["orphanSortedChild"]
+        self.__mergedTaxIds = sD["mergedTaxId"]
+        self.__mergedToTaxIds = sD["mergedToTaxId"]
+        #
+        self.nodeD = _NodeStoreView(self)
+        self.mergeD = _MergedView(self)
+
+    def __build(self, nodeD, mergeD):
+        numNodes = len(nodeD)
+        taxIdA = np.fromiter(nodeD.keys(), dtype=np.int64, count=numNodes)
+        parentTaxIdA = np.fromiter((parentTaxId for parentTaxId, _ in nodeD.values()), dtype=np.int64, count=numNodes)
+        rankD = {}
+        rankCodes = array.array("B", [rankD.setdefault(rank, len(rankD)) for _, rank in nodeD.values()])
+        if len(rankD) > 255:
+            raise ValueError("Too many distinct taxonomy ranks (%d)" % len(rankD))
+        maxTaxId = int(taxIdA.max()) if numNodes else 0
+        lookupA = np.full(maxTaxId + 1, -1, dtype=np.int32)
+        lookupA[taxIdA] = np.arange(numNodes, dtype=np.int32)
+        #
+        # parents missing from the node table are coded -(k + 2) (k indexes the orphan parent list)
+        isKnownA = (parentTaxIdA >= 0) & (parentTaxIdA <= maxTaxId)
+        parentIndexA = np.full(numNodes, -1, dtype=np.int32)
+        parentIndexA[isKnownA] = lookupA[parentTaxIdA[isKnownA]]
+        orphanChildA = np.flatnonzero(parentIndexA < 0)
+        parentIndexA[orphanChildA] = -(np.arange(len(orphanChildA), dtype=np.int32) + 2)
+        orphanParentA = parentTaxIdA[orphanChildA]
+        orphanOrderA = np.lexsort((orphanChildA, orphanParentA))
+        #
+        # children of each node in dense index order (stable sort of the child indices on the parent index)
+        hasParentA = np.flatnonzero(parentIndexA >= 0)
+        childStartA = np.zeros(numNodes + 1, dtype=np.int32)
+        np.cumsum(np.bincount(parentIndexA[hasParentA], minlength=numNodes), out=childStartA[1:])
+        childIndexA = hasParentA[np.argsort(parentIndexA[hasParentA], kind="stable")]
+        mergedL = sorted(mergeD.items())
+        sD = {
+            "taxId": self.__toArray("i", taxIdA),
+            "lookup": self.__toArray("i", lookupA),
+            "parentIndex": self.__toArray("i", parentIndexA),
+            "rank": rankCodes,
+            "childStart": self.__toArray("i", childStartA),
+            "childIndex": self.__toArray("i", childIndexA),
+            "orphanParentTaxId": self.__toArray("i", orphanParentA),
+            "orphanSortedTaxId": self.__toArray("i", orphanParentA[orphanOrderA]),
+            "orphanSortedChild": self.__toArray("i", orphanChildA[orphanOrderA]),
+            "mergedTaxId": array.array("i", [tup[0] for tup in mergedL]),
+            "mergedToTaxId": array.array("i", [tup[1] for tup in mergedL]),
+        }
+        logger.debug("Built taxonomy node store with %d nodes %d ranks %d merged taxa", numNodes, len(rankD), len(mergedL))
+        return sD, sorted(rankD, key=rankD.get)
+
+    def __toArray(self, typecode, npArr):
+        arr = array.array(typecode)
+        arr.frombytes(npArr.astype(np.dtype(typecode), copy=False).tobytes())
+        return arr
+
+    def write(self, filePath):
+        """Write the node store to a memory-mappable array file.
+
+        Args:
+            filePath (str): output file path
+
+        Returns:
+            bool: True for success or False otherwise
+        """
+        return ArrayFileUtil().write(filePath, self.__sectionD, {"version": NODE_STORE_VERSION, "ranks": self.__rankL})
+
+    def close(self):
+        """Release array views over a memory-mapped store (the store is unusable afterwards)."""
+        for arr in self.__sectionD.values():
+            if isinstance(arr, memoryview):
+                arr.release()
+        self.__sectionD = {}
+
+    def memoryUsage(self):
+        """Return the size and backing of the store arrays (see ArrayFileUtil.memoryUsage())."""
+        return ArrayFileUtil().memoryUsage(self.__sectionD)
+
+    def __len__(self):
+        return len(self.__taxIds)
+
+    def section(self, name):
+        """Return the named array section (array.array or memoryview) for use in bulk (e.g. NumPy) operations."""
+        return self.__sectionD[name]
+
+    def index(self, taxId):
+        """Return the dense index of the input (integer) taxId or -1."""
+        return self.__lookup[taxId] if isinstance(taxId, int) and 0 <= taxId < len(self.__lookup) else -1
+
+    def taxId(self, idx):
+        return self.__taxIds[idx]
+
+    def parentIndex(self, idx):
+        """Return the dense index of the parent of node idx or -1 if the parent is not in the node table."""
+        pIdx = self.__parentIndex[idx]
+        return pIdx if pIdx >= 0 else -1
+
+    def parentTaxId(self, idx):
+        pIdx = self.__parentIndex[idx]
+        return self.__taxIds[pIdx] if pIdx >= 0 else self.__orphanParentTaxIds[-pIdx - 2]
+
+    def rank(self, idx):
+        return self.__rankL[self.__rankCodes[idx]]
+
+    def rankCode(self, idx):
+        return self.__rankCodes[idx]
+
+    def getRankList(self):
+        """Return the interned rank table (rank code -> rank name)."""
+        return list(self.__rankL)
+
+    def mergedTaxId(self, taxId):
+        """Return the taxonomy identifier replacing the input merged taxId or None."""
+        if not isinstance(taxId, int):
+            return None
+        ii = bisect.bisect_left(self.__mergedTaxIds, taxId)
+        return self.__mergedToTaxIds[ii] if ii < len(self.__mergedTaxIds) and self.__mergedTaxIds[ii] == taxId else None
+
+    def mergedCount(self):
+        return len(self.__mergedTaxIds)
+
+    def childIndices(self, idx):
+        return self.__childIndex[self.__childStart[idx] : self.__childStart[idx + 1]]
+
+    def children(self, parentTaxId):
+        """Return the list of child taxIds for the input parent taxId (in node dictionary order)."""
+        idx = self.index(parentTaxId)
+        if idx >= 0:
+            taxIds = self.__taxIds
+            return [taxIds[cIdx] for cIdx in self.__childIndex[self.__childStart[idx] : self.__childStart[idx + 1]]]
+        if not isinstance(parentTaxId, int):
+            return []
+        lo = bisect.bisect_left(self.__orphanSortedTaxIds, parentTaxId)
+        hi = bisect.bisect_right(self.__orphanSortedTaxIds, parentTaxId)
+        return [self.__taxIds[cIdx] for cIdx in self.__orphanSortedChild[lo:hi]]
+
+    def rootIndices(self):
+        """Return the dense indices of the roots (self-parented nodes or nodes with a parent missing from the node table) in ascending order."""
+        parentIndexA = np.frombuffer(self.__parentIndex, dtype=np.int32)
+        return np.flatnonzero((parentIndexA < 0) | (parentIndexA == np.arange(len(parentIndexA), dtype=np.int32)))
+
+    def bfsLevels(self, idxList):
+        """Return the list of breadth-first levels (arrays of dense indices) reached from the input start nodes (start nodes first).
+
+        Each level is expanded in one vectorized gather over the child adjacency arrays.
+        """
+        childStartA = np.frombuffer(self.__childStart, dtype=np.int32)
+        childIndexA = np.frombuffer(self.__childIndex, dtype=np.int32)
+        visitedA = np.zeros(len(self), dtype=bool)
+        frontierA = np.asarray(idxList, dtype=np.int64)
+        visitedA[frontierA] = True
+        levelL = [frontierA]
+        while frontierA.size:
+            startA = childStartA[frontierA]
+            countA = childStartA[frontierA + 1] - startA
+            numChildren = int(countA.sum())
+            if not numChildren:
+                break
+            # positions of the children of each frontier node within the child index array
+            positionA = np.repeat(startA - (np.cumsum(countA) - countA), countA) + np.arange(numChildren)
+            frontierA = childIndexA[positionA]
+            # (the self-parented root is its own child)
+            frontierA = frontierA[~visitedA[frontierA]]
+            if not frontierA.size:
+                break
+            visitedA[frontierA] = True
+            levelL.append(frontierA)
+        return levelL
+
+    def bfsIndices(self, idxList):
+        """Return the dense indices of the nodes reached breadth-first from the input start nodes (start nodes first)."""
+        return np.concatenate(self.bfsLevels(idxList))
+
+    def bfsTaxIds(self, taxId):
+        """Return the taxIds of the subtree below the input taxId in breadth-first order (starting with taxId).
+
+        For a parent missing from the node table, the traversal starts from its children.
+        """
+        idx = self.index(taxId)
+        if idx >= 0:
+            return np.frombuffer(self.__taxIds, dtype=np.int32)[self.bfsIndices([idx])].tolist()
+        cIdxL = []
+        if isinstance(taxId, int):
+            lo = bisect.bisect_left(self.__orphanSortedTaxIds, taxId)
+            hi = bisect.bisect_right(self.__orphanSortedTaxIds, taxId)
+            cIdxL = list(self.__orphanSortedChild[lo:hi])
+        return [taxId] + np.frombuffer(self.__taxIds, dtype=np.int32)[self.bfsIndices(cIdxL)].tolist()
+
+    def lineageIndices(self, idx):
+        """Return the dense indices from node idx up to the top of its lineage (a self-parented root or a node with a missing parent)."""
+        iL = [idx]
+        parentIndex = self.__parentIndex
+        pIdx = parentIndex[idx]
+        while pIdx >= 0 and pIdx != iL[-1]:
+            iL.append(pIdx)
+            pIdx = parentIndex[pIdx]
+        return iL
+
+
+class _NodeStoreView(Mapping):
+    """Read-only mapping view taxId -> (parentTaxId, rank) in dense index order"""
+
+    def __init__(self, store):
+        self.__store = store
+
+    def __getitem__(self, taxId):
+        idx = self.__store.index(taxId)
+        if idx < 0:
+            raise KeyError(taxId)
+        return (self.__store.parentTaxId(idx), self.__store.rank(idx))
+
+    def __contains__(self, taxId):
+        return self.__store.index(taxId) >= 0
+
+    def __iter__(self):
+        for idx in range(len(self.__store)):
+            yield self.__store.taxId(idx)
+
+    def __len__(self):
+        return len(self.__store)
+
+
+class _MergedView(Mapping):
+    """Read-only mapping view merged taxId -> taxId in ascending merged taxId order"""
+
+    def __init__(self, store):
+        self.__store = store
+
+    def __getitem__(self, taxId):
+        mergedTaxId = self.__store.mergedTaxId(taxId)
+        if mergedTaxId is None:
+            raise KeyError(taxId)
+        return mergedTaxId
+
+    def __contains__(self, taxId):
+        return self.__store.mergedTaxId(taxId) is not None
+
+    def __iter__(self):
+        return iter(self.__store.section("mergedTaxId"))
+
+    def __len__(self):
+        return self.__store.mergedCount()
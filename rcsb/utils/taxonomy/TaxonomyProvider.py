@@ -14,26 +14,170 @@
 # 23-Jul-2019 jdw adjustments to preserve ordering.
 # 21-Jul-2021 jdw Make this provider a subclass of StashableBase
 # 11-Oct-2023 dwp adjust reading in of names.dmp file due to some strange parsing behavior using MarshalUtil
+# 16-Oct-2026 add optional memory-mapped columnar snapshot cache format (cacheFormat="snapshot")
+# 16-Oct-2026 add lazy per-component loading (lazy=True, components=[...])
+# 16-Oct-2026 stream-parse dump data from taxdump.tar.gz (no extracted members or intermediate row lists)
+# 16-Oct-2026 add optional multi-process parsing of dump files during cache rebuild (numProc=N)
+# 16-Oct-2026 add method updateCache() for incremental update from a new taxonomy dump with change log
+# 16-Oct-2026 add shared memory publication of taxonomy tables (publishSharedMemory(), sharedMemoryName=...)
+# 16-Oct-2026 add conditional (conditionalFetch=True), resumable and checksum verified fetching, concurrent fallback fetching
+# 16-Oct-2026 add compact array-backed node store (dense indices, parent index and uint8 rank code arrays) for node lookups
+# 16-Oct-2026 add compact string-pool name store with deduplicated, pre-sorted common names for name lookups
+# 16-Oct-2026 replace networkx graph LCA methods with a persisted binary lifting LCA index over the node store
+# 16-Oct-2026 add DFS interval index with isDescendantOf(), getDomainClass() and list forms, use it in the is<Domain>() methods
+# 16-Oct-2026 add optional bounded LRU memoization of lineage and name lineage results (memoSize=N, getMemoStats())
+# 16-Oct-2026 add NumPy vectorized batch methods getMergedTaxIds(), getParentTaxids(), getRankCodes(), getDepths(), getAncestorsAtDepth(), getLineages()
+# 16-Oct-2026 add vectorized batch method compareTaxonPairs() with status codes (getCompareStatusList())
+# 16-Oct-2026 add persisted ranked lineage table with getAncestorAtRank(), getAncestorsAtRank() and getRankedLineage()
+# 16-Oct-2026 add DFS slice descendant enumeration getDescendants() and precomputed subtree statistics getSubtreeStats()
+# 16-Oct-2026 add streaming single pass node list export exportNodeListStream() and visit only filtered taxa in filtered exports
+# 16-Oct-2026 replace the organism name map built on first getTaxId() call with the persisted name index, add getNameTaxIds() and isAmbiguousName()
+# 16-Oct-2026 add approximate organism name matching matchOrganismName() and matchOrganismNameList() with a cached trigram index
+# 16-Oct-2026 add deduplicating, optionally multi-process, bulk organism name resolution resolveOrganismNames()
+# 16-Oct-2026 serialize lazy loading of each data component and derived structure, add background warmup()
+# 16-Oct-2026 add opt-in instrumentation (instrument=True, statsHook=...) with getStats(), resetStats() and publishStats()
+# 16-Oct-2026 add getMemoryReport(), releaseComponents() and a memory budget for optional derived structures (memoryBudget=<bytes>)
+# 16-Oct-2026 traverse the node store child adjacency arrays level by level in getBfsTraverseList()
+# 16-Oct-2026 limit dump parsing processes to the usable CPU count
+# 16-Oct-2026 publish the merged identifiers as node store sections rather than the full snapshot in shared memory
+# 16-Oct-2026 retire the separate snapshot file - cacheFormat="snapshot" serves names, nodes and merged from the node and name stores
+# 16-Oct-2026 build the name matcher from the name store (all common names) rather than the exact name index
+# 16-Oct-2026 instrument only the query methods (INSTRUMENTED_METHODS) with method-specific miss predicates
+# 16-Oct-2026 fall back to node store walks (or raise MemoryError) when the memory budget refuses an optional structure
 ##
 
 import collections
+from collections.abc import Mapping
+import concurrent.futures
+import contextlib
+import functools
+import itertools
+import json
 import logging
+import mmap
+from multiprocessing import resource_tracker, shared_memory
 import os.path
 from pickle import NONE
 import sys
+import threading
+import time
 
-import networkx
+import numpy as np
 
-from rcsb.utils.io.FileUtil import FileUtil
 from rcsb.utils.io.MarshalUtil import MarshalUtil
 from rcsb.utils.io.StashableBase import StashableBase
+from rcsb.utils.taxonomy.TaxonomyDumpReader import TaxonomyDumpReader
+from rcsb.utils.taxonomy.ArrayFileUtil import ArrayFileUtil
+from rcsb.utils.taxonomy.TaxonomyBatchQuery import COMPARE_STATUS_LIST, ORTHOLOGOUS_LCA_RANKS, STRAIN_LIKE_RANKS, VARIANT_LCA_RANKS, TaxonomyBatchQuery
+from rcsb.utils.taxonomy.TaxonomyFetcher import FETCH_STATUS_FAILED, FETCH_STATUS_UNCHANGED, TaxonomyFetcher
+from rcsb.utils.taxonomy.TaxonomyIntervalIndex import TaxonomyIntervalIndex
+from rcsb.utils.taxonomy.TaxonomyLcaIndex import TaxonomyLcaIndex
+from rcsb.utils.taxonomy.TaxonomyLruCache import TaxonomyLruCache
+from rcsb.utils.taxonomy.TaxonomyNameIndex import TaxonomyNameIndex
+from rcsb.utils.taxonomy.TaxonomyNameMatcher import TaxonomyNameMatcher
+from rcsb.utils.taxonomy.TaxonomyNameResolver import TaxonomyNameResolver
+from rcsb.utils.taxonomy.TaxonomyNameStore import TaxonomyNameStore
+from rcsb.utils.taxonomy.TaxonomyNodeStore import TaxonomyNodeStore
+from rcsb.utils.taxonomy.TaxonomyRankedLineage import RANKED_LINEAGE_RANKS, TaxonomyRankedLineage
+from rcsb.utils.taxonomy.TaxonomyStats import TaxonomyStats, isEmptyResult, isNoneResult
 
 logger = logging.getLogger(__name__)
 
+# top level taxonomy classes (see getDomainClass())
+DOMAIN_CLASS_TAXIDS = [("bacteria", 2), ("archaea", 2157), ("eukaryota", 2759), ("virus", 10239), ("other", 28384), ("unclassified", 12908)]
+# derived structures opened from the cache (or built) on first use
+DERIVED_COMPONENTS = ["nodeStore", "nameStore", "lcaIndex", "intervalIndex", "rankedLineage", "nameMap", "nameMatcher"]
+# optional derived structures released (or not opened or built) to keep within a memory budget (in release order)
+RELEASABLE_COMPONENTS = ["nameMatcher", "nameMap", "rankedLineage", "intervalIndex", "lcaIndex"]
+# rough bytes per taxonomy node (NCBI scale) used to project the size of optional structures that are not yet cached
+PROJECTED_BYTES_PER_NODE = {"lcaIndex": 28, "intervalIndex": 20, "rankedLineage": 4 * len(RANKED_LINEAGE_RANKS), "nameMap": 40, "nameMatcher": 120}
+# query methods recorded by the instrumentation and their misses: a None result ("none"), a None or empty result ("empty")
+# or a False result for a taxId missing from the taxonomy ("unknownTaxId")
+INSTRUMENTED_METHODS = {
+    "getTaxId": "none",
+    "getNameTaxIds": "empty",
+    "isAmbiguousName": "none",
+    "matchOrganismName": "empty",
+    "matchOrganismNameList": "none",
+    "getMergedTaxId": "none",
+    "getRank": "none",
+    "getScientificName": "none",
+    "getParentScientificName": "none",
+    "getAlternateName": "none",
+    "getCommonNames": "empty",
+    "getParentTaxid": "none",
+    "getLineage": "empty",
+    "getLineageWithNames": "empty",
+    "getParentList": "empty",
+    "getLineageScientificNames": "empty",
+    "isDescendantOf": "unknownTaxId",
+    "isDescendantOfList": "none",
+    "getDomainClass": "none",
+    "getDomainClassList": "none",
+    "isBacteria": "unknownTaxId",
+    "isEukaryota": "unknownTaxId",
+    "isVirus": "unknownTaxId",
+    "isArchaea": "unknownTaxId",
+    "isOther": "unknownTaxId",
+    "isUnclassified": "unknownTaxId",
+    "getBfsTraverseList": "empty",
+    "getDescendants": "empty",
+    "getSubtreeStats": "empty",
+    "getSubtreeSize": "none",
+    "getLeafCount": "none",
+    "getSpeciesCount": "none",
+    "getChildren": "empty",
+    "getLowestCommonAncestorGen": "none",
+    "getLowestCommonAncestor": "none",
+    "getLowestCommonAncestors": "none",
+    "getAncestorAtRank": "none",
+    "getAncestorsAtRank": "none",
+    "getRankedLineage": "empty",
+    "getMergedTaxIds": "none",
+    "getParentTaxids": "none",
+    "getRankCodes": "none",
+    "getDepths": "none",
+    "getAncestorsAtDepth": "none",
+    "getLineages": "none",
+    "compareTaxons": "none",
+    "compareTaxonPairs": "none",
+}
+
 
 class TaxonomyProvider(StashableBase):
     def __init__(self, **kwargs):
-        """ """
+        """Provider for NCBI taxonomy names, nodes and merged taxa.
+
+        Args:
+            cachePath (str, optional): path to the cache directory (data are stored in <cachePath>/NCBI)
+            taxDirPath (str, optional): path to the taxonomy data directory (used if cachePath is not provided)
+            useCache (bool, optional): use existing cached data. Defaults to True.
+            cleanup (bool, optional): remove downloaded source files after the cache is built. Defaults to True.
+            ncbiTaxonomyUrl (str, optional): source locator for the NCBI taxonomy dump
+            ncbiTaxonomyMd5Url (str, optional): locator of the published MD5 digest of the dump. Defaults to <ncbiTaxonomyUrl>.md5 for http(s) sources.
+            conditionalFetch (bool, optional): with useCache=False, keep the existing cache (no download or rebuild) if the
+                                               source dump is unchanged since the previous fetch. Defaults to False.
+            cacheFormat (str, optional): cache format "pickle" or "snapshot" (names, nodes and merged served from the memory-mapped
+                                         node and name stores). Defaults to "pickle".
+            lazy (bool, optional): defer loading each cached data component until a method first needs it. Defaults to False.
+            components (list, optional): data components to load at construction (implies lazy loading for all others), a subset of
+                                         ["names", "nodes", "merged", "nodeStore", "nameStore", "lcaIndex", "intervalIndex", "rankedLineage", "nameMap", "nameMatcher"].
+                                         Defaults to None.
+            numProc (int, optional): number of processes used to parse the dump files when the cache is rebuilt and to resolve organism names in bulk. Defaults to 1.
+            memoSize (int, optional): memoize up to N lineage and name lineage results (least recently used are evicted),
+                                      memoized results are returned as tuples. Defaults to 0 (no memoization).
+            sharedMemoryName (str, optional): attach to taxonomy tables published in shared memory by another provider
+                                              (see publishSharedMemory()) rather than loading the cache. Defaults to None.
+            instrument (bool, optional): record query method call counts, latencies, misses and exceptions, merged identifier
+                                         redirects and load/build phase timings (see getStats()). Defaults to False.
+            statsHook (callable, optional): function called with the stats snapshot when loading completes and on each
+                                            publishStats() call (implies instrument=True). Defaults to None.
+            memoryBudget (int, optional): memory budget (bytes) for the data held by this provider (see getMemoryReport()) - optional
+                                          derived structures ("lcaIndex", "intervalIndex", "rankedLineage", "nameMap", "nameMatcher")
+                                          are released, or not opened or built, if the budget would be exceeded.  Queries needing a refused
+                                          structure fall back to node store lineage walks or traversals, or raise MemoryError if there is
+                                          no fallback (organism name lookups and NumPy batch queries). Defaults to None (no budget).
+        """
         dirName = "NCBI"
         if "cachePath" in kwargs:
             cachePath = os.path.abspath(kwargs.get("cachePath", None))
@@ -44,19 +188,362 @@ class TaxonomyProvider(StashableBase):
         super(TaxonomyProvider, self).__init__(cachePath, [dirName])
         useCache = kwargs.get("useCache", True)
         self.__cleanup = kwargs.get("cleanup", True)
+        self.__cacheFormat = kwargs.get("cacheFormat", "pickle")
+        components = kwargs.get("components", None)
+        self.__lazy = kwargs.get("lazy", False) or components is not None
+        self.__numProc = kwargs.get("numProc", 1)
+        memoSize = kwargs.get("memoSize", 0)
+        self.__memo = TaxonomyLruCache(memoSize) if memoSize else None
+        statsHook = kwargs.get("statsHook", None)
+        self.__stats = TaxonomyStats(hook=statsHook) if kwargs.get("instrument", False) or statsHook else None
+        self.__memoryBudget = kwargs.get("memoryBudget", None)
         #
         self.__urlTarget = kwargs.get("ncbiTaxonomyUrl", "https://ftp.ncbi.nlm.nih.gov/pub/taxonomy/taxdump.tar.gz")
+        self.__md5UrlTarget = kwargs.get("ncbiTaxonomyMd5Url", None)
+        self.__conditionalFetch = kwargs.get("conditionalFetch", False)
         #
         self.__mU = MarshalUtil(workPath=self.__taxDirPath)
         #
         self.__nodeD = {}
         self.__nameD = {}
         self.__mergeD = {}
-        self.__childD = {}
-        self.__taxIdToNameD = {}
-        self.__graph = None
+        self.__nodeStore = None
+        self.__nameStore = None
+        self.__lcaIndex = None
+        self.__intervalIndex = None
+        self.__batchQuery = None
+        self.__rankedLineage = None
+        self.__organismNameIndex = None
+        self.__nameMatcher = None
+        self.__componentPathD = {}
+        self.__sharedMemory = None
+        self.__sharedSectionD = {}
+        self.__sharedMemoryOwner = False
+        # per-structure locks serializing the lazy loading (or building) of each data component and derived structure
+        self.__lockD = {cN: threading.RLock() for cN in ["names", "nodes", "merged"] + DERIVED_COMPONENTS + ["batchQuery"]}
         #
-        self.__nameD, self.__nodeD, self.__mergeD = self.__reload(self.__urlTarget, self.__taxDirPath, useCache=useCache)
+        sharedMemoryName = kwargs.get("sharedMemoryName", None)
+        with self.__phase("load"):
+            if sharedMemoryName:
+                self.__nameD, self.__nodeD, self.__mergeD = self.__attachSharedMemory(sharedMemoryName)
+            else:
+                self.__nameD, self.__nodeD, self.__mergeD = self.__reload(self.__urlTarget, self.__taxDirPath, useCache=useCache)
+            if components:
+                self.loadComponents(components)
+        if self.__memoryBudget is not None:
+            totalBytes = self.getMemoryReport()["totalBytes"]
+            if totalBytes > self.__memoryBudget:
+                logger.warning("Taxonomy data (%d bytes) exceed the memory budget (%d bytes)", totalBytes, self.__memoryBudget)
+        if self.__stats is not None:
+            self.__instrumentMethods()
+            self.__stats.publish()
+
+    def loadComponents(self, components):
+        """Load (or build) the input data components now rather than on first use.
+
+        Args:
+            components (list): subset of ["names", "nodes", "merged", "nodeStore", "nameStore", "lcaIndex", "intervalIndex", "rankedLineage", "nameMap", "nameMatcher"]
+                               ("children" is an alias for "nodeStore")
+
+        Returns:
+            bool: True for success or False otherwise
+        """
+        ok = True
+        lazyD = {"names": self.__nameD, "nodes": self.__nodeD, "merged": self.__mergeD}
+        getterD = {
+            "nodeStore": self.__getNodeStore,
+            "children": self.__getNodeStore,
+            "nameStore": self.__getNameStore,
+            "lcaIndex": self.__getLcaIndex,
+            "intervalIndex": self.__getIntervalIndex,
+            "rankedLineage": self.__getRankedLineage,
+            "nameMap": self.__getOrganismNameIndex,
+            "nameMatcher": self.__getNameMatcher,
+        }
+        for component in components:
+            if component in lazyD:
+                if isinstance(lazyD[component], _LazyComponent):
+                    ok = bool(self.__loadComponent(component)) and ok
+            elif component in getterD:
+                try:
+                    ok = getterD[component]() is not None and ok
+                except MemoryError as e:
+                    logger.warning("Not loading taxonomy %s component (%s)", component, str(e))
+                    ok = False
+            else:
+                logger.error("Unknown taxonomy data component %r", component)
+                ok = False
+        return ok
+
+    def releaseComponents(self, components=None):
+        """Release optional derived structures (reopened from the cache, or rebuilt, on next use).
+
+        Structures read in place from shared memory are not released.
+
+        Args:
+            components (list, optional): subset of ["lcaIndex", "intervalIndex", "rankedLineage", "nameMap", "nameMatcher"]. Defaults to all.
+
+        Returns:
+            bool: True for success or False otherwise
+        """
+        ok = True
+        for component in components if components is not None else RELEASABLE_COMPONENTS:
+            if component not in RELEASABLE_COMPONENTS:
+                logger.error("Taxonomy data component %r cannot be released", component)
+                ok = False
+                continue
+            with self.__lockD[component]:
+                if self.__getMemoryUsageD(components=[component]).get(component, {}).get("backing") != "shared":
+                    self.__releaseComponent(component)
+        return ok
+
+    def getMemoryReport(self):
+        """Return an estimated byte breakdown of the data components and derived structures held by this provider.
+
+        In-memory dictionaries (and the lineage memo) are estimated from a sample of their items, array-backed
+        structures report the size of their arrays.  Memory-mapped arrays are paged in from the cache files
+        on access (and may be reclaimed by the operating system).  Shared memory arrays are owned by the
+        publishing provider and are not included in the total.
+
+        Returns:
+            dict: {"components": {<component>: {"bytes": ..., "backing": "heap"|"mapped"|"shared"|"view"}, ...},
+                   "heapBytes": ..., "mappedBytes": ..., "sharedBytes": ..., "totalBytes": <heap and mapped bytes>,
+                   "memoryBudget": <bytes or None>}
+        """
+        usageD = self.__getMemoryUsageD()
+        reportD = {"components": usageD}
+        for backing in ["heap", "mapped", "shared"]:
+            reportD[backing + "Bytes"] = sum(uD["bytes"] for uD in usageD.values() if uD["backing"] == backing)
+        reportD["totalBytes"] = reportD["heapBytes"] + reportD["mappedBytes"]
+        reportD["memoryBudget"] = self.__memoryBudget
+        return reportD
+
+    def __getMemoryUsageD(self, components=None):
+        """Return {component: {"bytes": ..., "backing": ...}, ...} for the loaded (or the input loaded) components."""
+        usageD = {}
+        for cN, cD in [("names", self.__nameD), ("nodes", self.__nodeD), ("merged", self.__mergeD)]:
+            if (components is None or cN in components) and not isinstance(cD, _LazyComponent):
+                # (dictionaries rather than views over the stores)
+                usageD[cN] = {"bytes": _estimateMappingBytes(cD), "backing": "heap"} if isinstance(cD, dict) else {"bytes": 0, "backing": "view"}
+        for cN, obj in [
+            ("nodeStore", self.__nodeStore),
+            ("nameStore", self.__nameStore),
+            ("lcaIndex", self.__lcaIndex),
+            ("intervalIndex", self.__intervalIndex),
+            ("rankedLineage", self.__rankedLineage),
+            ("nameMap", self.__organismNameIndex),
+            ("nameMatcher", self.__nameMatcher),
+            ("batchQuery", self.__batchQuery),
+        ]:
+            if (components is None or cN in components) and obj is not None:
+                usageD[cN] = obj.memoryUsage()
+                # (an attached provider maps only the shared memory block)
+                if usageD[cN]["backing"] == "mapped" and self.__sharedMemory is not None and not self.__sharedMemoryOwner:
+                    usageD[cN]["backing"] = "shared"
+        if (components is None or "memo" in components) and self.__memo is not None:
+            sampleL = self.__memo.sample(1000)
+            sampleBytes = sum(_estimateObjectBytes(ky) + _estimateObjectBytes(val) for ky, val in sampleL)
+            usageD["memo"] = {"bytes": int(sampleBytes * len(self.__memo) / len(sampleL)) if sampleL else 0, "backing": "heap"}
+        return usageD
+
+    def __reserveMemory(self, component, storePath):
+        """Release other optional structures if opening or building component would exceed the memory budget, or refuse (MemoryError)."""
+        isAttached = self.__sharedMemory is not None and not self.__sharedMemoryOwner
+        if not isAttached and self.__mU.exists(storePath):
+            projectedBytes = os.path.getsize(storePath)
+        else:
+            projectedBytes = PROJECTED_BYTES_PER_NODE[component] * len(self.__nodeStore if self.__nodeStore is not None else self.__getNameStore())
+        usageD = self.__getMemoryUsageD()
+        totalBytes = sum(uD["bytes"] for uD in usageD.values() if uD["backing"] in ["heap", "mapped"])
+        keepL = [component]
+        releaseL = []
+        for cN in RELEASABLE_COMPONENTS:
+            if totalBytes + projectedBytes <= self.__memoryBudget:
+                break
+            if cN in keepL or cN not in usageD or usageD[cN]["backing"] == "shared":
+                continue
+            releaseL.append(cN)
+            totalBytes -= usageD[cN]["bytes"] + (usageD["batchQuery"]["bytes"] if cN == "lcaIndex" and "batchQuery" in usageD else 0)
+        if totalBytes + projectedBytes > self.__memoryBudget:
+            if self.__stats is not None:
+                self.__stats.count("memoryBudgetRefusals")
+            raise MemoryError("Taxonomy %s (%d bytes) would exceed the memory budget (%d bytes)" % (component, projectedBytes, self.__memoryBudget))
+        for cN in releaseL:
+            # (a structure being loaded by another thread is left in place)
+            if self.__lockD[cN].acquire(blocking=False):
+                try:
+                    self.__releaseComponent(cN)
+                finally:
+                    self.__lockD[cN].release()
+                logger.info("Released taxonomy %s to keep within the memory budget (%d bytes)", cN, self.__memoryBudget)
+                if self.__stats is not None:
+                    self.__stats.count("memoryBudgetReleases")
+
+    def __releaseComponent(self, component):
+        if component == "lcaIndex":
+            # (the batch query arrays are views over the LCA index)
+            self.__batchQuery = None
+            self.__lcaIndex = None
+        elif component == "intervalIndex":
+            self.__intervalIndex = None
+        elif component == "rankedLineage":
+            self.__rankedLineage = None
+        elif component == "nameMap":
+            self.__organismNameIndex = None
+        elif component == "nameMatcher":
+            self.__nameMatcher = None
+
+    def warmup(self, components=None, numThreads=1):
+        """Load (or build) data components in background threads rather than on first use.
+
+        Each component is loaded once - methods needing a component that is being loaded wait for it.
+
+        Args:
+            components (list, optional): data components (see loadComponents()). Defaults to all derived structures except "nameMatcher".
+            numThreads (int, optional): number of threads loading components concurrently. Defaults to 1.
+
+        Returns:
+            concurrent.futures.Future: future completed when all components are loaded with result {component: True|False, ...}
+        """
+        components = list(dict.fromkeys(components)) if components is not None else [cN for cN in DERIVED_COMPONENTS if cN != "nameMatcher"]
+        warmupFuture = concurrent.futures.Future()
+        if not components:
+            warmupFuture.set_result({})
+            return warmupFuture
+        startTime = time.time()
+        resultD = {}
+        lock = threading.Lock()
+
+        def loadOne(component):
+            try:
+                return self.loadComponents([component])
+            except Exception as e:
+                self.__countException("warmup")
+                logger.exception("Failing to load taxonomy %s component with %s", component, str(e))
+            return False
+
+        def onDone(component, future):
+            with lock:
+                resultD[component] = future.result()
+                isDone = len(resultD) == len(components)
+            if isDone:
+                logger.info("Taxonomy warmup of %r completed (%.4f seconds)", components, time.time() - startTime)
+                warmupFuture.set_result({cN: resultD[cN] for cN in components})
+
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=max(1, numThreads), thread_name_prefix="taxonomy-warmup")
+        for component in components:
+            executor.submit(loadOne, component).add_done_callback(lambda future, component=component: onDone(component, future))
+        executor.shutdown(wait=False)
+        return warmupFuture
+
+    def getStats(self):
+        """Return the instrumentation snapshot (see TaxonomyStats) or {} if instrumentation is disabled.
+
+        Returns:
+            dict: {"methods": {<method>: {"calls": ..., "misses": <see INSTRUMENTED_METHODS>, "exceptions": ..., "totalSeconds": ..., "maxSeconds": ...,
+                   "histogram": {...}}, ...}, "counters": {"mergedRedirects": ..., "exceptions": ..., "exceptions.<method>": ...},
+                   "phases": {<phase>: {"count": ..., "totalSeconds": ..., "lastSeconds": ...}, ...}}
+        """
+        return self.__stats.getStats() if self.__stats is not None else {}
+
+    def resetStats(self):
+        """Clear the instrumentation statistics."""
+        if self.__stats is not None:
+            self.__stats.reset()
+
+    def publishStats(self):
+        """Pass the instrumentation snapshot to the stats hook (see statsHook) and return it."""
+        return self.__stats.publish() if self.__stats is not None else {}
+
+    def __instrumentMethods(self):
+        """Replace the query methods of this instance (see INSTRUMENTED_METHODS) with instrumented wrappers."""
+        missD = {"none": isNoneResult, "empty": isEmptyResult, "unknownTaxId": self.__isUnknownTaxIdResult}
+        for name, missType in INSTRUMENTED_METHODS.items():
+            setattr(self, name, self.__stats.wrap(name, getattr(self, name), isMiss=missD[missType]))
+
+    def __isUnknownTaxIdResult(self, result, taxId, *args, **kwargs):  # pylint: disable=unused-argument
+        """Miss predicate - a False result for a taxId (merged identifiers are resolved) missing from the taxonomy."""
+        if result:
+            return False
+        try:
+            return self.__getNodeIndex(self.__mergeD.get(taxId, taxId)) < 0
+        except Exception:
+            return True
+
+    def __phase(self, name):
+        """Return a context manager timing the named load or build phase (if instrumentation is enabled)."""
+        return self.__stats.phase(name) if self.__stats is not None else contextlib.nullcontext()
+
+    def __countException(self, name):
+        if self.__stats is not None:
+            self.__stats.countException(name)
+
+    def __resolveMergedTaxId(self, taxId):
+        """Return the taxonomy identifier replacing the input (merged) taxId or the input taxId."""
+        if isinstance(taxId, int) and taxId in self.__mergeD:
+            if self.__stats is not None:
+                self.__stats.count("mergedRedirects")
+            return self.__mergeD[taxId]
+        return taxId
+
+    def getMemoStats(self):
+        """Return the lineage memo counters.
+
+        Returns:
+            dict: {"hits": ..., "misses": ..., "evictions": ..., "size": ..., "maxSize": ...} or {} if memoization is disabled
+        """
+        return self.__memo.getStats() if self.__memo is not None else {}
+
+    def clearMemo(self):
+        """Remove all memoized lineage results."""
+        if self.__memo is not None:
+            self.__memo.clear()
+
+    def getLoadedComponents(self):
+        """Return the list of data components currently held in memory."""
+        cL = [cN for cN, cD in [("names", self.__nameD), ("nodes", self.__nodeD), ("merged", self.__mergeD)] if not isinstance(cD, _LazyComponent)]
+        if self.__nodeStore is not None:
+            cL.append("nodeStore")
+        if self.__nameStore is not None:
+            cL.append("nameStore")
+        if self.__lcaIndex is not None:
+            cL.append("lcaIndex")
+        if self.__intervalIndex is not None:
+            cL.append("intervalIndex")
+        if self.__rankedLineage is not None:
+            cL.append("rankedLineage")
+        if self.__organismNameIndex is not None:
+            cL.append("nameMap")
+        if self.__nameMatcher is not None:
+            cL.append("nameMatcher")
+        return cL
+
+    def __loadComponent(self, component):
+        """Load a cached data component on first access and replace its lazy placeholder (once - concurrent callers wait)."""
+        with self.__lockD[component]:
+            cD = {"names": self.__nameD, "nodes": self.__nodeD, "merged": self.__mergeD}[component]
+            if not isinstance(cD, _LazyComponent):
+                return cD
+            with self.__phase("cacheLoad." + component):
+                return self.__loadComponentData(component)
+
+    def __loadComponentData(self, component):
+        filePath = self.__componentPathD[component]
+        if component == "nodes" and self.__openCachedStore("nodeStore", self.__componentPathD["nodeStore"]):
+            cD = self.__nodeStore.nodeD
+        elif component == "names" and self.__openCachedStore("nameStore", self.__componentPathD["nameStore"]):
+            cD = self.__nameStore.nameD
+        else:
+            cD = self.__mU.doImport(filePath, fmt="pickle") if self.__mU.exists(filePath) else None
+            cD = cD if cD else {}
+        logger.info("Loaded taxonomy %s component (%d)", component, len(cD))
+        if component == "names":
+            self.__nameD = cD
+        elif component == "nodes":
+            self.__nodeD = cD
+        elif component == "merged":
+            self.__mergeD = cD
+        return cD
 
     def testCache(self):
         # Lengths name 2133961 node 2133961 merge 54768
@@ -66,103 +553,226 @@ class TaxonomyProvider(StashableBase):
         return False
 
     def getTaxId(self, organismName):
-        if not self.__taxIdToNameD:
-            self.__buildTaxIdNameMap()
         try:
-            ret = self.__taxIdToNameD[organismName.strip().upper()]
+            return self.__getOrganismNameIndex().taxId(organismName)
+        except MemoryError:
+            raise
         except Exception:
-            ret = None
-        return ret
+            self.__countException("getTaxId")
+        return None
 
-    def __buildTaxIdNameMap(self):
-        tD = {}
-        for taxId, nmD in self.__nameD.items():
-            try:
-                tD[nmD["sn"].strip().upper()] = taxId
-                tD[nmD["alt"].strip().upper()] = taxId
-                for nm in sorted(set(self.__nameD[int(taxId)]["cn"])):
-                    tD[nm.strip().upper()] = taxId
-            except Exception:
-                pass
-        self.__taxIdToNameD = tD
+    def getNameTaxIds(self, organismName):
+        """Return all taxonomy identifiers carrying the input scientific, alternate or common name (case insensitive).
+
+        Args:
+            organismName (str): organism name
+
+        Returns:
+            list: taxonomy identifiers (the identifier returned by getTaxId() first) or [] if the name is not found
+        """
+        try:
+            return self.__getOrganismNameIndex().taxIds(organismName)
+        except MemoryError:
+            raise
+        except Exception:
+            self.__countException("getNameTaxIds")
+        return []
+
+    def isAmbiguousName(self, organismName):
+        """Return True if the input organism name (case insensitive) is carried by more than one taxon."""
+        try:
+            return self.__getOrganismNameIndex().isAmbiguous(organismName)
+        except MemoryError:
+            raise
+        except Exception:
+            self.__countException("isAmbiguousName")
+        return False
+
+    def resolveOrganismNames(self, organismNames=None, filePath=None, numProc=None, batchSize=200000):
+        """Generate the taxonomy identifiers of organism names in bulk (names are deduplicated and normalized once per batch).
+
+        With numProc > 1, distinct names are resolved in a process pool whose workers memory-map the cached name index.
+
+        Args:
+            organismNames (iterable, optional): organism names. Defaults to None.
+            filePath (str, optional): text file (plain or gzipped) with one organism name per line. Defaults to None.
+            numProc (int, optional): number of worker processes. Defaults to the numProc provider setting.
+            batchSize (int, optional): number of input names read (and deduplicated) per batch. Defaults to 200000.
+
+        Yields:
+            tuple: (organismName, taxId, status) in input order, where status is "resolved", "ambiguous" (taxId is the
+                   identifier returned by getTaxId()) or "unresolved" (taxId is None)
+        """
+        nameIndex = self.__getOrganismNameIndex()
+        isAttached = self.__sharedMemory is not None and not self.__sharedMemoryOwner
+        indexPath = self.__getCachePathD(self.__taxDirPath)["nameMap"]
+        tnR = TaxonomyNameResolver(
+            nameIndex=nameIndex,
+            filePath=indexPath if not isAttached and self.__mU.exists(indexPath) else None,
+            numProc=numProc if numProc is not None else self.__numProc,
+            batchSize=batchSize,
+        )
+        if filePath:
+            yield from tnR.resolveFile(filePath)
+        else:
+            yield from tnR.resolve(organismNames if organismNames is not None else [])
+
+    def matchOrganismName(self, organismName, maxResults=5, minScore=0.8):
+        """Return the taxa with scientific, alternate or common names approximately matching the input organism name.
+
+        Names are compared ignoring case and ASCII punctuation, candidates sharing trigrams with the input name
+        are scored by edit distance (score = 1 - distance / max(length)).  The trigram index is built from all
+        scientific, alternate and common names on first use and cached.
+
+        Args:
+            organismName (str): organism name (e.g. a submitted source organism name)
+            maxResults (int, optional): maximum number of returned matches. Defaults to 5.
+            minScore (float, optional): minimum match score in (0, 1]. Defaults to 0.8.
+
+        Returns:
+            list: [{"taxId": ..., "name": <matched normalized name>, "score": ...}, ...] by decreasing score (at most one match per taxon)
+        """
+        try:
+            return self.__getNameMatcher().match(organismName, maxResults=maxResults, minScore=minScore)
+        except MemoryError:
+            raise
+        except Exception as e:
+            self.__countException("matchOrganismName")
+            logger.exception("Failing for %r with %s", organismName, str(e))
+        return []
+
+    def matchOrganismNameList(self, organismNameList, maxResults=5, minScore=0.8):
+        """Return the approximate match lists for the input organism names (see matchOrganismName())."""
+        try:
+            return self.__getNameMatcher().matchList(organismNameList, maxResults=maxResults, minScore=minScore)
+        except MemoryError:
+            raise
+        except Exception as e:
+            self.__countException("matchOrganismNameList")
+            logger.exception("Failing with %s", str(e))
+        return [[] for _ in organismNameList]
 
     def getMergedTaxId(self, taxId):
         try:
-            taxId = self.__mergeD[int(taxId)] if isinstance(taxId, int) and int(taxId) in self.__mergeD else taxId
+            taxId = self.__resolveMergedTaxId(taxId)
         except Exception:
-            pass
+            self.__countException("getMergedTaxId")
         return taxId
 
     def getRank(self, taxId):
+        rank = None
         try:
-            rank = self.__nodeD[int(taxId)][1] if isinstance(taxId, int) and int(taxId) in self.__nodeD else None
+            nS = self.__getNodeStore()
+            idx = nS.index(taxId)
+            rank = nS.rank(idx) if idx >= 0 else None
         except Exception:
-            pass
+            self.__countException("getRank")
         return rank
 
     def getScientificName(self, taxId):
         try:
-            taxId = self.__mergeD[int(taxId)] if isinstance(taxId, int) and int(taxId) in self.__mergeD else taxId
-            return self.__nameD[int(taxId)]["sn"]
+            taxId = self.__resolveMergedTaxId(taxId)
+            idx = self.__getNameIndex(taxId)
+            return self.__nameStore.scientificName(idx) if idx >= 0 else None
         except Exception:
-            pass
+            self.__countException("getScientificName")
         return None
 
     def getParentScientificName(self, taxId, depth=1):
         """Return the scientific name for the parent of the input taxId at the input lineage depth."""
+        if self.__memo is not None:
+            return self.__memo.getOrCompute(("parentScientificName", taxId, depth), self.__getParentScientificName, taxId, depth)
+        return self.__getParentScientificName(taxId, depth)
+
+    def __getParentScientificName(self, taxId, depth):
         try:
-            taxId = self.__mergeD[int(taxId)] if isinstance(taxId, int) and int(taxId) in self.__mergeD else taxId
+            taxId = self.__resolveMergedTaxId(taxId)
             iL = self.getLineage(taxId)
             tId = iL[depth]
-            return self.__nameD[int(tId)]["sn"]
+            idx = self.__getNameIndex(tId)
+            return self.__nameStore.scientificName(idx) if idx >= 0 else None
         except Exception:
-            pass
+            self.__countException("getParentScientificName")
         return None
 
     def getAlternateName(self, taxId):
         """Approximately, the preferred common name."""
         try:
-            taxId = self.__mergeD[int(taxId)] if isinstance(taxId, int) and int(taxId) in self.__mergeD else taxId
-            return self.__nameD[int(taxId)]["alt"]
+            taxId = self.__resolveMergedTaxId(taxId)
+            idx = self.__getNameIndex(taxId)
+            return self.__nameStore.alternateName(idx) if idx >= 0 else None
         except Exception:
-            pass
+            self.__countException("getAlternateName")
         return None
 
     def getCommonNames(self, taxId):
         try:
-            taxId = self.__mergeD[int(taxId)] if isinstance(taxId, int) and int(taxId) in self.__mergeD else taxId
-            return sorted(set(self.__nameD[int(taxId)]["cn"]))
+            taxId = self.__resolveMergedTaxId(taxId)
+            idx = self.__getNameIndex(taxId)
+            return self.__nameStore.sortedCommonNames(idx) if idx >= 0 and self.__nameStore.hasCommonNames(idx) else None
         except Exception:
-            pass
+            self.__countException("getCommonNames")
         return None
 
     def getParentTaxid(self, taxId):
         try:
-            taxId = self.__mergeD[int(taxId)] if isinstance(taxId, int) and int(taxId) in self.__mergeD else taxId
-            return self.__nodeD[int(taxId)][0]
+            taxId = self.__resolveMergedTaxId(taxId)
+            idx = self.__getNodeIndex(taxId)
+            return self.__nodeStore.parentTaxId(idx) if idx >= 0 else None
         except Exception:
-            pass
+            self.__countException("getParentTaxid")
         return None
 
     def getLineage(self, taxId):
+        """Return the list of taxonomy identifiers in the lineage of the input taxId (top down, ending with taxId).
+
+        With memoization enabled (memoSize=N) the result is a memoized tuple.
+        """
+        if self.__memo is not None:
+            return self.__memo.getOrCompute(("lineage", taxId), lambda: tuple(self.__getLineage(taxId)))
+        return self.__getLineage(taxId)
+
+    def __getLineage(self, taxId):
         pList = []
         try:
-            taxId = self.__mergeD[int(taxId)] if isinstance(taxId, int) and int(taxId) in self.__mergeD else taxId
+            taxId = self.__resolveMergedTaxId(taxId)
             pList.append(taxId)
-            pt = self.getParentTaxid(taxId)
-            while (pt is not None) and (pt != 1):
-                pList.append(pt)
-                pt = self.getParentTaxid(pt)
+            idx = self.__getNodeIndex(taxId)
+            if idx >= 0:
+                nS = self.__nodeStore
+                iL = nS.lineageIndices(idx)
+                pt = None
+                for ii in iL[1:]:
+                    pt = nS.taxId(ii)
+                    if pt == 1:
+                        break
+                    pList.append(pt)
+                else:
+                    # lineage ends below a parent missing from the node table
+                    pt = nS.parentTaxId(iL[-1]) if nS.parentIndex(iL[-1]) < 0 else None
+                    while (pt is not None) and (pt != 1):
+                        pList.append(pt)
+                        pt = self.getParentTaxid(pt)
         except Exception as e:
+            self.__countException("getLineage")
             logger.exception("Failing with %s", str(e))
         #
         pList.reverse()
         return pList
 
     def getLineageWithNames(self, taxId):
+        """Return the list of (depth, taxId, name) tuples for the scientific and common names in the lineage of the input taxId.
+
+        With memoization enabled (memoSize=N) the result is a memoized tuple.
+        """
+        if self.__memo is not None:
+            return self.__memo.getOrCompute(("lineageWithNames", taxId), lambda: tuple(self.__getLineageWithNames(taxId)))
+        return self.__getLineageWithNames(taxId)
+
+    def __getLineageWithNames(self, taxId):
         rL = []
         try:
-            taxId = self.__mergeD[int(taxId)] if isinstance(taxId, int) and int(taxId) in self.__mergeD else taxId
+            taxId = self.__resolveMergedTaxId(taxId)
             pTaxIdL = self.getLineage(taxId)
             for ii, pTaxId in enumerate(pTaxIdL, 1):
                 nmL = [self.getScientificName(pTaxId)]
@@ -175,6 +785,7 @@ class TaxonomyProvider(StashableBase):
                 for nm in nmL:
                     rL.append((ii, pTaxId, nm))
         except Exception as e:
+            self.__countException("getLineageWithNames")
             logger.exception("Failing with %s", str(e))
         #
         return rL
@@ -183,7 +794,7 @@ class TaxonomyProvider(StashableBase):
         """Return a list of tuples containing taxid & scientific name for
         parents of the input taxid.
         """
-        taxId = self.__mergeD[int(taxId)] if isinstance(taxId, int) and int(taxId) in self.__mergeD else taxId
+        taxId = self.__resolveMergedTaxId(taxId)
         pList = []
         pt = self.getParentTaxid(taxId)
         while (pt is not None) and (pt != "1"):
@@ -195,81 +806,127 @@ class TaxonomyProvider(StashableBase):
     ##
 
     def getLineageScientificNames(self, taxId):
+        """Return the list of scientific names in the lineage of the input taxId.
+
+        With memoization enabled (memoSize=N) the result is a memoized tuple.
+        """
+        if self.__memo is not None:
+            return self.__memo.getOrCompute(("lineageScientificNames", taxId), lambda: tuple(self.__getLineageScientificNames(taxId)))
+        return self.__getLineageScientificNames(taxId)
+
+    def __getLineageScientificNames(self, taxId):
         nmL = []
         try:
-            taxId = self.__mergeD[int(taxId)] if isinstance(taxId, int) and int(taxId) in self.__mergeD else taxId
+            taxId = self.__resolveMergedTaxId(taxId)
             lineage = self.getLineage(taxId)
             nmL = [self.getScientificName(taxid) for taxid in lineage]
         except Exception as e:
+            self.__countException("getLineageScientificNames")
             logger.exception("Failing for taxId %r with %s", taxId, str(e))
         return nmL
 
-    def __getLineageD(self, taxId):
-        pD = {}
-        try:
-            taxId = self.__mergeD[int(taxId)] if isinstance(taxId, int) and int(taxId) in self.__mergeD else taxId
-            pD[taxId] = True
-            pt = self.getParentTaxid(taxId)
-            while (pt is not None) and (pt != 1):
-                pD[pt] = True
-                pt = self.getParentTaxid(pt)
-        except Exception as e:
-            logger.exception("Failing with %s", str(e))
-        return pD
+    def isDescendantOf(self, taxId, ancestorTaxId):
+        """Return True if the input taxId is ancestorTaxId or lies in the subtree of ancestorTaxId.
 
-    def isBacteria(self, taxId):
+        Args:
+            taxId (int): taxonomy identifier (merged identifiers are resolved)
+            ancestorTaxId (int): taxonomy identifier of the putative ancestor (merged identifiers are resolved)
+
+        Returns:
+            bool: True if taxId descends from ancestorTaxId or False otherwise
+        """
         try:
-            lineage = self.__getLineageD(taxId)
-            return True if 2 in lineage else False
+            idx = self.__getNodeIndex(self.getMergedTaxId(taxId))
+            ancestorIdx = self.__getNodeIndex(self.getMergedTaxId(ancestorTaxId))
+            return idx >= 0 and ancestorIdx >= 0 and self.__isDescendantIndex(self.__getOptionalIndex(self.__getIntervalIndex), idx, ancestorIdx)
         except Exception as e:
-            logger.exception("Failing for taxId %r with %s", taxId, str(e))
+            self.__countException("isDescendantOf")
+            logger.exception("Failing for taxId %r ancestor %r with %s", taxId, ancestorTaxId, str(e))
         return False
 
-    def isEukaryota(self, taxId):
+    def isDescendantOfList(self, taxIdList, ancestorTaxId):
+        """Return the list of descendant tests (see isDescendantOf()) for the input list of taxonomy identifiers.
+
+        Args:
+            taxIdList (list): taxonomy identifiers
+            ancestorTaxId (int): taxonomy identifier of the putative ancestor
+
+        Returns:
+            list: [bool, ...] in input order
+        """
         try:
-            taxId = self.__mergeD[int(taxId)] if isinstance(taxId, int) and int(taxId) in self.__mergeD else taxId
-            lineage = self.__getLineageD(taxId)
-            return True if 2759 in lineage else False
+            intervalIndex = self.__getOptionalIndex(self.__getIntervalIndex)
+            ancestorIdx = self.__getNodeIndex(self.getMergedTaxId(ancestorTaxId))
+            if ancestorIdx < 0:
+                return [False] * len(taxIdList)
+            rL = []
+            for taxId in taxIdList:
+                idx = self.__getNodeIndex(self.getMergedTaxId(taxId))
+                rL.append(idx >= 0 and self.__isDescendantIndex(intervalIndex, idx, ancestorIdx))
+            return rL
         except Exception as e:
-            logger.exception("Failing for taxId %r with %s", taxId, str(e))
-        return False
+            self.__countException("isDescendantOfList")
+            logger.exception("Failing for ancestor %r with %s", ancestorTaxId, str(e))
+        return [False] * len(taxIdList)
 
-    def isVirus(self, taxId):
+    def getDomainClass(self, taxId):
+        """Return the top level taxonomy class of the input taxId.
+
+        Args:
+            taxId (int): taxonomy identifier (merged identifiers are resolved)
+
+        Returns:
+            str: one of "bacteria", "archaea", "eukaryota", "virus", "other" or "unclassified" or None
+        """
+        return self.getDomainClassList([taxId])[0]
+
+    def getDomainClassList(self, taxIdList):
+        """Return the top level taxonomy class (see getDomainClass()) for the input list of taxonomy identifiers.
+
+        Args:
+            taxIdList (list): taxonomy identifiers
+
+        Returns:
+            list: [domain class or None, ...] in input order
+        """
+        rL = []
         try:
-            taxId = self.__mergeD[int(taxId)] if isinstance(taxId, int) and int(taxId) in self.__mergeD else taxId
-            lineage = self.__getLineageD(taxId)
-            return True if 10239 in lineage else False
+            intervalIndex = self.__getOptionalIndex(self.__getIntervalIndex)
+            domainL = [(domainClass, self.__getNodeIndex(domainTaxId)) for domainClass, domainTaxId in DOMAIN_CLASS_TAXIDS]
+            domainL = [(domainClass, domainIdx) for domainClass, domainIdx in domainL if domainIdx >= 0]
+            for taxId in taxIdList:
+                idx = self.__getNodeIndex(self.getMergedTaxId(taxId))
+                rL.append(next((domainClass for domainClass, domainIdx in domainL if self.__isDescendantIndex(intervalIndex, idx, domainIdx)), None) if idx >= 0 else None)
         except Exception as e:
-            logger.exception("Failing for taxId %r with %s", taxId, str(e))
-        return False
+            self.__countException("getDomainClassList")
+            logger.exception("Failing with %s", str(e))
+            rL = [None] * len(taxIdList)
+        return rL
+
+    def __isDescendantIndex(self, intervalIndex, idx, ancestorIdx):
+        """Return True if node idx is node ancestorIdx or lies in its subtree (over the node store lineage if there is no interval index)."""
+        if intervalIndex is not None:
+            return intervalIndex.isDescendant(idx, ancestorIdx)
+        return ancestorIdx in self.__getNodeStore().lineageIndices(idx)
+
+    def isBacteria(self, taxId):
+        return self.isDescendantOf(taxId, 2)
+
+    def isEukaryota(self, taxId):
+        return self.isDescendantOf(taxId, 2759)
+
+    def isVirus(self, taxId):
+        return self.isDescendantOf(taxId, 10239)
 
     def isArchaea(self, taxId):
-        try:
-            taxId = self.__mergeD[int(taxId)] if isinstance(taxId, int) and int(taxId) in self.__mergeD else taxId
-            lineage = self.__getLineageD(taxId)
-            return True if 2157 in lineage else False
-        except Exception as e:
-            logger.exception("Failing for taxId %r with %s", taxId, str(e))
-        return False
+        return self.isDescendantOf(taxId, 2157)
 
     def isOther(self, taxId):
         """other/synthetic"""
-        try:
-            taxId = self.__mergeD[int(taxId)] if isinstance(taxId, int) and int(taxId) in self.__mergeD else taxId
-            lineage = self.__getLineageD(taxId)
-            return True if 28384 in lineage else False
-        except Exception as e:
-            logger.exception("Failing for taxId %r with %s", taxId, str(e))
-        return False
+        return self.isDescendantOf(taxId, 28384)
 
     def isUnclassified(self, taxId):
-        try:
-            taxId = self.__mergeD[int(taxId)] if isinstance(taxId, int) and int(taxId) in self.__mergeD else taxId
-            lineage = self.__getLineageD(taxId)
-            return True if 12908 in lineage else False
-        except Exception as e:
-            logger.exception("Failing for taxId %r with %s", taxId, str(e))
-        return False
+        return self.isDescendantOf(taxId, 12908)
 
     def exportNodeList(self, startTaxId=1, rootTaxId=1, filterD=None):
         """Test export taxonomy data in a particular node list data structure.
@@ -277,261 +934,754 @@ class TaxonomyProvider(StashableBase):
         Note: now excluding root node from node list.
 
         """
+        dL = []
         try:
-            dL = []
-            taxIdList = self.getBfsTraverseList(startTaxId)
-            logger.info("Full taxon list length %d", len(taxIdList))
-            if filterD:
-                taxIdList = [tId for tId in taxIdList if tId in filterD]
-            logger.info("Filtered taxon list length %d", len(taxIdList))
-            # rootTaxids = [131567, 10239, 28384, 12908]
-            for taxId in taxIdList:
-                sn = self.getScientificName(taxId)
-                altName = self.getAlternateName(taxId)
-                displayName = sn + " (" + altName + ")" if altName else sn
-                #
-                pTaxId = self.getParentTaxid(taxId)
-                #
-                if sn is None or not sn:
-                    logger.warning("Unexpected null taxon %r sn %r", taxId, sn)
-                #
-                # logger.debug("Scientific name (%d): %s (%r)" % (taxId, sn, altName))
-                #
-                if pTaxId == taxId:
-                    lL = []
-                else:
-                    lL = self.getLineage(taxId)[1:]
-
-                #
-                # d = {'id': taxId, 'name': displayName, 'lineage': lL, 'parents': [pTaxId], 'depth': len(lL)}
-                # d = {'id': str(taxId), 'name': displayName, 'lineage': [str(t) for t in lL], 'parents': [str(pTaxId)], 'depth': len(lL)}
-                #
-                if taxId == rootTaxId:
-                    continue
-                elif pTaxId == rootTaxId:
-                    dD = {"id": str(taxId), "name": displayName, "depth": 0}
-                else:
-                    dD = {"id": str(taxId), "name": displayName, "parents": [str(pTaxId)], "depth": len(lL)}
+            for dD in self.__iterNodeRecords(startTaxId, rootTaxId, filterD):
                 dL.append(dD)
+        except MemoryError:
+            raise
         except Exception as e:
+            self.__countException("exportNodeList")
             logger.exception("Failing with %s", str(e))
         #
         taxTreePath = os.path.join(self.__taxDirPath, "taxonomy_node_tree.json")
         self.__mU.doExport(taxTreePath, dL, fmt="json", indent=3)
         return dL
 
-    def getBfsTraverseList(self, startTaxId):
-        """Traverse the taxonomy nodes in bfs order starting from startTaxId."""
-        #
-        tL = []
-        visited = set([startTaxId])
-        queue = collections.deque(visited)
+    def exportNodeListStream(self, filePath=None, startTaxId=1, rootTaxId=1, filterD=None, fmt="json"):
+        """Write the node list data structure of exportNodeList() incrementally (one record at a time) to a file.
+
+        Args:
+            filePath (str, optional): output file path. Defaults to <taxDirPath>/taxonomy_node_tree.json (or .jsonl).
+            startTaxId (int, optional): taxonomy identifier at which the (breadth-first) export starts. Defaults to 1.
+            rootTaxId (int, optional): taxonomy identifier of the root (excluded from the export). Defaults to 1.
+            filterD (dict, optional): export only these taxonomy identifiers (only the filtered taxa and their lineages are visited). Defaults to None.
+            fmt (str, optional): "json" (JSON array, one record per line) or "jsonl" (JSON Lines). Defaults to "json".
+
+        Returns:
+            int: number of exported records or None on failure
+        """
+        if fmt not in ["json", "jsonl"]:
+            logger.error("Unsupported node list export format %r", fmt)
+            return None
+        filePath = filePath if filePath else os.path.join(self.__taxDirPath, "taxonomy_node_tree.%s" % fmt)
+        numRecords = 0
+        try:
+            self.__mU.mkdir(os.path.dirname(os.path.abspath(filePath)))
+            tmpPath = filePath + ".tmp"
+            with open(tmpPath, "w", encoding="utf-8") as ofh:
+                if fmt == "json":
+                    ofh.write("[")
+                for dD in self.__iterNodeRecords(startTaxId, rootTaxId, filterD):
+                    if fmt == "json":
+                        ofh.write(",\n" if numRecords else "\n")
+                        ofh.write(json.dumps(dD))
+                    else:
+                        ofh.write(json.dumps(dD) + "\n")
+                    numRecords += 1
+                if fmt == "json":
+                    ofh.write("\n]\n")
+            os.replace(tmpPath, filePath)
+            logger.info("Exported %d taxonomy node records to %s", numRecords, filePath)
+            return numRecords
+        except MemoryError:
+            raise
+        except Exception as e:
+            self.__countException("exportNodeListStream")
+            logger.exception("Failing exporting %r with %s", filePath, str(e))
+        return None
+
+    def __iterNodeRecords(self, startTaxId, rootTaxId, filterD):
+        """Generate the node list records of the breadth-first traversal from startTaxId (optionally limited to the taxa in filterD).
+
+        The depth of each record is derived from the depth of its parent in the traversal (or, for filtered
+        exports, from the LCA index depth relative to the start node) and the traversal visits only the
+        filtered taxa.  The root record (see __getNodeRecord()) is omitted.
+        """
+        nS = self.__getNodeStore()
+        sIdx = nS.index(startTaxId)
+        intervalIndex = self.__getOptionalIndex(self.__getIntervalIndex)
+        lcaIndex = self.__getOptionalIndex(self.__getLcaIndex) if filterD and intervalIndex is not None else None
+        if sIdx < 0 or (intervalIndex is not None and intervalIndex.preorder(sIdx) < 0):
+            # start is not a node of the table (e.g. a parent missing from the table)
+            taxIdList = self.getBfsTraverseList(startTaxId)
+            for taxId in taxIdList:
+                if not filterD or taxId in filterD:
+                    dD = self.__getNodeRecord(taxId, self.getParentTaxid(taxId), len(self.getLineage(taxId)) - 1, rootTaxId)
+                    if dD:
+                        yield dD
+            return
+        startDepth = len(self.getLineage(startTaxId)) - 1
+        if filterD and lcaIndex is None:
+            # (without the interval and LCA indices - select the filtered taxa from the breadth-first levels below the start node)
+            isFilteredA = np.zeros(len(nS), dtype=bool)
+            idxL = [nS.index(taxId) for taxId in filterD if isinstance(taxId, int)]
+            isFilteredA[[idx for idx in idxL if idx >= 0]] = True
+            for dist, levelA in enumerate(nS.bfsLevels([sIdx])):
+                # lineages exclude the synthetic root 1 (its children have depth 0)
+                dp = startDepth + dist - (1 if startTaxId == 1 and dist else 0)
+                for idx in levelA[isFilteredA[levelA]].tolist():
+                    dD = self.__getNodeRecord(nS.taxId(idx), nS.parentTaxId(idx), dp, rootTaxId)
+                    if dD:
+                        yield dD
+            return
+        if filterD:
+            # breadth-first order of the filtered subtree members is (depth, preorder position)
+            depth = lcaIndex.depth
+            idxL = [nS.index(taxId) for taxId in filterD if isinstance(taxId, int)]
+            idxL = sorted((idx for idx in idxL if idx >= 0 and intervalIndex.isDescendant(idx, sIdx)), key=lambda idx: (depth(idx), intervalIndex.preorder(idx)))
+            logger.info("Filtered taxon list length %d", len(idxL))
+            # lineages exclude the synthetic root 1 (its children have depth 0)
+            baseDepth = startDepth - depth(sIdx) - (1 if startTaxId == 1 else 0)
+            for idx in idxL:
+                taxId = nS.taxId(idx)
+                dD = self.__getNodeRecord(taxId, nS.parentTaxId(idx), startDepth if idx == sIdx else baseDepth + depth(idx), rootTaxId)
+                if dD:
+                    yield dD
+            return
+        queue = collections.deque([(sIdx, startDepth)])
         while queue:
-            taxId = queue.popleft()
-            tL.append(taxId)
-            for childTaxId in self.getChildren(taxId):
-                if childTaxId not in visited:
-                    queue.append(childTaxId)
-                    visited.add(childTaxId)
-        return tL
+            idx, dp = queue.popleft()
+            taxId = nS.taxId(idx)
+            dD = self.__getNodeRecord(taxId, nS.parentTaxId(idx), dp, rootTaxId)
+            if dD:
+                yield dD
+            # lineages exclude the synthetic root 1
+            cDp = 0 if taxId == 1 else dp + 1
+            queue.extend((cIdx, cDp) for cIdx in nS.childIndices(idx) if cIdx != idx)
+
+    def __getNodeRecord(self, taxId, pTaxId, depth, rootTaxId):
+        """Return the node list record for taxId (depth is the lineage length less one) or None for the root."""
+        if taxId == rootTaxId:
+            return None
+        sn = self.getScientificName(taxId)
+        altName = self.getAlternateName(taxId)
+        displayName = sn + " (" + altName + ")" if altName else sn
+        if sn is None or not sn:
+            logger.warning("Unexpected null taxon %r sn %r", taxId, sn)
+        if pTaxId == rootTaxId:
+            return {"id": str(taxId), "name": displayName, "depth": 0}
+        return {"id": str(taxId), "name": displayName, "parents": [str(pTaxId)], "depth": 0 if pTaxId == taxId else depth}
+
+    def getBfsTraverseList(self, startTaxId):
+        """Traverse the taxonomy nodes in bfs order starting from startTaxId (over the node store child adjacency arrays)."""
+        try:
+            return self.__getNodeStore().bfsTaxIds(startTaxId)
+        except Exception as e:
+            self.__countException("getBfsTraverseList")
+            logger.debug("For %r failing with %s", startTaxId, str(e))
+        return [startTaxId]
+
+    def getDescendants(self, taxId, rank=None, maxDepth=None, includeSelf=False):
+        """Return the descendants of the input taxId in depth-first (preorder) order.
+
+        The descendants are a contiguous slice of the DFS ordered interval index, optionally filtered
+        by rank and depth below taxId.
+
+        Args:
+            taxId (int): taxonomy identifier (merged identifiers are resolved)
+            rank (str, optional): return only descendants with this rank. Defaults to None.
+            maxDepth (int, optional): return only descendants at most maxDepth levels below taxId (1 for children). Defaults to None.
+            includeSelf (bool, optional): include taxId itself (depth 0). Defaults to False.
+
+        Returns:
+            np.ndarray: int64 taxonomy identifiers (empty for unknown identifiers) or None on failure
+        """
+        try:
+            intervalIndex = self.__getIntervalIndex()
+            idx = self.__getNodeIndex(self.getMergedTaxId(taxId))
+            if idx < 0 or intervalIndex.preorder(idx) < 0:
+                return np.zeros(0, dtype=np.int64)
+            start = intervalIndex.preorder(idx) + (0 if includeSelf else 1)
+            idxA = np.frombuffer(intervalIndex.section("order"), dtype=np.int32)[start : intervalIndex.preorder(idx) + intervalIndex.subtreeSize(idx)]
+            return self.__getBatchQuery().selectTaxIds(idxA, rank=rank, baseIndex=idx, maxDepth=maxDepth)
+        except MemoryError:
+            raise
+        except Exception as e:
+            self.__countException("getDescendants")
+            logger.exception("Failing for taxId %r with %s", taxId, str(e))
+        return None
+
+    def getSubtreeStats(self, taxId):
+        """Return the precomputed subtree statistics for the input taxId.
+
+        Args:
+            taxId (int): taxonomy identifier (merged identifiers are resolved)
+
+        Returns:
+            dict: {"size": number of taxa in the subtree (including taxId), "leaves": number of leaf taxa,
+                   "species": number of species rank taxa} or {} for unknown identifiers
+        """
+        try:
+            intervalIndex = self.__getOptionalIndex(self.__getIntervalIndex)
+            idx = self.__getNodeIndex(self.getMergedTaxId(taxId))
+            if idx >= 0 and intervalIndex is None:
+                return self.__getSubtreeWalkStats(idx)
+            if idx >= 0 and intervalIndex.preorder(idx) >= 0:
+                return {"size": intervalIndex.subtreeSize(idx), "leaves": intervalIndex.leafCount(idx), "species": intervalIndex.speciesCount(idx)}
+        except Exception as e:
+            self.__countException("getSubtreeStats")
+            logger.exception("Failing for taxId %r with %s", taxId, str(e))
+        return {}
+
+    def __getSubtreeWalkStats(self, idx):
+        """Return the subtree statistics (see getSubtreeStats()) of node idx from a breadth-first traversal of the node store."""
+        nS = self.__getNodeStore()
+        subtreeA = nS.bfsIndices([idx])
+        childStartA = np.frombuffer(nS.section("childStart"), dtype=np.int32)
+        # (the self-parented root is its own child)
+        numChildA = childStartA[subtreeA + 1] - childStartA[subtreeA] - (np.frombuffer(nS.section("parentIndex"), dtype=np.int32)[subtreeA] == subtreeA)
+        rankList = nS.getRankList()
+        speciesCode = rankList.index("species") if "species" in rankList else -1
+        numSpecies = int((np.frombuffer(nS.section("rank"), dtype=np.uint8)[subtreeA] == speciesCode).sum())
+        return {"size": len(subtreeA), "leaves": int((numChildA == 0).sum()), "species": numSpecies}
+
+    def getSubtreeSize(self, taxId):
+        """Return the number of taxa in the subtree of the input taxId (including taxId) or None."""
+        return self.getSubtreeStats(taxId).get("size")
+
+    def getLeafCount(self, taxId):
+        """Return the number of leaf taxa in the subtree of the input taxId or None."""
+        return self.getSubtreeStats(taxId).get("leaves")
+
+    def getSpeciesCount(self, taxId):
+        """Return the number of species rank taxa in the subtree of the input taxId (including taxId) or None."""
+        return self.getSubtreeStats(taxId).get("species")
 
     def getChildren(self, taxId):
         cL = []
         try:
-            self.__childD = self.__getAdjacentDecendants(self.__nodeD) if not self.__childD else self.__childD
-            cL = self.__childD[taxId]
+            cL = self.__getNodeStore().children(taxId)
         except Exception as e:
+            self.__countException("getChildren")
             logger.debug("For %r failing with %s", taxId, str(e))
         return cL
         #
 
-    def __getAdjacentDecendants(self, nodeD):
-        """Convert d[childTaxId] = (parentTaxid,rank) to d[parentTaxid] = [childTaxid, ... ]"""
-        cD = {}
-        logger.debug("Parent node lookup dictionary length %d", len(nodeD))
-        for childTaxId, (parentTaxId, _) in nodeD.items():
-            cD.setdefault(parentTaxId, []).append(childTaxId)
-        #
-        logger.debug("Adjacent child lookup dictionary length %d", len(cD))
-        return cD
+    def __getNodeStore(self):
+        """Return the compact node store - opened from the cache or built from the node data on first use."""
+        if self.__nodeStore is None:
+            with self.__lockD["nodeStore"]:
+                if self.__nodeStore is None and isinstance(self.__nodeD, _LazyComponent):
+                    self.__loadComponent("nodes")
+                if self.__nodeStore is None:
+                    self.__nodeStore = self.__openStore(functools.partial(TaxonomyNodeStore, mergeD=self.__mergeD), "nodeStore", self.__nodeD)
+        return self.__nodeStore
+
+    def __getNameStore(self):
+        """Return the compact name store - opened from the cache or built from the name data on first use."""
+        if self.__nameStore is None:
+            with self.__lockD["nameStore"]:
+                if self.__nameStore is None and isinstance(self.__nameD, _LazyComponent):
+                    self.__loadComponent("names")
+                if self.__nameStore is None:
+                    self.__nameStore = self.__openStore(TaxonomyNameStore, "nameStore", self.__nameD)
+        return self.__nameStore
+
+    def __getLcaIndex(self):
+        """Return the LCA index - opened from the cache or built from the node store on first use."""
+        if self.__lcaIndex is None:
+            with self.__lockD["lcaIndex"]:
+                if self.__lcaIndex is None:
+                    self.__lcaIndex = self.__openStore(TaxonomyLcaIndex, "lcaIndex", self.__getNodeStore())
+        return self.__lcaIndex
+
+    def __getIntervalIndex(self):
+        """Return the DFS interval index - opened from the cache or built from the node store on first use."""
+        if self.__intervalIndex is None:
+            with self.__lockD["intervalIndex"]:
+                if self.__intervalIndex is None:
+                    self.__intervalIndex = self.__openStore(TaxonomyIntervalIndex, "intervalIndex", self.__getNodeStore())
+        return self.__intervalIndex
+
+    def __getRankedLineage(self):
+        """Return the ranked lineage table - opened from the cache or built from the node store on first use."""
+        if self.__rankedLineage is None:
+            with self.__lockD["rankedLineage"]:
+                if self.__rankedLineage is None:
+                    self.__rankedLineage = self.__openStore(TaxonomyRankedLineage, "rankedLineage", self.__getNodeStore())
+        return self.__rankedLineage
+
+    def __getOrganismNameIndex(self):
+        """Return the organism name index - opened from the cache or built from the name store on first use."""
+        if self.__organismNameIndex is None:
+            with self.__lockD["nameMap"]:
+                if self.__organismNameIndex is None:
+                    # (the name store is loaded only if the index must be built)
+                    self.__organismNameIndex = self.__openStore(TaxonomyNameIndex, "nameMap", self.__getNameStore)
+        return self.__organismNameIndex
+
+    def __getNameMatcher(self):
+        """Return the approximate name matcher - opened from the cache or built from the name store on first use."""
+        if self.__nameMatcher is None:
+            with self.__lockD["nameMatcher"]:
+                if self.__nameMatcher is None:
+                    # (the name store is loaded only if the matcher must be built)
+                    self.__nameMatcher = self.__openStore(TaxonomyNameMatcher, "nameMatcher", self.__getNameStore)
+        return self.__nameMatcher
+
+    def __getBatchQuery(self):
+        """Return the NumPy batch query object over the node store and LCA index arrays."""
+        if self.__batchQuery is None:
+            with self.__lockD["batchQuery"]:
+                if self.__batchQuery is None:
+                    self.__batchQuery = TaxonomyBatchQuery(self.__getNodeStore(), self.__getLcaIndex(), self.__mergeD)
+        return self.__batchQuery
+
+    def __getOptionalIndex(self, getter):
+        """Return the optional derived structure from its getter or None if the memory budget refuses it (the caller falls back to node store walks)."""
+        try:
+            return getter()
+        except MemoryError as e:
+            logger.debug("Falling back to node store walks (%s)", str(e))
+            if self.__stats is not None:
+                self.__stats.count("memoryBudgetFallbacks")
+        return None
+
+    def __openStore(self, storeClass, storeName, cD):
+        """Open the cached compact store (or index) or build it from the input component data or data getter (and cache it)."""
+        storePath = self.__getCachePathD(self.__taxDirPath)[storeName]
+        isAttached = self.__sharedMemory is not None and not self.__sharedMemoryOwner
+        store = None
+        if self.__memoryBudget is not None and storeName in RELEASABLE_COMPONENTS:
+            self.__reserveMemory(storeName, storePath)
+        if not isAttached and self.__mU.exists(storePath):
+            try:
+                with self.__phase("open." + storeName):
+                    store = storeClass(storePath)
+            except ValueError as e:
+                # e.g. a cache file written by an earlier version - rebuilt below
+                logger.warning("Rebuilding taxonomy %s (%s)", storeName, str(e))
+        if store is None:
+            cD = cD() if callable(cD) else cD
+            with self.__phase("build." + storeName):
+                store = storeClass(None, cD)
+                if not isAttached and self.__mU.mkdir(self.__taxDirPath):
+                    store.write(storePath)
+        logger.debug("Taxonomy %s length %d", storeName, len(store))
+        return store
+
+    def __openCachedStore(self, storeName, storePath):
+        """Open the cached node or name store at load time and return True, or False if it is missing or outdated (rebuilt on first use)."""
+        if not self.__mU.exists(storePath):
+            return False
+        try:
+            if storeName == "nodeStore":
+                self.__nodeStore = TaxonomyNodeStore(filePath=storePath)
+            else:
+                self.__nameStore = TaxonomyNameStore(filePath=storePath)
+            return True
+        except ValueError as e:
+            logger.warning("Not using cached taxonomy %s (%s)", storeName, str(e))
+        return False
+
+    def __getNodeIndex(self, taxId):
+        """Return the node store index for the input taxId or -1"""
+        try:
+            return self.__getNodeStore().index(int(taxId))
+        except Exception:
+            pass
+        return -1
+
+    def __getNameIndex(self, taxId):
+        """Return the name store index for the input taxId or -1"""
+        try:
+            return self.__getNameStore().index(int(taxId))
+        except Exception:
+            pass
+        return -1
 
     #
+    def __getCachePathD(self, taxDirPath):
+        """Return the dictionary of cache file paths for each data component."""
+        pyVersion = sys.version_info[0]
+        return {
+            "names": os.path.join(taxDirPath, "taxonomy_names-py%s.pic" % str(pyVersion)),
+            "nodes": os.path.join(taxDirPath, "taxonomy_nodes-py%s.pic" % str(pyVersion)),
+            "merged": os.path.join(taxDirPath, "taxonomy_nodes-merged-py%s.pic" % str(pyVersion)),
+            "source": os.path.join(taxDirPath, "taxonomy_source.json"),
+            "nodeStore": os.path.join(taxDirPath, "taxonomy_node_store.bin"),
+            "nameStore": os.path.join(taxDirPath, "taxonomy_name_store.bin"),
+            "lcaIndex": os.path.join(taxDirPath, "taxonomy_lca_index.bin"),
+            "intervalIndex": os.path.join(taxDirPath, "taxonomy_interval_index.bin"),
+            "rankedLineage": os.path.join(taxDirPath, "taxonomy_ranked_lineage.bin"),
+            "nameMap": os.path.join(taxDirPath, "taxonomy_name_index.bin"),
+            "nameMatcher": os.path.join(taxDirPath, "taxonomy_name_matcher.bin"),
+        }
+
     def __reload(self, urlTarget, taxDirPath, useCache=True):
         tD = nD = mD = {}
-        pyVersion = sys.version_info[0]
-        taxNamePath = os.path.join(taxDirPath, "taxonomy_names-py%s.pic" % str(pyVersion))
-        taxNodePath = os.path.join(taxDirPath, "taxonomy_nodes-py%s.pic" % str(pyVersion))
-        taxMergedNodePath = os.path.join(taxDirPath, "taxonomy_nodes-merged-py%s.pic" % str(pyVersion))
+        pathD = self.__getCachePathD(taxDirPath)
+        taxNamePath = pathD["names"]
+        taxNodePath = pathD["nodes"]
+        taxMergedNodePath = pathD["merged"]
+        taxNodeStorePath = pathD["nodeStore"]
+        taxNameStorePath = pathD["nameStore"]
+        taxLcaIndexPath = pathD["lcaIndex"]
+        taxIntervalIndexPath = pathD["intervalIndex"]
+        taxRankedLineagePath = pathD["rankedLineage"]
+        taxNameIndexPath = pathD["nameMap"]
+        taxNameMatcherPath = pathD["nameMatcher"]
         #
         logger.debug("Using taxonomy data path %s", taxDirPath)
         self.__mU.mkdir(taxDirPath)
+        fetched = None
+        if not useCache and self.__conditionalFetch and self.__mU.exists(taxNodePath) and self.__mU.exists(taxNamePath):
+            fetched = self.__fetchFromSource(urlTarget, taxDirPath, conditional=True)
+            if fetched is None:
+                logger.info("Taxonomy source %r is unchanged - using cached data", urlTarget)
+                useCache = True
         if not useCache:
-            for fp in [taxNamePath, taxNodePath, taxMergedNodePath]:
+            for fp in [
+                taxNamePath,
+                taxNodePath,
+                taxMergedNodePath,
+                taxNodeStorePath,
+                taxNameStorePath,
+                taxLcaIndexPath,
+                taxIntervalIndexPath,
+                taxRankedLineagePath,
+                taxNameIndexPath,
+                taxNameMatcherPath,
+            ]:
                 try:
                     os.remove(fp)
                 except Exception:
                     pass
         #
-        if useCache and self.__mU.exists(taxNamePath) and self.__mU.exists(taxNamePath):
-            tD = self.__mU.doImport(taxNamePath, fmt="pickle")
-            nD = self.__mU.doImport(taxNodePath, fmt="pickle")
-            mD = self.__mU.doImport(taxMergedNodePath, fmt="pickle")
+        if useCache and self.__cacheFormat == "snapshot" and self.__openCachedStore("nameStore", taxNameStorePath) and self.__openCachedStore("nodeStore", taxNodeStorePath):
+            return self.__nameStore.nameD, self.__nodeStore.nodeD, self.__nodeStore.mergeD
+        elif useCache and self.__lazy and self.__mU.exists(taxNodePath):
+            self.__componentPathD = {"names": taxNamePath, "nodes": taxNodePath, "merged": taxMergedNodePath, "nodeStore": taxNodeStorePath, "nameStore": taxNameStorePath}
+            tD, nD, mD = [_LazyComponent(self.__loadComponent, cN) for cN in ["names", "nodes", "merged"]]
+            logger.debug("Taxonomy data components will be loaded on first use")
+        elif useCache and self.__mU.exists(taxNamePath) and self.__mU.exists(taxNamePath):
+            with self.__phase("cacheLoad"):
+                if self.__openCachedStore("nameStore", taxNameStorePath):
+                    tD = self.__nameStore.nameD
+                else:
+                    tD = self.__mU.doImport(taxNamePath, fmt="pickle")
+                if self.__openCachedStore("nodeStore", taxNodeStorePath):
+                    nD = self.__nodeStore.nodeD
+                else:
+                    nD = self.__mU.doImport(taxNodePath, fmt="pickle")
+                mD = self.__mU.doImport(taxMergedNodePath, fmt="pickle")
             logger.debug("Taxonomy names length %d nodes length %d", len(tD), len(nD))
         elif not useCache:
-
-            nmL, ndL, mergeL = self.__fetchFromSource(urlTarget, taxDirPath)
-            tD = self.__extractNames(nmL)
-            ok = self.__mU.doExport(taxNamePath, tD, fmt="pickle")
-            #
-            nD = self.__extractNodes(ndL)
-            ok = self.__mU.doExport(taxNodePath, nD, fmt="pickle") and ok
-            #
-            mD = self.__mergedTaxids(mergeL)
-            ok = self.__mU.doExport(taxMergedNodePath, mD, fmt="pickle") and ok
+            tD, nD, mD = fetched if fetched else self.__fetchFromSource(urlTarget, taxDirPath)
+            with self.__phase("pickleWrite"):
+                ok = self.__mU.doExport(taxNamePath, tD, fmt="pickle")
+                ok = self.__mU.doExport(taxNodePath, nD, fmt="pickle") and ok
+                ok = self.__mU.doExport(taxMergedNodePath, mD, fmt="pickle") and ok
+            with self.__phase("build.nodeStore"):
+                self.__nodeStore = TaxonomyNodeStore(nodeD=nD, mergeD=mD)
+                ok = self.__nodeStore.write(taxNodeStorePath) and ok
+            with self.__phase("build.rankedLineage"):
+                self.__rankedLineage = TaxonomyRankedLineage(nodeStore=self.__nodeStore)
+                ok = self.__rankedLineage.write(taxRankedLineagePath) and ok
+            with self.__phase("build.nameStore"):
+                self.__nameStore = TaxonomyNameStore(nameD=tD)
+                ok = self.__nameStore.write(taxNameStorePath) and ok
+            with self.__phase("build.nameMap"):
+                self.__organismNameIndex = TaxonomyNameIndex(nameStore=self.__nameStore)
+                ok = self.__organismNameIndex.write(taxNameIndexPath) and ok
+            logger.debug("Taxonomy cache export status %r", ok)
             # Cleanup
             if self.__cleanup:
-                fnList = [
-                    "citations.dmp",
-                    "delnodes.dmp",
-                    "division.dmp",
-                    "gc.prt",
-                    "gencode.dmp",
-                    "merged.dmp",
-                    "names.dmp",
-                    "nodes.dmp",
-                    "readme.txt",
-                    "taxdump.tar.gz",
-                    "names.dmp.gz",
-                    "nodes.dmp.gz",
-                    "merged.dmp.gz",
-                ]
-                for fn in fnList:
-                    try:
-                        fp = os.path.join(taxDirPath, fn)
-                        os.remove(fp)
-                    except Exception:
-                        pass
+                self.__cleanupSource(taxDirPath)
         #
+        if self.__cacheFormat == "snapshot" and (tD or nD):
+            return self.__openStoreViews(pathD, tD, nD, mD)
         return tD, nD, mD
 
-    def __mergedTaxids(self, rowL):
-        """Extract taxonomy names and synonyms from NCBI taxonomy database dump file row list."""
-        tD = {}
-        try:
-            for tV in rowL:
-                if len(tV) < 2:
-                    continue
-                taxId = int(tV[0])
-                mergedTaxId = int(tV[2])
-                tD[taxId] = mergedTaxId
+    def __cleanupSource(self, taxDirPath):
+        """Remove downloaded taxonomy source files."""
+        fnList = [
+            "citations.dmp",
+            "delnodes.dmp",
+            "division.dmp",
+            "gc.prt",
+            "gencode.dmp",
+            "merged.dmp",
+            "names.dmp",
+            "nodes.dmp",
+            "readme.txt",
+            "taxdump.tar.gz",
+            "names.dmp.gz",
+            "nodes.dmp.gz",
+            "merged.dmp.gz",
+        ]
+        for fn in fnList:
+            try:
+                fp = os.path.join(taxDirPath, fn)
+                os.remove(fp)
+            except Exception:
+                pass
 
-            logger.debug("Taxon merged dictionary length %d \n", len(tD))
-            #
-        except Exception as e:
-            logger.exception("Failing with %s", str(e))
-        return tD
-
-    def __extractNames(self, rowL):
-        """Extract taxonomy names and synonyms from NCBI taxonomy database dump file row list."""
-        # for matched enclosing quotes
-        # reQu = re.compile(r'''(['\"])(.*?)\1$''')
-        tD = {}
-        try:
-            # csvL = []
-            for tV in rowL:
-                if len(tV) < 7:
-                    continue
-                taxId = int(tV[0])
-                name = tV[2].strip("'")
-                #
-                # if reQu.match(name):
-                #    name = name.strip("'")
-                #    logger.info("Matched quoted name: %r" % name)
-                #
-                nameType = tV[6]
-                # csvL.append({'t': taxId, 'name': name, 'type': nameType})
-                #
-                if nameType in ["scientific name", "common name", "synonym", "genbank common name", "equivalent name", "acronym", "genbank acronym"]:
-                    if taxId not in tD:
-                        tD[taxId] = {}
-                    if nameType in ["scientific name"]:
-                        tD[taxId]["sn"] = name
-                        continue
-                    # take first common name
-                    if nameType in ["common name"] and "alt" not in tD[taxId]:
-                        tD[taxId]["alt"] = name
-                    #
-                    tD[taxId].setdefault("cn", []).append(name)
-                else:
-                    pass
-            logger.debug("Taxonomy dictionary length %d \n", len(tD))
-            #
+    def updateCache(self, urlTarget=None):
+        """Update the cached taxonomy data from a new NCBI taxonomy dump.
+
+        The new dump is compared with the current cache, component by component.  Only components
+        with inserted, changed or deleted records (including new merged taxa) are rewritten, and
+        the record level changes are written to the change log file taxonomy_changes.json.
+
+        Args:
+            urlTarget (str, optional): source locator for the NCBI taxonomy dump. Defaults to the provider source.
+
+        Returns:
+            dict: {component: {"inserted": [taxId, ...], "changed": [...], "deleted": [...]}, ...} or {} on failure
+        """
+        urlTarget = urlTarget if urlTarget else self.__urlTarget
+        pathD = self.__getCachePathD(self.__taxDirPath)
+        self.__mU.mkdir(self.__taxDirPath)
+        fetched = self.__fetchFromSource(urlTarget, self.__taxDirPath, conditional=self.__conditionalFetch)
+        if fetched is None:
+            logger.info("Taxonomy source %r is unchanged", urlTarget)
+            return {component: {"inserted": [], "changed": [], "deleted": []} for component in ["names", "nodes", "merged"]}
+        tD, nD, mD = fetched
+        if self.__cleanup:
+            self.__cleanupSource(self.__taxDirPath)
+        if not tD or not nD:
+            logger.error("Taxonomy update failed reading %r", urlTarget)
+            return {}
+        #
+        ok = True
+        changeD = {}
+        rewriteL = []
+        for component, oldD, newD in [("names", self.__nameD, tD), ("nodes", self.__nodeD, nD), ("merged", self.__mergeD, mD)]:
+            changeD[component] = self.__diffComponent(oldD, newD)
+            if any(changeD[component].values()) or not self.__mU.exists(pathD[component]):
+                rewriteL.append(component)
+                ok = self.__mU.doExport(pathD[component], newD, fmt="pickle") and ok
+                if component == "names":
+                    nameStore = TaxonomyNameStore(nameD=newD)
+                    ok = nameStore.write(pathD["nameStore"]) and ok
+                    ok = TaxonomyNameIndex(nameStore=nameStore).write(pathD["nameMap"]) and ok
+                    self.__mU.remove(pathD["nameMatcher"])
+        # (the node store also holds the merged identifiers)
+        if "nodes" in rewriteL or "merged" in rewriteL or not self.__mU.exists(pathD["nodeStore"]):
+            nodeStore = TaxonomyNodeStore(nodeD=nD, mergeD=mD)
+            ok = nodeStore.write(pathD["nodeStore"]) and ok
+            if "nodes" in rewriteL:
+                ok = TaxonomyRankedLineage(nodeStore=nodeStore).write(pathD["rankedLineage"]) and ok
+                # derived indices are rebuilt from the new node store on first use
+                self.__mU.remove(pathD["lcaIndex"])
+                self.__mU.remove(pathD["intervalIndex"])
+        isChanged = any(any(cD.values()) for cD in changeD.values())
+        #
+        summaryD = {component: {ky: len(vL) for ky, vL in cD.items()} for component, cD in changeD.items()}
+        logger.info("Taxonomy update from %r status %r changes %r", urlTarget, ok, summaryD)
+        logD = {"timestamp": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime()), "source": urlTarget, "status": ok, "summary": summaryD, "changes": changeD}
+        ok = self.__mU.doExport(os.path.join(self.__taxDirPath, "taxonomy_changes.json"), logD, fmt="json", indent=1) and ok
+        #
+        if isChanged:
+            self.__nodeStore = None
+            self.__nameStore = None
+            self.__lcaIndex = None
+            self.__intervalIndex = None
+            self.__batchQuery = None
+            self.__rankedLineage = None
+            self.__organismNameIndex = None
+            self.__nameMatcher = None
+            self.clearMemo()
+            self.__nameD, self.__nodeD, self.__mergeD = tD, nD, mD
+            if self.__cacheFormat == "snapshot":
+                self.__nameD, self.__nodeD, self.__mergeD = self.__openStoreViews(pathD, tD, nD, mD)
+        return changeD if ok else {}
+
+    def __diffComponent(self, oldD, newD):
+        """Return the taxIds of records inserted, changed and deleted between the old and new component dictionaries."""
+        insL = []
+        chgL = []
+        for taxId, val in newD.items():
+            if taxId not in oldD:
+                insL.append(taxId)
+            elif oldD[taxId] != val:
+                chgL.append(taxId)
+        delL = [taxId for taxId in oldD if taxId not in newD]
+        return {"inserted": insL, "changed": chgL, "deleted": delL}
+
+    def publishSharedMemory(self, name=None):
+        """Publish the taxonomy node, rank, merged and name tables in a shared memory block.
+
+        Providers in other processes attach to the block with TaxonomyProvider(sharedMemoryName=<name>)
+        and read the tables in place, with no copying or per-process dictionary construction.  The block
+        holds one copy of each store (the merged identifiers are node store sections).  The publishing
+        provider owns the block and should call releaseSharedMemory() when the workers are done.
+
+        Args:
+            name (str, optional): shared memory block name. Defaults to a system generated name.
+
+        Returns:
+            str: shared memory block name or None on failure
+        """
+        mmD = {}
+        try:
+            if self.__sharedMemory:
+                return self.__sharedMemory.name
+            pathD = self.__getCachePathD(self.__taxDirPath)
+            self.__mU.mkdir(self.__taxDirPath)
+            for storeName, store in [
+                ("nodeStore", self.__getNodeStore()),
+                ("nameStore", self.__getNameStore()),
+                ("lcaIndex", self.__getLcaIndex()),
+                ("intervalIndex", self.__getIntervalIndex()),
+                ("rankedLineage", self.__getRankedLineage()),
+                ("nameMap", self.__getOrganismNameIndex()),
+            ]:
+                if not self.__mU.exists(pathD[storeName]) and not store.write(pathD[storeName]):
+                    return None
+            # the shared block bundles the store files as byte sections
+            for ky in ["nodeStore", "nameStore", "lcaIndex", "intervalIndex", "rankedLineage", "nameMap"]:
+                with open(pathD[ky], "rb") as ifh:
+                    mmD[ky] = mmap.mmap(ifh.fileno(), 0, access=mmap.ACCESS_READ)
+            aU = ArrayFileUtil()
+            size = aU.size(mmD)
+            shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+            if not aU.writeBuffer(shm.buf, mmD):
+                shm.close()
+                shm.unlink()
+                return None
+            self.__sharedMemory = shm
+            self.__sharedMemoryOwner = True
+            logger.info("Published taxonomy tables in shared memory block %s (%d bytes)", shm.name, size)
+            return shm.name
         except Exception as e:
-            logger.exception("Failing with %s", str(e))
-        return tD
-
-    def __extractNodes(self, rowL):
-        """Extract taxonomy parent relationships from NCBI taxonomy database dump row list."""
-        nD = {}
-        try:
-            for fields in rowL:
-                taxid = int(fields[0].strip())
-                parentTaxid = int(fields[2].strip())
-                rank = str(fields[4]).strip()
-                nD[taxid] = (parentTaxid, rank)
-            logger.debug("Taxonomy parent dictionary length %d \n", len(nD))
+            self.__countException("publishSharedMemory")
+            logger.exception("Failing publishing shared memory with %s", str(e))
+        finally:
+            for mm in mmD.values():
+                mm.close()
+        return None
+
+    def releaseSharedMemory(self):
+        """Detach from (and, for the publishing provider, remove) the taxonomy shared memory block.
+
+        Returns:
+            bool: True for success or False otherwise
+        """
+        if not self.__sharedMemory:
+            return True
+        try:
+            if not self.__sharedMemoryOwner:
+                # release the views over the shared buffer before closing it
+                self.__batchQuery = None
+                for obj in [
+                    self.__nodeStore,
+                    self.__nameStore,
+                    self.__lcaIndex,
+                    self.__intervalIndex,
+                    self.__rankedLineage,
+                    self.__organismNameIndex,
+                    self.__nameMatcher,
+                ]:
+                    if obj is not None:
+                        obj.close()
+                for mv in self.__sharedSectionD.values():
+                    mv.release()
+                self.__sharedSectionD = {}
+                self.__nameD, self.__nodeD, self.__mergeD = {}, {}, {}
+                self.__nodeStore = None
+                self.__nameStore = None
+                self.__lcaIndex = None
+                self.__intervalIndex = None
+                self.__rankedLineage = None
+                self.__organismNameIndex = None
+                self.__nameMatcher = None
+                self.clearMemo()
+            self.__sharedMemory.close()
+            if self.__sharedMemoryOwner:
+                self.__sharedMemory.unlink()
+            self.__sharedMemory = None
+            return True
         except Exception as e:
-            logger.exception("Failing with %s", str(e))
-        return nD
+            self.__countException("releaseSharedMemory")
+            logger.exception("Failing releasing shared memory with %s", str(e))
+        return False
+
+    def __attachSharedMemory(self, name):
+        """Attach to taxonomy tables published in shared memory and return name, node and merged mapping views."""
+        # The publisher owns the block - it must not be removed by a resource tracker when this process exits.
+        if sys.version_info >= (3, 13):
+            shm = shared_memory.SharedMemory(name=name, create=False, track=False)  # pylint: disable=unexpected-keyword-arg
+        else:
+            # A tracker inherited from the publisher (e.g. pool workers) already tracks the block for the publisher.
+            isPrivateTracker = getattr(resource_tracker._resource_tracker, "_fd", None) is None  # pylint: disable=protected-access
+            shm = shared_memory.SharedMemory(name=name, create=False)
+            if isPrivateTracker:
+                resource_tracker.unregister(shm._name, "shared_memory")  # pylint: disable=protected-access
+        self.__sharedMemory = shm
+        _, self.__sharedSectionD = ArrayFileUtil().fromBuffer(shm.buf)
+        self.__nodeStore = TaxonomyNodeStore(buffer=self.__sharedSectionD["nodeStore"])
+        self.__nameStore = TaxonomyNameStore(buffer=self.__sharedSectionD["nameStore"])
+        self.__lcaIndex = TaxonomyLcaIndex(buffer=self.__sharedSectionD["lcaIndex"])
+        self.__intervalIndex = TaxonomyIntervalIndex(buffer=self.__sharedSectionD["intervalIndex"])
+        self.__rankedLineage = TaxonomyRankedLineage(buffer=self.__sharedSectionD["rankedLineage"])
+        self.__organismNameIndex = TaxonomyNameIndex(buffer=self.__sharedSectionD["nameMap"])
+        logger.debug("Attached to taxonomy shared memory block %s", name)
+        return self.__nameStore.nameD, self.__nodeStore.nodeD, self.__nodeStore.mergeD
+
+    def __openStoreViews(self, pathD, tD, nD, mD):
+        """Map the cached name and node stores (building any that are missing) and return their name, node and merged mapping views."""
+        if not self.__openCachedStore("nameStore", pathD["nameStore"]):
+            self.__nameStore = TaxonomyNameStore(nameD=tD)
+            self.__nameStore.write(pathD["nameStore"])
+        if not self.__openCachedStore("nodeStore", pathD["nodeStore"]):
+            self.__nodeStore = TaxonomyNodeStore(nodeD=nD, mergeD=mD)
+            self.__nodeStore.write(pathD["nodeStore"])
+        logger.debug("Serving taxonomy names, nodes and merged data from the node and name stores in %s", self.__taxDirPath)
+        return self.__nameStore.nameD, self.__nodeStore.nodeD, self.__nodeStore.mergeD
 
-    def __fetchFromSource(self, urlTarget, taxDirPath):
-        """Fetch the ncbi taxonomy dump and read name and node data (extract all members)"""
+    def __fetchFromSource(self, urlTarget, taxDirPath, conditional=False):
+        """Fetch the ncbi taxonomy dump and stream-parse name, node and merged data (no members are extracted).
+
+        Returns None if conditional fetching finds the source unchanged since the previous fetch.
+        """
         logger.info("Fetch taxonomy data from source %s in %s", urlTarget, taxDirPath)
         #
-        fileU = FileUtil()
+        tfU = TaxonomyFetcher(statePath=self.__getCachePathD(taxDirPath)["source"])
+        # (multi-process parsing only pays off with idle cores - parse sequentially on single CPU hosts)
+        numCpu = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else (os.cpu_count() or 1)
+        tdR = TaxonomyDumpReader(numProc=min(self.__numProc, numCpu), stats=self.__stats)
         _, fn = os.path.split(urlTarget)
+        md5Url = self.__md5UrlTarget if self.__md5UrlTarget else (urlTarget + ".md5" if urlTarget.lower().startswith(("http://", "https://")) else None)
         #
+        tD = nD = mD = {}
         ok = False
         try:
-            ok = True
             tarPath = os.path.join(taxDirPath, fn)
-            ok1 = fileU.get(urlTarget, tarPath)
-            ok = ok and ok1
+            with self.__phase("download"):
+                status = tfU.fetch(urlTarget, tarPath, md5Url=md5Url, conditional=conditional)
+            if status == FETCH_STATUS_UNCHANGED:
+                return None
+            ok = status != FETCH_STATUS_FAILED
             if ok:
-                ok1 = fileU.unbundleTarfile(tarPath, dirPath=taxDirPath)
-                ok = ok and ok1
+                tD, nD, mD = tdR.readTarDump(tarPath)
+                ok = bool(tD) and bool(nD)
         except Exception as e:
             logger.exception("Failing taxonomy fetch from %r with %s", urlTarget, str(e))
+            ok = False
         #
         logger.info("Taxonomy primary fetch status (%r) using %r", ok, urlTarget)
         # ----  fallback ----
         if not ok:
             logger.info("Fetching taxonomy data from fallback to %s", taxDirPath)
-            ok3 = True
+            pathD = {}
+            taskL = []
             for fn in ["names", "nodes", "merged"]:
-                filePath = os.path.join(taxDirPath, "%s.dmp.gz" % fn)
+                pathD[fn] = os.path.join(taxDirPath, "%s.dmp.gz" % fn)
                 urlFallback = "https://github.com/rcsb/py-rcsb_exdb_assets/raw/master/fall_back/NCBI/%s.dmp.gz" % fn
-                ok1 = fileU.get(urlFallback, filePath)
-                ok2 = fileU.uncompress(filePath, outputDir=taxDirPath)
-                ok3 = ok1 and ok2 and ok3
-            logger.info("Taxonomy fallback fetch status is %r", ok3)
-        #
-        # nmL = self.__mU.doImport(os.path.join(taxDirPath, "names.dmp"), fmt="tdd", rowFormat="list", uncomment=False)
-        # Switch to using this method below because names.dmp file has some special characters causing multiple lines to be
-        # read in as a single line in above MarshalUtil method (specifically starting at taxId 171288)
-        nmL = []
-        with open(os.path.join(taxDirPath, "names.dmp"), "r", encoding="utf-8") as f:
-            for line in f:
-                nmL.append([i.strip() for i in line.split("\t")])
-        logger.debug("length of nmL: %r and first few: %r", len(nmL), nmL[0:3])
-        ndL = self.__mU.doImport(os.path.join(taxDirPath, "nodes.dmp"), fmt="tdd", rowFormat="list", uncomment=False)
-        logger.debug("length of ndL: %r and first few: %r", len(ndL), ndL[0:3])
+                taskL.append((urlFallback, pathD[fn], None))
+            with self.__phase("download"):
+                statusL = tfU.fetchAll(taskL)
+            logger.info("Taxonomy fallback fetch status is %r", FETCH_STATUS_FAILED not in statusL)
+            try:
+                tD, nD, mD = tdR.readDumpFiles(pathD["names"], pathD["nodes"], pathD["merged"])
+            except Exception as e:
+                logger.exception("Failing reading taxonomy fallback data with %s", str(e))
         #
-        mergeL = self.__mU.doImport(os.path.join(taxDirPath, "merged.dmp"), fmt="tdd", rowFormat="list", uncomment=False)
-        logger.debug("length of mergeL: %r and first few: %r", len(mergeL), mergeL[0:3])
-        # deleteL = self.__mU.doImport(os.path.join(taxDirPath, 'delnodes.dmp'), fmt='tdd', rowFormat='list')
-
-        return nmL, ndL, mergeL
+        logger.debug("Taxonomy names length %d nodes length %d merged length %d", len(tD), len(nD), len(mD))
+        return tD, nD, mD
 
     def getLowestCommonAncestorGen(self, taxId1, taxId2):
         """Return the lowest common ancestor for the input pair of taxonomy identifiers or None
@@ -543,13 +1693,7 @@ class TaxonomyProvider(StashableBase):
         Returns:
             (int): taxonomy identifier for the lowest common ancestor or None
         """
-        try:
-            if not self.__graph:
-                self.__graph = self.__makeGraph()
-            return networkx.lowest_common_ancestor(self.__graph, taxId1, taxId2) if self.__graph else None
-        except Exception as e:
-            logger.exception("Failing for %r %r with %s", taxId1, taxId2, str(e))
-        return None
+        return self.getLowestCommonAncestor(taxId1, taxId2)
 
     def getLowestCommonAncestor(self, taxId1, taxId2):
         """Return the lowest common ancestor for the input pair of taxonomy identifiers or None.
@@ -561,43 +1705,243 @@ class TaxonomyProvider(StashableBase):
         Returns:
             (int): taxonomy identifier for the lowest common ancestor or None
         """
-        if not self.__graph:
-            self.__graph = self.__makeGraph()
-        rD = dict(networkx.tree_all_pairs_lowest_common_ancestor(self.__graph, root=None, pairs=[(taxId1, taxId2)]))
-        return rD[(taxId1, taxId2)] if (taxId1, taxId2) in rD else None
+        try:
+            nS = self.__getNodeStore()
+            idx1 = nS.index(taxId1)
+            idx2 = nS.index(taxId2)
+            lcaIdx = self.__lowestCommonAncestorIndex(self.__getOptionalIndex(self.__getLcaIndex), idx1, idx2) if idx1 >= 0 and idx2 >= 0 else -1
+            return nS.taxId(lcaIdx) if lcaIdx >= 0 else None
+        except Exception as e:
+            self.__countException("getLowestCommonAncestor")
+            logger.exception("Failing for %r %r with %s", taxId1, taxId2, str(e))
+        return None
 
     def getLowestCommonAncestors(self, taxIdPairList):
         """Return the lowest common ancestors for the input pair list of taxonomy identifiers.
 
         Args:
-            taxIdPairList ([type]): [description]
+            taxIdPairList (list): [(taxId1, taxId2), ...]
 
         Returns:
-            (dict): {(taxid1,taxid2): lca), ... }
+            (dict): {(taxid1,taxid2): lca), ... } (pairs without a common ancestor are omitted)
         """
+        rD = {}
         try:
-            if not self.__graph:
-                self.__graph = self.__makeGraph()
-            return dict(networkx.tree_all_pairs_lowest_common_ancestor(self.__graph, root=None, pairs=taxIdPairList))
+            nS = self.__getNodeStore()
+            lcaIndex = self.__getOptionalIndex(self.__getLcaIndex)
+            for taxId1, taxId2 in taxIdPairList:
+                idx1 = nS.index(taxId1)
+                idx2 = nS.index(taxId2)
+                lcaIdx = self.__lowestCommonAncestorIndex(lcaIndex, idx1, idx2) if idx1 >= 0 and idx2 >= 0 else -1
+                if lcaIdx >= 0:
+                    rD[(taxId1, taxId2)] = nS.taxId(lcaIdx)
         except Exception as e:
-            logger.input("Failing for %r with %s", taxIdPairList, str(e))
-        return {}
+            self.__countException("getLowestCommonAncestors")
+            logger.exception("Failing for %r with %s", taxIdPairList, str(e))
+        return rD
 
-    def __makeGraph(self):
-        """Create the networkx graph object..."""
-        try:
-            graph = networkx.DiGraph()
-            graph.name = "Taxonomy"
-            for taxId, (parentTaxId, rank) in self.__nodeD.items():
-                if taxId == parentTaxId:
-                    continue
-                graph.add_node(taxId, rank=rank)
-                graph.add_edge(parentTaxId, taxId)
-            return graph
+    def __lowestCommonAncestorIndex(self, lcaIndex, idx1, idx2):
+        """Return the dense index of the lowest common ancestor of nodes idx1 and idx2 or -1 (over the node store lineages if there is no LCA index)."""
+        if lcaIndex is not None:
+            return lcaIndex.lca(idx1, idx2)
+        nS = self.__getNodeStore()
+        lineageS = set(nS.lineageIndices(idx1))
+        return next((idx for idx in nS.lineageIndices(idx2) if idx in lineageS), -1)
+
+    def getRankedLineageRanks(self):
+        """Return the major ranks held in the ranked lineage table (see getAncestorAtRank())."""
+        return list(RANKED_LINEAGE_RANKS)
+
+    def getAncestorAtRank(self, taxId, rank):
+        """Return the ancestor (or the taxon itself) of the input taxId at the input major rank.
+
+        Args:
+            taxId (int): taxonomy identifier (merged identifiers are resolved)
+            rank (str): major rank (see getRankedLineageRanks(), e.g. "genus", "family", "phylum")
+
+        Returns:
+            int: taxonomy identifier of the ancestor at rank or None
+        """
+        try:
+            idx = self.__getNodeIndex(self.getMergedTaxId(taxId))
+            aIdx = self.__getRankedAncestorIndexD(idx, [rank]).get(rank, -1) if idx >= 0 else -1
+            return self.__nodeStore.taxId(aIdx) if aIdx >= 0 else None
+        except Exception as e:
+            self.__countException("getAncestorAtRank")
+            logger.exception("Failing for taxId %r rank %r with %s", taxId, rank, str(e))
+        return None
+
+    def getAncestorsAtRank(self, taxIds, rank):
+        """Return the ancestors (or the taxa themselves) at the input major rank for the input taxonomy identifiers.
+
+        Args:
+            taxIds (np.ndarray or iterable): taxonomy identifiers (merged identifiers are resolved)
+            rank (str): major rank (see getRankedLineageRanks())
+
+        Returns:
+            np.ndarray: int64 taxonomy identifiers of the ancestors at rank (-1 for none) or None on failure
+        """
+        try:
+            if rank not in RANKED_LINEAGE_RANKS:
+                logger.error("Unsupported ranked lineage rank %r", rank)
+                return None
+            return self.__getBatchQuery().indexedTaxIds(taxIds, self.__getRankedLineage().section(rank))
+        except MemoryError:
+            raise
+        except Exception as e:
+            self.__countException("getAncestorsAtRank")
+            logger.exception("Failing for rank %r with %s", rank, str(e))
+        return None
+
+    def getRankedLineage(self, taxId):
+        """Return the ancestors (or the taxon itself) of the input taxId at each major rank.
+
+        Args:
+            taxId (int): taxonomy identifier (merged identifiers are resolved)
+
+        Returns:
+            dict: {rank: taxId, ...} for the major ranks present in the lineage (top down)
+        """
+        rD = {}
+        try:
+            idx = self.__getNodeIndex(self.getMergedTaxId(taxId))
+            if idx >= 0:
+                rD = {rank: self.__nodeStore.taxId(aIdx) for rank, aIdx in self.__getRankedAncestorIndexD(idx, RANKED_LINEAGE_RANKS).items()}
+        except Exception as e:
+            self.__countException("getRankedLineage")
+            logger.exception("Failing for taxId %r with %s", taxId, str(e))
+        return rD
+
+    def __getRankedAncestorIndexD(self, idx, rankList):
+        """Return {rank: dense index of the ancestor (or the node itself) of node idx at rank, ...} for the input major ranks (in input order).
+
+        Ranks missing from the lineage are omitted.  Without the ranked lineage table, the node store lineage is walked.
+        """
+        rankedLineage = self.__getOptionalIndex(self.__getRankedLineage)
+        if rankedLineage is not None:
+            aIdxL = [(rank, rankedLineage.ancestorIndex(idx, rank)) for rank in rankList]
+        else:
+            nS = self.__getNodeStore()
+            lineageRankD = {}
+            for aIdx in nS.lineageIndices(idx):
+                lineageRankD.setdefault(nS.rank(aIdx), aIdx)
+            aIdxL = [(rank, lineageRankD.get(rank, -1)) for rank in rankList]
+        return {rank: aIdx for rank, aIdx in aIdxL if aIdx >= 0}
+
+    def getMergedTaxIds(self, taxIds):
+        """Return the input taxonomy identifiers with merged identifiers replaced by their targets.
+
+        Args:
+            taxIds (np.ndarray or iterable): taxonomy identifiers
+
+        Returns:
+            np.ndarray: int64 taxonomy identifiers or None on failure
+        """
+        try:
+            return self.__getBatchQuery().mergedTaxIds(taxIds)
+        except MemoryError:
+            raise
+        except Exception as e:
+            self.__countException("getMergedTaxIds")
+            logger.exception("Failing with %s", str(e))
+        return None
+
+    def getParentTaxids(self, taxIds):
+        """Return the parent taxonomy identifiers for the input (merged resolved) taxonomy identifiers.
+
+        Args:
+            taxIds (np.ndarray or iterable): taxonomy identifiers
+
+        Returns:
+            np.ndarray: int64 parent taxonomy identifiers (-1 for unknown identifiers) or None on failure
+        """
+        try:
+            return self.__getBatchQuery().parentTaxIds(taxIds)
+        except MemoryError:
+            raise
+        except Exception as e:
+            self.__countException("getParentTaxids")
+            logger.exception("Failing with %s", str(e))
+        return None
+
+    def getRankList(self):
+        """Return the rank table indexed by the rank codes returned by getRankCodes()."""
+        return self.__getNodeStore().getRankList()
+
+    def getRankCodes(self, taxIds):
+        """Return the rank codes (see getRankList()) for the input (merged resolved) taxonomy identifiers.
+
+        Args:
+            taxIds (np.ndarray or iterable): taxonomy identifiers
+
+        Returns:
+            np.ndarray: int16 rank codes (-1 for unknown identifiers) or None on failure
+        """
+        try:
+            return self.__getBatchQuery().rankCodes(taxIds)
+        except MemoryError:
+            raise
         except Exception as e:
+            self.__countException("getRankCodes")
             logger.exception("Failing with %s", str(e))
         return None
 
+    def getDepths(self, taxIds):
+        """Return the depths below the root (the root taxon 1 has depth 0) for the input (merged resolved) taxonomy identifiers.
+
+        Args:
+            taxIds (np.ndarray or iterable): taxonomy identifiers
+
+        Returns:
+            np.ndarray: int32 depths (-1 for unknown identifiers) or None on failure
+        """
+        try:
+            return self.__getBatchQuery().depths(taxIds)
+        except MemoryError:
+            raise
+        except Exception as e:
+            self.__countException("getDepths")
+            logger.exception("Failing with %s", str(e))
+        return None
+
+    def getAncestorsAtDepth(self, taxIds, depth):
+        """Return the ancestors at the input depth (see getDepths()) for the input (merged resolved) taxonomy identifiers.
+
+        Args:
+            taxIds (np.ndarray or iterable): taxonomy identifiers
+            depth (int): ancestor depth below the root
+
+        Returns:
+            np.ndarray: int64 ancestor taxonomy identifiers (-1 for unknown identifiers or depth beyond the identifier depth) or None on failure
+        """
+        try:
+            return self.__getBatchQuery().ancestorTaxIds(taxIds, depth)
+        except MemoryError:
+            raise
+        except Exception as e:
+            self.__countException("getAncestorsAtDepth")
+            logger.exception("Failing with %s", str(e))
+        return None
+
+    def getLineages(self, taxIds):
+        """Return the lineages (as returned by getLineage()) for the input taxonomy identifiers as a flattened array and offsets.
+
+        Args:
+            taxIds (np.ndarray or iterable): taxonomy identifiers
+
+        Returns:
+            (np.ndarray, np.ndarray): int64 taxonomy identifiers, offsets (the lineage of the i-th input is flat[offsets[i]:offsets[i + 1]])
+                                      or (None, None) on failure
+        """
+        try:
+            return self.__getBatchQuery().lineages(taxIds)
+        except MemoryError:
+            raise
+        except Exception as e:
+            self.__countException("getLineages")
+            logger.exception("Failing with %s", str(e))
+        return None, None
+
     def compareTaxons(self, queryTaxId, refTaxId):
         """Return a summary status, lowest common ancestor and lca rank for input
         query and reference taxonomy identifiers.
@@ -651,38 +1995,13 @@ class TaxonomyProvider(StashableBase):
                     status = "lowest common ancestor"
                     break
             lcaRank = self.getRank(lcaTaxId)
-            if lcaRank and lcaRank in ["serotype", "serogroup"]:
+            if lcaRank and lcaRank in VARIANT_LCA_RANKS:
                 status = "alternate variants"
-            elif lcaRank and lcaRank in [
-                "clade",
-                "class",
-                "family",
-                "genotype",
-                "genus",
-                "infraorder",
-                "isolate",
-                "kingdom",
-                "order",
-                "parvorder",
-                "phylum",
-                "subfamily",
-                "subgenus",
-                "superkingdom",
-                "superorder",
-                "tribe",
-                "species group",
-            ]:
+            elif lcaRank and lcaRank in ORTHOLOGOUS_LCA_RANKS:
                 status = "orthologous match (by lca)"
             elif lcaRank and "species" in lcaRank and refRank and "subspecies" in refRank and queryRank and "subspecies" in queryRank:
                 status = "alternate subspecies"
-            elif (
-                lcaRank
-                and "species" in lcaRank
-                and refRank
-                and refRank in ["strain", "serotype", "serovar", "serogroup", "biotype", "isolate", "no rank", "genotype"]
-                and queryRank
-                and queryRank in ["strain", "serotype", "serovar", "serogroup", "biotype", "isolate", "no rank", "genotype"]
-            ):
+            elif lcaRank and "species" in lcaRank and refRank and refRank in STRAIN_LIKE_RANKS and queryRank and queryRank in STRAIN_LIKE_RANKS:
                 status = "alternate strain/serotype/isolate/genotype"
             elif lcaRank and "no rank" in lcaRank and refRank and refRank in ["species", "strain"] and queryRank and queryRank in ["species", "strain"]:
                 status = "orthologous match (by lca)"
@@ -690,5 +2009,81 @@ class TaxonomyProvider(StashableBase):
                 status = "alternate strain"
 
         except Exception as e:
+            self.__countException("compareTaxons")
             logger.exception("Failing for %r and %r with %s", queryTaxId, refTaxId, str(e))
         return status, lcaTaxId, lcaRank
+
+    def getCompareStatusList(self):
+        """Return the comparison status table indexed by the status codes returned by compareTaxonPairs()."""
+        return list(COMPARE_STATUS_LIST)
+
+    def compareTaxonPairs(self, taxIdPairs):
+        """Return the summary status, lowest common ancestor and lca rank (as compareTaxons()) for each
+        input pair of query and reference taxonomy identifiers.
+
+        Args:
+            taxIdPairs (np.ndarray or iterable): (N, 2) array or iterable of (queryTaxId, refTaxId) pairs
+
+        Returns:
+            (np.ndarray, np.ndarray, np.ndarray): int8 status codes (see getCompareStatusList(), 0 for status None),
+                                                  int64 lowest common ancestor taxonomy identifiers (-1 for None) and
+                                                  int16 lca rank codes (see getRankList(), -1 for None) or (None, None, None) on failure
+        """
+        try:
+            pairA = taxIdPairs if isinstance(taxIdPairs, np.ndarray) else np.array([(int(qId), int(rId)) for qId, rId in taxIdPairs], dtype=np.int64)
+            pairA = pairA.reshape(-1, 2)
+            return self.__getBatchQuery().compareTaxonPairs(pairA[:, 0], pairA[:, 1])
+        except MemoryError:
+            raise
+        except Exception as e:
+            self.__countException("compareTaxonPairs")
+            logger.exception("Failing with %s", str(e))
+        return None, None, None
+
+
+class _LazyComponent(Mapping):
+    """Placeholder mapping for a provider data component that is loaded on first access.
+
+    The loader replaces the provider reference to this placeholder with the loaded dictionary,
+    so only the first access is routed through this class.
+    """
+
+    def __init__(self, loader, component):
+        self.__loader = loader
+        self.__component = component
+        self.__data = None
+
+    def __load(self):
+        if self.__data is None:
+            self.__data = self.__loader(self.__component)
+        return self.__data
+
+    def __getitem__(self, key):
+        return self.__load()[key]
+
+    def __contains__(self, key):
+        return key in self.__load()
+
+    def __iter__(self):
+        return iter(self.__load())
+
+    def __len__(self):
+        return len(self.__load())
+
+
+def _estimateObjectBytes(obj):
+    """Return the size of obj and its (nested) dictionary, list, tuple and set items (shared items are counted for each reference)."""
+    nBytes = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        nBytes += sum(_estimateObjectBytes(ky) + _estimateObjectBytes(val) for ky, val in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        nBytes += sum(_estimateObjectBytes(val) for val in obj)
+    return nBytes
+
+
+def _estimateMappingBytes(cD, sampleSize=1000):
+    """Return the estimated size of a dictionary from the sizes of an evenly spaced sample of its items."""
+    step = max(1, len(cD) // sampleSize)
+    sampleL = list(itertools.islice(cD.items(), 0, None, step))
+    sampleBytes = sum(_estimateObjectBytes(ky) + _estimateObjectBytes(val) for ky, val in sampleL)
+    return sys.getsizeof(cD) + (int(sampleBytes * len(cD) / len(sampleL)) if sampleL else 0)
@@ -0,0 +1,116 @@
+##
+# File: TaxonomyRankedLineage.py
+# Date: 16-Oct-2026
+#
+# Updates:
+##
+"""
+Ranked lineage table (cf. NCBI rankedlineage.dmp) over the dense node indices of a TaxonomyNodeStore.
+
+For each major rank the table holds one column giving, for every node, the dense index of the
+nearest ancestor (or the node itself) with that rank, or -1:
+
+    <rank>[idx]        dense index of the ancestor of node idx at <rank> or -1
+
+The columns are computed with pointer jumping over the parent index (O(log(depth)) vectorized
+passes per rank) and may be written to (and memory-mapped from) a single array file (see ArrayFileUtil).
+
+"""
+
+import array
+import logging
+
+import numpy as np
+
+from rcsb.utils.taxonomy.ArrayFileUtil import ArrayFileUtil
+
+logger = logging.getLogger(__name__)
+
+RANKED_LINEAGE_VERSION = 1
+# major ranks (NCBI replaced superkingdom with domain and added realm for viruses in 2025)
+RANKED_LINEAGE_RANKS = ["superkingdom", "domain", "realm", "kingdom", "phylum", "class", "order", "family", "genus", "species"]
+
+
+class TaxonomyRankedLineage(object):
+    """Per-rank ancestor columns for the taxonomy tree."""
+
+    def __init__(self, filePath=None, nodeStore=None, buffer=None):
+        """Open a ranked lineage file (memory-mapped) or buffer, or build the table from a node store.
+
+        Args:
+            filePath (str, optional): ranked lineage file path. Defaults to None.
+            nodeStore (TaxonomyNodeStore, optional): node store. Defaults to None.
+            buffer (object, optional): buffer containing ranked lineage data. Defaults to None.
+        """
+        if filePath or buffer is not None:
+            attributeD, sD = ArrayFileUtil().read(filePath) if filePath else ArrayFileUtil().fromBuffer(buffer)
+            if attributeD.get("version") != RANKED_LINEAGE_VERSION:
+                raise ValueError("Unsupported taxonomy ranked lineage version %r" % attributeD.get("version"))
+        else:
+            sD = self.__build(nodeStore)
+        self.__sectionD = sD
+
+    def __build(self, nodeStore):
+        numNodes = len(nodeStore)
+        parentA = np.frombuffer(nodeStore.section("parentIndex"), dtype=np.int32).astype(np.int64)
+        # roots (self-parented or with a parent missing from the node table) have no parent
+        parentA[(parentA < 0) | (parentA == np.arange(numNodes))] = -1
+        rankCodeA = np.frombuffer(nodeStore.section("rank"), dtype=np.uint8)
+        rankL = nodeStore.getRankList()
+        sD = {}
+        for rank in RANKED_LINEAGE_RANKS:
+            ancestorA = np.full(numNodes, -1, dtype=np.int64)
+            if rank in rankL:
+                isRank = rankCodeA == rankL.index(rank)
+                ancestorA[isRank] = np.flatnonzero(isRank)
+                # after pass k, ancestorA holds the nearest ancestor at rank within 2**k levels and jumpA the ancestor 2**k levels up
+                jumpA = parentA.copy()
+                need = (ancestorA < 0) & (jumpA >= 0)
+                # (the pass limit guards against parent cycles)
+                for _ in range(numNodes.bit_length() + 1):
+                    if not need.any():
+                        break
+                    jIdxA = jumpA[need]
+                    ancestorA[need] = ancestorA[jIdxA]
+                    jumpA[need] = jumpA[jIdxA]
+                    need = (ancestorA < 0) & (jumpA >= 0)
+            sD[rank] = array.array("i", ancestorA.astype(np.int32).tobytes())
+        logger.debug("Built taxonomy ranked lineage with %d nodes %d ranks", numNodes, len(sD))
+        return sD
+
+    def write(self, filePath):
+        """Write the ranked lineage table to a memory-mappable array file.
+
+        Args:
+            filePath (str): output file path
+
+        Returns:
+            bool: True for success or False otherwise
+        """
+        return ArrayFileUtil().write(filePath, self.__sectionD, {"version": RANKED_LINEAGE_VERSION})
+
+    def close(self):
+        """Release array views over a memory-mapped table (the table is unusable afterwards)."""
+        for arr in self.__sectionD.values():
+            if isinstance(arr, memoryview):
+                arr.release()
+        self.__sectionD = {}
+
+    def memoryUsage(self):
+        """Return the size and backing of the table arrays (see ArrayFileUtil.memoryUsage())."""
+        return ArrayFileUtil().memoryUsage(self.__sectionD)
+
+    def __len__(self):
+        return len(self.__sectionD[RANKED_LINEAGE_RANKS[0]]) if self.__sectionD else 0
+
+    def ranks(self):
+        return list(self.__sectionD)
+
+    def section(self, rank):
+        """Return the ancestor index column for the input rank (array.array or memoryview) for use in bulk (e.g. NumPy) operations."""
+        return self.__sectionD[rank]
+
+    def ancestorIndex(self, idx, rank):
+        """Return the dense index of the ancestor (or the node itself) of node idx at the input rank or -1."""
+        col = self.__sectionD.get(rank)
+        return col[idx] if col is not None else -1
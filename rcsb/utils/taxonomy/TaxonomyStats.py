@@ -0,0 +1,170 @@
+##
+# File: TaxonomyStats.py
+# Date: 16-Oct-2026
+#
+# Updates:
+# 16-Oct-2026 record only the outermost instrumented call in each thread, add per-method miss predicates
+##
+"""
+Opt-in instrumentation for TaxonomyProvider: per-method call counts, latency histograms, miss and
+exception counts, named event counters and load/build phase timings.
+
+Only the outermost instrumented call in each thread is recorded (instrumented methods called from within
+an instrumented method are not counted again).  A call is a miss if the miss predicate of the method holds
+for its result (by default a None result, see isNoneResult() and isEmptyResult()).
+
+Method latencies are counted in logarithmic buckets with upper bounds LATENCY_BUCKETS (seconds).
+A snapshot of all values is returned by getStats():
+
+    {"methods": {<name>: {"calls": ..., "misses": ..., "exceptions": ..., "totalSeconds": ..., "maxSeconds": ...,
+                          "histogram": {"<=1e-06": ..., ..., "<=10": ..., ">10": ...}}, ...},
+     "counters": {<name>: ..., ...},
+     "phases": {<name>: {"count": ..., "totalSeconds": ..., "lastSeconds": ...}, ...}}
+
+"""
+
+import contextlib
+import functools
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS = [1.0e-6, 1.0e-5, 1.0e-4, 1.0e-3, 1.0e-2, 1.0e-1, 1.0, 10.0]
+
+
+def isNoneResult(result, *args, **kwargs):  # pylint: disable=unused-argument
+    """Miss predicate - a None result."""
+    return result is None
+
+
+def isEmptyResult(result, *args, **kwargs):  # pylint: disable=unused-argument
+    """Miss predicate - a None or empty (e.g. [] or {}) result."""
+    return result is None or len(result) == 0
+
+
+class TaxonomyStats(object):
+    """Thread-safe method timers, counters and phase timings."""
+
+    def __init__(self, hook=None):
+        """Thread-safe method timers, counters and phase timings.
+
+        Args:
+            hook (callable, optional): function called with the stats snapshot by publish(). Defaults to None.
+        """
+        self.__hook = hook
+        self.__lock = threading.Lock()
+        self.__methodD = {}
+        self.__counterD = {}
+        self.__phaseD = {}
+        # depth of the instrumented calls in progress in each thread
+        self.__local = threading.local()
+
+    def wrap(self, name, func, isMiss=None):
+        """Return func instrumented as method name (calls, latency, misses and raised exceptions).
+
+        Args:
+            name (str): method name
+            func (callable): method
+            isMiss (callable, optional): miss predicate called as isMiss(result, *args, **kwargs). Defaults to None (isNoneResult()).
+
+        Returns:
+            callable: instrumented method (only calls outside any other instrumented call are recorded)
+        """
+        isMiss = isMiss if isMiss is not None else isNoneResult
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if getattr(self.__local, "depth", 0):
+                return func(*args, **kwargs)
+            self.__local.depth = 1
+            try:
+                startTime = time.perf_counter()
+                try:
+                    result = func(*args, **kwargs)
+                except Exception:
+                    self.__record(name, time.perf_counter() - startTime, isMiss=False, isException=True)
+                    raise
+                seconds = time.perf_counter() - startTime
+                # (the miss predicate is evaluated within the guard - any instrumented calls it makes are not recorded)
+                self.__record(name, seconds, isMiss=bool(isMiss(result, *args, **kwargs)), isException=False)
+                return result
+            finally:
+                self.__local.depth = 0
+
+        return wrapper
+
+    def __record(self, name, seconds, isMiss, isException):
+        with self.__lock:
+            mD = self.__methodD.get(name)
+            if mD is None:
+                mD = self.__methodD[name] = {"calls": 0, "misses": 0, "exceptions": 0, "totalSeconds": 0.0, "maxSeconds": 0.0, "buckets": [0] * (len(LATENCY_BUCKETS) + 1)}
+            mD["calls"] += 1
+            mD["misses"] += isMiss
+            mD["exceptions"] += isException
+            mD["totalSeconds"] += seconds
+            mD["maxSeconds"] = max(mD["maxSeconds"], seconds)
+            for ii, bound in enumerate(LATENCY_BUCKETS):
+                if seconds <= bound:
+                    mD["buckets"][ii] += 1
+                    break
+            else:
+                mD["buckets"][-1] += 1
+
+    def count(self, name, num=1):
+        """Increment the named counter."""
+        with self.__lock:
+            self.__counterD[name] = self.__counterD.get(name, 0) + num
+
+    def countException(self, name):
+        """Count an exception handled within method name."""
+        with self.__lock:
+            self.__counterD["exceptions"] = self.__counterD.get("exceptions", 0) + 1
+            self.__counterD["exceptions." + name] = self.__counterD.get("exceptions." + name, 0) + 1
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        """Context manager timing the named load or build phase."""
+        startTime = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - startTime
+            with self.__lock:
+                pD = self.__phaseD.setdefault(name, {"count": 0, "totalSeconds": 0.0, "lastSeconds": 0.0})
+                pD["count"] += 1
+                pD["totalSeconds"] += seconds
+                pD["lastSeconds"] = seconds
+            logger.debug("Taxonomy phase %s completed (%.4f seconds)", name, seconds)
+
+    def getStats(self):
+        """Return a snapshot of the method, counter and phase statistics (see module notes)."""
+        labelL = ["<=%g" % bound for bound in LATENCY_BUCKETS] + [">%g" % LATENCY_BUCKETS[-1]]
+        with self.__lock:
+            methodD = {}
+            for name, mD in self.__methodD.items():
+                methodD[name] = {ky: val for ky, val in mD.items() if ky != "buckets"}
+                methodD[name]["histogram"] = dict(zip(labelL, mD["buckets"]))
+            return {"methods": methodD, "counters": dict(self.__counterD), "phases": {name: dict(pD) for name, pD in self.__phaseD.items()}}
+
+    def reset(self):
+        """Clear all statistics."""
+        with self.__lock:
+            self.__methodD = {}
+            self.__counterD = {}
+            self.__phaseD = {}
+
+    def publish(self):
+        """Call the hook with the current stats snapshot (hook failures are logged and ignored).
+
+        Returns:
+            dict: stats snapshot
+        """
+        statsD = self.getStats()
+        if self.__hook is not None:
+            try:
+                self.__hook(statsD)
+            except Exception as e:
+                logger.exception("Failing stats hook with %s", str(e))
+        return statsD
@@ -0,0 +1,259 @@
+##
+# File: TaxonomySyntheticDump.py
+# Date: 16-Oct-2026
+#
+# Updates:
+##
+"""
+Synthetic NCBI taxonomy dump (names.dmp, nodes.dmp and merged.dmp) generator for offline testing and benchmarking.
+
+The tree has the NCBI top level taxa (root, cellular root, the three domains, viruses, other and
+unclassified entries) above ranked levels phylum > class > order > family > genus > species > strain
+whose sizes follow the NCBI proportions (most nodes are species).  Parents are drawn from the level above
+with a skewed (heavy-tailed) distribution, some nodes skip a level or are unranked clades, so depth and
+fan-out vary as in the NCBI tree.  The output is deterministic for a given size and seed.
+
+Node k (in level order) has taxonomy identifier ID_OFFSET + (k * prime) mod M (a permutation, so identifiers
+are not in tree order) and names are derived from the node index, e.g. "Pamuri sotuha" (some repeat by chance,
+as in the NCBI names).  A few percent of additional identifiers are merged into existing taxa.
+
+"""
+
+import array
+import logging
+import os
+import random
+import tarfile
+import tempfile
+
+logger = logging.getLogger(__name__)
+
+# taxonomy identifiers of generated nodes start at ID_OFFSET, merged identifiers at MERGED_ID_OFFSET
+ID_OFFSET = 3000000
+MERGED_ID_OFFSET = 2000000
+# (taxId, parent taxId, rank) of the top level taxa
+BACKBONE_NODES = [
+    (1, 1, "no rank"),
+    (2, 131567, "domain"),
+    (2157, 131567, "domain"),
+    (2759, 131567, "domain"),
+    (10239, 1, "no rank"),
+    (12908, 1, "no rank"),
+    (28384, 1, "no rank"),
+    (131567, 1, "cellular root"),
+]
+BACKBONE_NAMES = ["root", "Bacteria", "Archaea", "Eukaryota", "Viruses", "unclassified entries", "other entries", "cellular organisms"]
+# (rank, fraction of the generated nodes, scientific name suffix)
+LEVELS = [
+    ("phylum", 0.0003, "ota"),
+    ("class", 0.001, "ia"),
+    ("order", 0.004, "ales"),
+    ("family", 0.015, "aceae"),
+    ("genus", 0.08, ""),
+    ("species", 0.7, ""),
+    ("strain", None, ""),
+]
+STRAIN_RANKS = ["strain", "no rank", "subspecies", "serotype", "isolate"]
+_SYLLABLES = ["ba", "ce", "di", "fo", "gu", "ha", "ki", "lo", "mu", "ne", "pa", "ri", "so", "tu", "va", "xe", "ze", "ru", "te", "mo"]
+
+
+class TaxonomySyntheticDump(object):
+    """Deterministic synthetic NCBI taxonomy dump generator."""
+
+    def __init__(self, numNodes=10000, seed=1, **kwargs):
+        """Deterministic synthetic NCBI taxonomy dump generator.
+
+        Args:
+            numNodes (int, optional): number of taxonomy nodes (at least 100). Defaults to 10000.
+            seed (int, optional): random seed. Defaults to 1.
+            skew (float, optional): parent selection skew (1 is uniform, larger values concentrate children on fewer parents). Defaults to 2.0.
+            mergedFraction (float, optional): number of merged identifiers relative to numNodes. Defaults to 0.025.
+        """
+        self.__numNodes = max(100, int(numNodes))
+        self.__seed = seed
+        self.__skew = kwargs.get("skew", 2.0)
+        self.__numMerged = min(int(self.__numNodes * kwargs.get("mergedFraction", 0.025)), ID_OFFSET - MERGED_ID_OFFSET - 1)
+        self.__numBackbone = len(BACKBONE_NODES)
+        self.__modulus = self.__numNodes - self.__numBackbone
+        self.__prime = next(pp for pp in [1000003, 1000033, 1000037] if self.__modulus % pp)
+        self.__primeInv = pow(self.__prime, -1, self.__modulus)
+        self.__parentA = None
+        self.__levelA = None
+        self.__rankA = None
+        self.__rankL = sorted(set([rank for _, _, rank in BACKBONE_NODES] + [rank for rank, _, _ in LEVELS] + STRAIN_RANKS + ["clade"]))
+
+    def __len__(self):
+        return self.__numNodes
+
+    def __generate(self):
+        """Draw the parent (node index), level and rank of each node."""
+        if self.__parentA is not None:
+            return
+        rnd = random.Random(self.__seed)
+        nB = self.__numBackbone
+        rankCodeD = {rank: ii for ii, rank in enumerate(self.__rankL)}
+        tIdxD = {taxId: ii for ii, (taxId, _, _) in enumerate(BACKBONE_NODES)}
+        parentA = array.array("i", [tIdxD[pId] for _, pId, _ in BACKBONE_NODES])
+        levelA = array.array("b", [-1] * nB)
+        rankA = array.array("b", [rankCodeD[rank] for _, _, rank in BACKBONE_NODES])
+        # node index ranges of each level
+        numRemaining = self.__numNodes - nB
+        rangeL = []
+        start = nB
+        for ii, (rank, fraction, _) in enumerate(LEVELS):
+            count = max(1, int(round(fraction * (self.__numNodes - nB)))) if fraction else numRemaining
+            count = min(count, numRemaining - (len(LEVELS) - ii - 1))
+            rangeL.append((start, count))
+            start += count
+            numRemaining -= count
+        # phyla are distributed over the domains and viruses (mostly bacteria)
+        topL = [tIdxD[taxId] for taxId in [2, 2, 2, 2759, 2759, 2157, 10239]]
+        otherL = [tIdxD[12908], tIdxD[28384]]
+        skew = self.__skew
+        for level, (rank, _, _) in enumerate(LEVELS):
+            _, count = rangeL[level]
+            for _ in range(count):
+                if level == 0:
+                    parent = rnd.choice(topL)
+                elif rank == "species" and rnd.random() < 0.01:
+                    # (environmental samples and other entries)
+                    parent = rnd.choice(otherL)
+                else:
+                    if 1 < level < 5 and rnd.random() < 0.1:
+                        # skip a rank
+                        pStart, pCount = rangeL[level - 2]
+                    else:
+                        pStart, pCount = rangeL[level - 1]
+                    parent = pStart + int(pCount * rnd.random() ** skew)
+                parentA.append(parent)
+                levelA.append(level)
+                if rank == "strain":
+                    rankA.append(rankCodeD[rnd.choice(STRAIN_RANKS)])
+                elif level < 5 and rnd.random() < 0.05:
+                    rankA.append(rankCodeD["clade"])
+                else:
+                    rankA.append(rankCodeD[rank])
+        self.__parentA, self.__levelA, self.__rankA = parentA, levelA, rankA
+        logger.debug("Generated synthetic taxonomy with %d nodes (levels %r)", len(parentA), [count for _, count in rangeL])
+
+    def taxId(self, idx):
+        """Return the taxonomy identifier of node index idx."""
+        if idx < self.__numBackbone:
+            return BACKBONE_NODES[idx][0]
+        return ID_OFFSET + ((idx - self.__numBackbone) * self.__prime) % self.__modulus
+
+    def nodeIndex(self, taxId):
+        """Return the node index of the input taxonomy identifier or -1."""
+        for ii, (tId, _, _) in enumerate(BACKBONE_NODES):
+            if tId == taxId:
+                return ii
+        if not ID_OFFSET <= taxId < ID_OFFSET + self.__modulus:
+            return -1
+        return self.__numBackbone + ((taxId - ID_OFFSET) * self.__primeInv) % self.__modulus
+
+    def parentIndex(self, idx):
+        """Return the node index of the parent of node index idx."""
+        self.__generate()
+        return self.__parentA[idx]
+
+    def rank(self, idx):
+        """Return the rank of node index idx."""
+        self.__generate()
+        return self.__rankL[self.__rankA[idx]]
+
+    def scientificName(self, idx):
+        """Return the scientific name of node index idx."""
+        self.__generate()
+        if idx < self.__numBackbone:
+            return BACKBONE_NAMES[idx]
+        level = self.__levelA[idx]
+        rank, _, suffix = LEVELS[level]
+        if rank == "species":
+            pIdx = self.__parentA[idx]
+            genus = self.__word(pIdx).capitalize() if pIdx >= self.__numBackbone else "Uncultured"
+            return "%s %s" % (genus, self.__word(idx))
+        if rank == "strain":
+            return "%s str. %d" % (self.scientificName(self.__parentA[idx]), idx % 997)
+        return self.__word(idx).capitalize() + suffix
+
+    def mergedTaxIds(self):
+        """Return the list of (merged taxId, taxId) pairs."""
+        rnd = random.Random(self.__seed + 1)
+        return [(MERGED_ID_OFFSET + ii, self.taxId(rnd.randrange(self.__numBackbone, self.__numNodes))) for ii in range(self.__numMerged)]
+
+    def sampleTaxIds(self, count, seed=None):
+        """Return count taxonomy identifiers of randomly chosen nodes (with repetition)."""
+        rnd = random.Random(self.__seed if seed is None else seed)
+        return [self.taxId(rnd.randrange(self.__numNodes)) for _ in range(count)]
+
+    def writeDumpFiles(self, dirPath):
+        """Write names.dmp, nodes.dmp and merged.dmp (in taxonomy identifier order, as in the NCBI dump).
+
+        Args:
+            dirPath (str): output directory path
+
+        Returns:
+            (str, str, str): names.dmp, nodes.dmp and merged.dmp file paths
+        """
+        self.__generate()
+        os.makedirs(dirPath, exist_ok=True)
+        namesPath, nodesPath, mergedPath = [os.path.join(dirPath, fn) for fn in ["names.dmp", "nodes.dmp", "merged.dmp"]]
+        nodeTail = "\t|\t\t|\t0\t|\t1\t|\t11\t|\t1\t|\t0\t|\t1\t|\t0\t|\t0\t|\t\t|\n"
+        with open(namesPath, "w", encoding="utf-8") as namesF, open(nodesPath, "w", encoding="utf-8") as nodesF:
+            for idx in self.__iterTaxIdOrder():
+                taxId = self.taxId(idx)
+                nodesF.write("%d\t|\t%d\t|\t%s%s" % (taxId, self.taxId(self.__parentA[idx]), self.__rankL[self.__rankA[idx]], nodeTail))
+                namesF.write("".join("%d\t|\t%s\t|\t\t|\t%s\t|\n" % (taxId, name, nameType) for name, nameType in self.__getNames(idx)))
+        with open(mergedPath, "w", encoding="utf-8") as mergedF:
+            for oldTaxId, taxId in self.mergedTaxIds():
+                mergedF.write("%d\t|\t%d\t|\n" % (oldTaxId, taxId))
+        logger.info("Wrote synthetic taxonomy dump with %d nodes and %d merged taxa to %s", self.__numNodes, self.__numMerged, dirPath)
+        return namesPath, nodesPath, mergedPath
+
+    def writeTarDump(self, tarPath):
+        """Write a gzipped tar bundle of the dump files (as taxdump.tar.gz).
+
+        Args:
+            tarPath (str): output tar file path
+
+        Returns:
+            str: tar file path
+        """
+        dirPath = os.path.dirname(os.path.abspath(tarPath))
+        os.makedirs(dirPath, exist_ok=True)
+        with tempfile.TemporaryDirectory(prefix="taxdump-", dir=dirPath) as tmpDirPath:
+            with tarfile.open(tarPath, "w:gz") as tarF:
+                for filePath in self.writeDumpFiles(tmpDirPath):
+                    tarF.add(filePath, arcname=os.path.basename(filePath))
+        return tarPath
+
+    def __iterTaxIdOrder(self):
+        """Generate node indices in taxonomy identifier order."""
+        yield from sorted(range(self.__numBackbone), key=lambda ii: BACKBONE_NODES[ii][0])
+        for kk in range(self.__modulus):
+            yield self.__numBackbone + (kk * self.__primeInv) % self.__modulus
+
+    def __getNames(self, idx):
+        """Return the list of (name, name type) for node index idx."""
+        sn = self.scientificName(idx)
+        nL = [(sn, "scientific name")]
+        if idx < self.__numBackbone or LEVELS[self.__levelA[idx]][0] != "species":
+            return nL
+        hh = self.__hash(idx)
+        if hh % 5 == 0:
+            nL.append(("%s %s, %d" % (sn, self.__word(hh).capitalize(), 1800 + hh % 220), "authority"))
+        if hh % 10 == 1:
+            nL.append(("%s %s" % (self.__word(hh >> 3), self.__word(idx)), "genbank common name"))
+        if hh % 20 == 2:
+            nL.append(("%s %s" % (self.__word(hh >> 5).capitalize(), self.__word(idx)), "synonym"))
+        if hh % 50 == 3:
+            nL.append((self.__word(hh >> 7), "common name"))
+        return nL
+
+    def __hash(self, val):
+        return ((val + self.__seed) * 2654435761) & 0xFFFFFFFF
+
+    def __word(self, val):
+        """Return a pseudo Latin word (2-4 syllables) derived from the input integer."""
+        hh = self.__hash(val)
+        return "".join(_SYLLABLES[(hh >> (5 * ii)) % len(_SYLLABLES)] for ii in range(2 + (hh >> 30) % 3))
@@ -0,0 +1,227 @@
+# File:    benchTaxonomyProvider.py
+# Date:    16-Oct-2026
+#
+# Update:
+#
+##
+"""
+Offline TaxonomyProvider benchmarks over synthetic taxonomy dumps (see TaxonomySyntheticDump).
+
+For each taxonomy size, the dump is generated and the cache is built in one child process, and the
+cache is loaded and queried in a second child process (so each phase starts cold and reports its own
+peak resident set size).  Results are written as JSON for comparison across releases, e.g.
+
+    python benchTaxonomyProvider.py --sizes 10000,100000,1000000 --output benchmark-0.68.json
+
+With --parse-num-proc (e.g. 1,2,4), the dump parse alone (TaxonomyDumpReader) is also timed for
+each listed number of processes, so the multi-process parse can be compared with the sequential
+parse on the benchmark host.
+
+The benchmark is not part of the unit test suite (the file name does not match the test pattern).
+
+"""
+
+__docformat__ = "restructuredtext en"
+__license__ = "Apache 2.0"
+
+import argparse
+import concurrent.futures
+import json
+import logging
+import multiprocessing
+import os
+import platform
+import random
+import resource
+import shutil
+import sys
+import time
+
+from rcsb.utils.taxonomy import __version__
+from rcsb.utils.taxonomy.TaxonomyDumpReader import TaxonomyDumpReader
+from rcsb.utils.taxonomy.TaxonomyProvider import TaxonomyProvider
+from rcsb.utils.taxonomy.TaxonomySyntheticDump import TaxonomySyntheticDump
+
+HERE = os.path.abspath(os.path.dirname(__file__))
+TOPDIR = os.path.dirname(os.path.dirname(os.path.dirname(HERE)))
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s]-%(module)s.%(funcName)s: %(message)s")
+logger = logging.getLogger()
+
+
+def getPeakRssMb():
+    """Return the peak resident set size (MB) of the current process."""
+    maxRss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # (kilobytes on Linux, bytes on macOS)
+    return round(maxRss / (1024.0 * 1024.0 if sys.platform == "darwin" else 1024.0), 1)
+
+
+def timeOps(func, argList):
+    """Return the timing summary of func(*args) over the input argument list."""
+    startTime = time.perf_counter()
+    for args in argList:
+        func(*args)
+    seconds = time.perf_counter() - startTime
+    return {"count": len(argList), "seconds": round(seconds, 6), "opsPerSecond": round(len(argList) / seconds, 1) if seconds > 0 else None}
+
+
+def buildWorker(settingD):
+    """Child process - generate the synthetic dump and build the provider cache."""
+    resultD = {}
+    startTime = time.perf_counter()
+    tarPath = TaxonomySyntheticDump(settingD["numNodes"], seed=settingD["seed"]).writeTarDump(os.path.join(settingD["workPath"], "taxdump.tar.gz"))
+    resultD["generateSeconds"] = round(time.perf_counter() - startTime, 4)
+    resultD["dumpBytes"] = os.path.getsize(tarPath)
+    #
+    startTime = time.perf_counter()
+    tU = TaxonomyProvider(cachePath=settingD["cachePath"], useCache=False, ncbiTaxonomyUrl=tarPath, cacheFormat=settingD["cacheFormat"], numProc=settingD["numProc"])
+    resultD["buildSeconds"] = round(time.perf_counter() - startTime, 4)
+    resultD["buildOk"] = tU.getScientificName(1) == "root"
+    resultD["buildPeakRssMb"] = getPeakRssMb()
+    return resultD
+
+
+def parseWorker(settingD):
+    """Child process - time the dump parse for each number of parsing processes."""
+    parseD = {}
+    tarPath = os.path.join(settingD["workPath"], "taxdump.tar.gz")
+    for numProc in settingD["parseNumProc"]:
+        startTime = time.perf_counter()
+        tD, nD, _ = TaxonomyDumpReader(numProc=numProc).readTarDump(tarPath)
+        parseD[str(numProc)] = {"seconds": round(time.perf_counter() - startTime, 4), "numNames": len(tD), "numNodes": len(nD)}
+    return {"parseSeconds": parseD, "parsePeakRssMb": getPeakRssMb()}
+
+
+def queryWorker(settingD):
+    """Child process - load the provider cache (cold, then warm) and time the query methods."""
+    resultD = {}
+    kwD = {"cachePath": settingD["cachePath"], "useCache": True, "cacheFormat": settingD["cacheFormat"]}
+    rnd = random.Random(settingD["seed"])
+    taxIdL = TaxonomySyntheticDump(settingD["numNodes"], seed=settingD["seed"]).sampleTaxIds(2 * settingD["numQueries"])
+    #
+    startTime = time.perf_counter()
+    tU = TaxonomyProvider(**kwD)
+    resultD["coldLoadSeconds"] = round(time.perf_counter() - startTime, 4)
+    # (the first queries open or build the derived structures)
+    startTime = time.perf_counter()
+    tU.getLineage(taxIdL[0])
+    tU.getTaxId("root")
+    tU.compareTaxons(taxIdL[0], taxIdL[1])
+    tU.getLowestCommonAncestor(taxIdL[0], taxIdL[1])
+    resultD["coldFirstQuerySeconds"] = round(time.perf_counter() - startTime, 4)
+    #
+    startTime = time.perf_counter()
+    tU = TaxonomyProvider(**kwD)
+    tU.getLineage(taxIdL[0])
+    resultD["warmLoadSeconds"] = round(time.perf_counter() - startTime, 4)
+    #
+    numQueries = settingD["numQueries"]
+    pairL = list(zip(taxIdL[:numQueries], taxIdL[numQueries:]))
+    # (names of the sampled taxa and, for a tenth of the queries, unknown names)
+    nameL = [(tU.getScientificName(taxId) if ii % 10 else "unknown organism %d" % ii,) for ii, taxId in enumerate(taxIdL[:numQueries])]
+    rnd.shuffle(nameL)
+    opD = {}
+    opD["getLineage"] = timeOps(tU.getLineage, [(taxId,) for taxId in taxIdL[:numQueries]])
+    opD["getTaxId"] = timeOps(tU.getTaxId, nameL)
+    opD["compareTaxons"] = timeOps(tU.compareTaxons, pairL)
+    opD["getLowestCommonAncestor"] = timeOps(tU.getLowestCommonAncestor, pairL)
+    # traversal and export throughput in nodes per second
+    startTime = time.perf_counter()
+    numNodes = len(tU.getBfsTraverseList(1))
+    opD["getBfsTraverseList"] = {"count": numNodes, "seconds": round(time.perf_counter() - startTime, 6)}
+    if settingD["numNodes"] <= settingD["exportMaxNodes"]:
+        startTime = time.perf_counter()
+        numNodes = len(tU.exportNodeList(startTaxId=1))
+        opD["exportNodeList"] = {"count": numNodes, "seconds": round(time.perf_counter() - startTime, 6)}
+    startTime = time.perf_counter()
+    numNodes = tU.exportNodeListStream(filePath=os.path.join(settingD["workPath"], "taxonomy_node_tree.jsonl"), startTaxId=1, fmt="jsonl") or 0
+    opD["exportNodeListStream"] = {"count": numNodes, "seconds": round(time.perf_counter() - startTime, 6)}
+    for ky in ["getBfsTraverseList", "exportNodeList", "exportNodeListStream"]:
+        if ky in opD and opD[ky]["seconds"] > 0:
+            opD[ky]["opsPerSecond"] = round(opD[ky]["count"] / opD[ky]["seconds"], 1)
+    resultD["ops"] = opD
+    resultD["queryPeakRssMb"] = getPeakRssMb()
+    return resultD
+
+
+def runBenchmark(numNodes, workPath, numQueries=10000, seed=1, cacheFormat="pickle", numProc=1, parseNumProc=None, exportMaxNodes=2000000, keep=False):
+    """Run the build and query benchmarks for a synthetic taxonomy with numNodes nodes.
+
+    Returns:
+        dict: benchmark result
+    """
+    sizePath = os.path.join(workPath, "synthetic-%d" % numNodes)
+    shutil.rmtree(sizePath, ignore_errors=True)
+    os.makedirs(sizePath, exist_ok=True)
+    settingD = {
+        "numNodes": numNodes,
+        "workPath": sizePath,
+        "cachePath": os.path.join(sizePath, "CACHE"),
+        "numQueries": numQueries,
+        "seed": seed,
+        "cacheFormat": cacheFormat,
+        "numProc": numProc,
+        "parseNumProc": parseNumProc if parseNumProc else [],
+        "exportMaxNodes": exportMaxNodes,
+    }
+    resultD = {"numNodes": numNodes}
+    # (executor worker processes are not daemonic, so they may start their own parsing processes)
+    ctx = multiprocessing.get_context("spawn")
+    for worker in [buildWorker, parseWorker, queryWorker] if parseNumProc else [buildWorker, queryWorker]:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=1, mp_context=ctx) as executor:
+            resultD.update(executor.submit(worker, settingD).result())
+    if not keep:
+        shutil.rmtree(sizePath, ignore_errors=True)
+    logger.info("Benchmark result %s", json.dumps(resultD))
+    return resultD
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline TaxonomyProvider benchmarks over synthetic taxonomy dumps")
+    parser.add_argument("--sizes", default="10000,100000,1000000", help="comma separated taxonomy sizes (number of nodes)")
+    parser.add_argument("--queries", type=int, default=10000, help="number of timed calls of each query method")
+    parser.add_argument("--seed", type=int, default=1, help="random seed of the synthetic taxonomies")
+    parser.add_argument("--cache-format", default="pickle", choices=["pickle", "snapshot"], help="provider cache format")
+    parser.add_argument("--num-proc", type=int, default=1, help="number of processes parsing the dump files")
+    parser.add_argument("--parse-num-proc", default="", help="comma separated numbers of processes for the separately timed dump parse (e.g. 1,2,4)")
+    parser.add_argument("--export-max-nodes", type=int, default=2000000, help="skip the in-memory exportNodeList() above this size")
+    parser.add_argument("--work-path", default=os.path.join(HERE, "test-output", "benchmark"), help="working directory")
+    parser.add_argument("--output", default=None, help="JSON result file path (default <work-path>/benchmark-<version>.json)")
+    parser.add_argument("--keep", action="store_true", help="keep the generated dumps and caches")
+    args = parser.parse_args()
+    #
+    os.makedirs(args.work_path, exist_ok=True)
+    parseNumProcL = [int(num) for num in args.parse_num_proc.split(",") if num.strip()]
+    reportD = {
+        "package": "rcsb.utils.taxonomy",
+        "version": __version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpuCount": os.cpu_count(),
+        "usableCpuCount": len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count(),
+        "date": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime()),
+        "settings": {"queries": args.queries, "seed": args.seed, "cacheFormat": args.cache_format, "numProc": args.num_proc, "parseNumProc": parseNumProcL},
+        "results": [],
+    }
+    for numNodes in [int(sz) for sz in args.sizes.split(",") if sz.strip()]:
+        reportD["results"].append(
+            runBenchmark(
+                numNodes,
+                args.work_path,
+                numQueries=args.queries,
+                seed=args.seed,
+                cacheFormat=args.cache_format,
+                numProc=args.num_proc,
+                parseNumProc=parseNumProcL,
+                exportMaxNodes=args.export_max_nodes,
+                keep=args.keep,
+            )
+        )
+    outputPath = args.output if args.output else os.path.join(args.work_path, "benchmark-%s.json" % __version__)
+    with open(outputPath, "w", encoding="utf-8") as ofh:
+        json.dump(reportD, ofh, indent=2)
+    logger.info("Wrote benchmark results to %s", outputPath)
+
+
+if __name__ == "__main__":
+    main()
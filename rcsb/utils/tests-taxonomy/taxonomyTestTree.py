@@ -0,0 +1,61 @@
+# File:    taxonomyTestTree.py
+# Date:    16-Oct-2026
+#
+# Update:
+#
+##
+"""
+Random taxonomy node trees and a reference lineage walk shared by the node index tests.
+
+getRandomNodeTree() builds a small node dictionary with long chains and wide fan-out (unlike the
+shallow synthetic dump tree) and iterLineage() walks it naively, as a reference for the indices.
+
+The module is imported by the tests in this directory (the file name does not match the test pattern).
+
+"""
+
+__docformat__ = "restructuredtext en"
+__license__ = "Apache 2.0"
+
+import random
+
+
+def getRandomNodeTree(numNodes, seed=1, rankList=None):
+    """Return a random node dictionary {taxId: (parent taxId, rank)} in shuffled order.
+
+    Nodes 2 ... numNodes - 1 mostly descend from one of the 20 preceding nodes (long chains) and
+    otherwise from any preceding node (wide fan-out) below the root 1.  The tree also has a subtree
+    5000 (genus) > 5001 (species) below the parent 4999 missing from the node dictionary.
+
+    Args:
+        numNodes (int): number of nodes in the main tree (less than 4999)
+        seed (int, optional): random seed. Defaults to 1.
+        rankList (list, optional): ranks randomly assigned to nodes 2 ... numNodes - 1. Defaults to None ("no rank").
+
+    Returns:
+        dict: node dictionary
+    """
+    rnd = random.Random(seed)
+    nodeD = {1: (1, "no rank"), 5000: (4999, "genus")}
+    taxIdL = [1]
+    for taxId in range(2, numNodes):
+        parentTaxId = rnd.choice(taxIdL[-20:]) if rnd.random() < 0.8 else rnd.choice(taxIdL)
+        nodeD[taxId] = (parentTaxId, rnd.choice(rankList) if rankList else "no rank")
+        taxIdL.append(taxId)
+    nodeD[5001] = (5000, "species")
+    itemL = list(nodeD.items())
+    rnd.shuffle(itemL)
+    return dict(itemL)
+
+
+def iterLineage(nodeD, taxId):
+    """Generate taxId and its ancestors (bottom up) in the input node dictionary.
+
+    The walk stops at a self-parented root or at a node whose parent is missing from the dictionary.
+    """
+    while True:
+        yield taxId
+        parentTaxId = nodeD[taxId][0]
+        if parentTaxId == taxId or parentTaxId not in nodeD:
+            return
+        taxId = parentTaxId
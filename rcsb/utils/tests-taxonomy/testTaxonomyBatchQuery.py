@@ -0,0 +1,94 @@
+# File:    testTaxonomyBatchQuery.py
+# Date:    16-Oct-2026
+#
+# Update:
+#
+##
+"""
+Tests for the NumPy vectorized batch queries.
+
+"""
+
+__docformat__ = "restructuredtext en"
+__license__ = "Apache 2.0"
+
+import logging
+import os
+import random
+import time
+import unittest
+
+import numpy as np
+
+from rcsb.utils.taxonomy.TaxonomyBatchQuery import TaxonomyBatchQuery
+from rcsb.utils.taxonomy.TaxonomyLcaIndex import TaxonomyLcaIndex
+from rcsb.utils.taxonomy.TaxonomyNodeStore import TaxonomyNodeStore
+
+from taxonomyTestTree import getRandomNodeTree, iterLineage
+
+HERE = os.path.abspath(os.path.dirname(__file__))
+TOPDIR = os.path.dirname(os.path.dirname(os.path.dirname(HERE)))
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s]-%(module)s.%(funcName)s: %(message)s")
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+
+class TaxonomyBatchQueryTests(unittest.TestCase):
+    def setUp(self):
+        # random tree in shuffled node order, plus a subtree 5000 below a parent missing from the node table
+        self.__nodeD = getRandomNodeTree(2000, seed=13, rankList=["no rank", "genus", "species"])
+        rnd = random.Random(13)
+        self.__mergeD = {7001: 17, 7002: 5001, 7003: 424242}
+        self.__taxIdL = [rnd.randrange(1, 2000) for _ in range(500)] + [1, 5000, 5001, 7001, 7002, 7003, 424242, -5]
+        self.__startTime = time.time()
+        logger.info("Starting %s at %s", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+
+    def tearDown(self):
+        endTime = time.time()
+        logger.info("Completed %s at %s (%.4f seconds)", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()), endTime - self.__startTime)
+
+    def __getLineage(self, taxId):
+        """Reference lineage (top down, synthetic root 1 excluded except for itself)"""
+        taxId = self.__mergeD.get(taxId, taxId)
+        if taxId not in self.__nodeD:
+            return [taxId]
+        tL = list(iterLineage(self.__nodeD, taxId))
+        # (a parent missing from the node table is included, the synthetic root is not)
+        if self.__nodeD[tL[-1]][0] != tL[-1]:
+            tL.append(self.__nodeD[tL[-1]][0])
+        elif len(tL) > 1:
+            tL.pop()
+        return list(reversed(tL))
+
+    def testBatchQuery(self):
+        """Test vectorized batch queries against per-identifier reference values"""
+        nS = TaxonomyNodeStore(nodeD=self.__nodeD)
+        bQ = TaxonomyBatchQuery(nS, TaxonomyLcaIndex(nodeStore=nS), self.__mergeD)
+        taxIdA = np.array(self.__taxIdL)
+        resolvedL = [self.__mergeD.get(taxId, taxId) for taxId in self.__taxIdL]
+        self.assertEqual(bQ.mergedTaxIds(taxIdA).tolist(), resolvedL)
+        self.assertEqual(bQ.parentTaxIds(taxIdA).tolist(), [self.__nodeD[taxId][0] if taxId in self.__nodeD else -1 for taxId in resolvedL])
+        rankL = nS.getRankList()
+        self.assertEqual([rankL[code] if code >= 0 else None for code in bQ.rankCodes(taxIdA)], [self.__nodeD[taxId][1] if taxId in self.__nodeD else None for taxId in resolvedL])
+        #
+        lineageL = [self.__getLineage(taxId) for taxId in self.__taxIdL]
+        # root first node paths (the root is node 1 or node 5000 with its parent missing from the node table)
+        pathL = [([1] + lL if lL[0] != 1 else lL) if lL[0] != 4999 else lL[1:] for lL in lineageL]
+        pathL = [tL if taxId in self.__nodeD else [] for taxId, tL in zip(resolvedL, pathL)]
+        self.assertEqual(bQ.depths(self.__taxIdL).tolist(), [len(tL) - 1 for tL in pathL])
+        self.assertEqual(bQ.ancestorTaxIds(taxIdA, 3).tolist(), [tL[3] if len(tL) > 3 else -1 for tL in pathL])
+        self.assertEqual(bQ.ancestorTaxIds(taxIdA, 0).tolist(), [tL[0] if tL else -1 for tL in pathL])
+        flatA, offsetA = bQ.lineages(iter(self.__taxIdL))
+        self.assertEqual([flatA[offsetA[ii] : offsetA[ii + 1]].tolist() for ii in range(len(self.__taxIdL))], lineageL)
+
+
+def batchQuerySuite():
+    suiteSelect = unittest.TestSuite()
+    suiteSelect.addTest(TaxonomyBatchQueryTests("testBatchQuery"))
+    return suiteSelect
+
+
+if __name__ == "__main__":
+    mySuite = batchQuerySuite()
+    unittest.TextTestRunner(verbosity=2).run(mySuite)
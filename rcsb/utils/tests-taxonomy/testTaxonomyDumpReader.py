@@ -0,0 +1,118 @@
+# File:    testTaxonomyDumpReader.py
+# Date:    16-Oct-2026
+#
+# Update:
+#
+##
+"""
+Tests for stream parsing of NCBI taxonomy dump data.
+
+"""
+
+__docformat__ = "restructuredtext en"
+__license__ = "Apache 2.0"
+
+import gzip
+import io
+import logging
+import os
+import shutil
+import tarfile
+import time
+import unittest
+
+from rcsb.utils.taxonomy.TaxonomyDumpReader import TaxonomyDumpReader
+from rcsb.utils.taxonomy.TaxonomyProvider import TaxonomyProvider
+
+HERE = os.path.abspath(os.path.dirname(__file__))
+TOPDIR = os.path.dirname(os.path.dirname(os.path.dirname(HERE)))
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s]-%(module)s.%(funcName)s: %(message)s")
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+
+class TaxonomyDumpReaderTests(unittest.TestCase):
+    def setUp(self):
+        self.__workPath = os.path.join(HERE, "test-output", "dump-reader")
+        self.__dumpDirPath = os.path.join(HERE, "test-data", "taxdump-mini")
+        self.__dumpPath = os.path.join(self.__workPath, "taxdump.tar.gz")
+        os.makedirs(self.__workPath, exist_ok=True)
+        with tarfile.open(self.__dumpPath, "w:gz") as tarF:
+            for fn in sorted(os.listdir(self.__dumpDirPath)):
+                tarF.add(os.path.join(self.__dumpDirPath, fn), arcname=fn)
+        self.__startTime = time.time()
+        logger.info("Starting %s at %s", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+
+    def tearDown(self):
+        endTime = time.time()
+        logger.info("Completed %s at %s (%.4f seconds)", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()), endTime - self.__startTime)
+
+    def testReadDump(self):
+        """Test stream parsing the tar bundle and the individual (gzipped) dump files"""
+        tdR = TaxonomyDumpReader()
+        tD, nD, mD = tdR.readTarDump(self.__dumpPath)
+        self.assertEqual(len(nD), 41)
+        self.assertEqual(nD[9606], (9605, "species"))
+        self.assertEqual(mD[1354003], 562)
+        self.assertEqual(tD[9606], {"sn": "Homo sapiens", "cn": ["human", "man", "human"], "alt": "man"})
+        self.assertEqual(tD[10090]["cn"], ["house mouse", "mouse", "Mus musculus domesticus"])
+        self.assertNotIn("authority", str(tD[562]))
+        #
+        pathD = {}
+        for fn in ["names", "nodes", "merged"]:
+            gzPath = os.path.join(self.__workPath, "%s.dmp.gz" % fn)
+            with open(os.path.join(self.__dumpDirPath, "%s.dmp" % fn), "rb") as ifh, gzip.open(gzPath, "wb") as ofh:
+                shutil.copyfileobj(ifh, ofh)
+            pathD[fn] = gzPath
+        self.assertEqual(tdR.readDumpFiles(pathD["names"], pathD["nodes"], pathD["merged"]), (tD, nD, mD))
+        pathD = {fn: os.path.join(self.__dumpDirPath, "%s.dmp" % fn) for fn in ["names", "nodes", "merged"]}
+        self.assertEqual(tdR.readDumpFiles(pathD["names"], pathD["nodes"], pathD["merged"]), (tD, nD, mD))
+
+    def testReadDumpParallel(self):
+        """Test parallel block parsing reproduces the sequential parse (including name ordering)"""
+        tD, nD, mD = TaxonomyDumpReader().readTarDump(self.__dumpPath)
+        tdR = TaxonomyDumpReader(numProc=2, blockSize=256)
+        namesPath = os.path.join(self.__dumpDirPath, "names.dmp")
+        with open(namesPath, "rb") as ifh:
+            blockL = list(tdR.iterBlocks(ifh))
+        self.assertGreater(len(blockL), 10)
+        with open(namesPath, "rb") as ifh:
+            data = ifh.read()
+        self.assertEqual(b"".join(blockL), data)
+        self.assertTrue(all(block.endswith(b"\n") for block in blockL[:-1]))
+        self.assertEqual(list(tdR.iterBlocks(io.BytesIO(b"a\nbb\nccc"), blockSize=2)), [b"a\n", b"bb\n", b"ccc"])
+        #
+        pD, pN, pM = tdR.readTarDump(self.__dumpPath)
+        self.assertEqual((pD, pN, pM), (tD, nD, mD))
+        self.assertEqual(list(pD.keys()), list(tD.keys()))
+        self.assertEqual([list(nmD.items()) for nmD in pD.values()], [list(nmD.items()) for nmD in tD.values()])
+        self.assertEqual(list(pN.keys()), list(nD.keys()))
+        pathD = {fn: os.path.join(self.__dumpDirPath, "%s.dmp" % fn) for fn in ["names", "nodes", "merged"]}
+        self.assertEqual(tdR.readDumpFiles(pathD["names"], pathD["nodes"], pathD["merged"]), (tD, nD, mD))
+        #
+        tU = TaxonomyProvider(cachePath=os.path.join(self.__workPath, "CACHE-parallel"), useCache=False, ncbiTaxonomyUrl=self.__dumpPath, numProc=2)
+        self.assertEqual(tU.getCommonNames(9606), ["human", "man"])
+        self.assertEqual(tU.getAlternateName(9606), "man")
+
+    def testBuildWithoutExtraction(self):
+        """Test that a cache rebuild leaves no extracted dump members on disk"""
+        cachePath = os.path.join(self.__workPath, "CACHE")
+        tU = TaxonomyProvider(cachePath=cachePath, useCache=False, ncbiTaxonomyUrl=self.__dumpPath, cleanup=False)
+        self.assertEqual(tU.getScientificName(2697049), "Severe acute respiratory syndrome coronavirus 2")
+        fnL = os.listdir(os.path.join(cachePath, "NCBI"))
+        self.assertIn("taxdump.tar.gz", fnL)
+        self.assertFalse([fn for fn in fnL if fn.endswith(".dmp")])
+
+
+def dumpReaderSuite():
+    suiteSelect = unittest.TestSuite()
+    suiteSelect.addTest(TaxonomyDumpReaderTests("testReadDump"))
+    suiteSelect.addTest(TaxonomyDumpReaderTests("testReadDumpParallel"))
+    suiteSelect.addTest(TaxonomyDumpReaderTests("testBuildWithoutExtraction"))
+    return suiteSelect
+
+
+if __name__ == "__main__":
+    mySuite = dumpReaderSuite()
+    unittest.TextTestRunner(verbosity=2).run(mySuite)
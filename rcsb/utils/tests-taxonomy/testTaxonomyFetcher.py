@@ -0,0 +1,230 @@
+# File:    testTaxonomyFetcher.py
+# Date:    16-Oct-2026
+#
+# Update:
+#
+##
+"""
+Tests for conditional, resumable and checksum verified fetching of taxonomy sources (local HTTP server).
+
+"""
+
+__docformat__ = "restructuredtext en"
+__license__ = "Apache 2.0"
+
+import hashlib
+import http.server
+import json
+import logging
+import os
+import shutil
+import tarfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+from rcsb.utils.io.FileUtil import FileUtil
+from rcsb.utils.taxonomy.TaxonomyFetcher import FETCH_STATUS_FAILED, FETCH_STATUS_FETCHED, FETCH_STATUS_UNCHANGED, TaxonomyFetcher
+from rcsb.utils.taxonomy.TaxonomyProvider import TaxonomyProvider
+
+HERE = os.path.abspath(os.path.dirname(__file__))
+TOPDIR = os.path.dirname(os.path.dirname(os.path.dirname(HERE)))
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s]-%(module)s.%(funcName)s: %(message)s")
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+
+class _SourceRequestHandler(http.server.BaseHTTPRequestHandler):
+    """Minimal static file handler supporting ETag/Last-Modified validators and byte range requests."""
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        self.server.requestL.append((self.path, dict(self.headers)))
+        filePath = os.path.join(self.server.dataPath, os.path.basename(self.path))
+        if not os.path.exists(filePath):
+            self.send_error(404)
+            return
+        with open(filePath, "rb") as ifh:
+            data = ifh.read()
+        etag = '"%s"' % hashlib.md5(data).hexdigest()
+        lastModified = self.date_time_string(int(os.path.getmtime(filePath)))
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        start = 0
+        rangeHeader = self.headers.get("Range")
+        if rangeHeader and self.headers.get("If-Range", etag) == etag:
+            start = int(rangeHeader.split("=")[1].split("-")[0])
+        self.send_response(206 if start else 200)
+        self.send_header("ETag", etag)
+        self.send_header("Last-Modified", lastModified)
+        self.send_header("Content-Length", str(len(data) - start))
+        if start:
+            self.send_header("Content-Range", "bytes %d-%d/%d" % (start, len(data) - 1, len(data)))
+        self.end_headers()
+        self.wfile.write(data[start:])
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        pass
+
+
+class TaxonomyFetcherTests(unittest.TestCase):
+    def setUp(self):
+        self.__workPath = os.path.join(HERE, "test-output", "fetcher")
+        self.__servePath = os.path.join(self.__workPath, "serve")
+        self.__dumpDirPath = os.path.join(HERE, "test-data", "taxdump-mini")
+        shutil.rmtree(self.__workPath, ignore_errors=True)
+        os.makedirs(self.__servePath)
+        self.__dumpPath = os.path.join(self.__servePath, "taxdump.tar.gz")
+        with tarfile.open(self.__dumpPath, "w:gz") as tarF:
+            for fn in sorted(os.listdir(self.__dumpDirPath)):
+                tarF.add(os.path.join(self.__dumpDirPath, fn), arcname=fn)
+        self.__writeMd5(self.__dumpPath)
+        #
+        self.__server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _SourceRequestHandler)
+        self.__server.dataPath = self.__servePath
+        self.__server.requestL = []
+        threading.Thread(target=self.__server.serve_forever, daemon=True).start()
+        self.__baseUrl = "http://127.0.0.1:%d" % self.__server.server_address[1]
+        self.__startTime = time.time()
+        logger.info("Starting %s at %s", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+
+    def tearDown(self):
+        self.__server.shutdown()
+        self.__server.server_close()
+        endTime = time.time()
+        logger.info("Completed %s at %s (%.4f seconds)", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()), endTime - self.__startTime)
+
+    def __writeMd5(self, filePath, digest=None):
+        with open(filePath, "rb") as ifh:
+            digest = digest if digest else hashlib.md5(ifh.read()).hexdigest()
+        with open(filePath + ".md5", "w", encoding="utf-8") as ofh:
+            ofh.write("%s  %s\n" % (digest, os.path.basename(filePath)))
+
+    def __getRequests(self, path):
+        return [headerD for pth, headerD in self.__server.requestL if pth == path]
+
+    def testConditionalFetch(self):
+        """Test conditional fetching with validators and the published checksum"""
+        url = self.__baseUrl + "/taxdump.tar.gz"
+        filePath = os.path.join(self.__workPath, "taxdump.tar.gz")
+        tfU = TaxonomyFetcher(statePath=os.path.join(self.__workPath, "state.json"))
+        self.assertEqual(tfU.fetch(url, filePath, conditional=True), FETCH_STATUS_FETCHED)
+        self.assertEqual(tfU.hash(filePath), tfU.hash(self.__dumpPath))
+        # unchanged by the entity tag
+        self.assertEqual(tfU.fetch(url, filePath, conditional=True), FETCH_STATUS_UNCHANGED)
+        self.assertIn("If-None-Match", self.__getRequests("/taxdump.tar.gz")[-1])
+        # unchanged by the published checksum (no request for the dump)
+        numRequests = len(self.__getRequests("/taxdump.tar.gz"))
+        self.assertEqual(tfU.fetch(url, filePath, md5Url=url + ".md5", conditional=True), FETCH_STATUS_UNCHANGED)
+        self.assertEqual(len(self.__getRequests("/taxdump.tar.gz")), numRequests)
+        self.assertEqual(tfU.fetch(url, filePath, md5Url=url + ".md5"), FETCH_STATUS_FETCHED)
+        #
+        with open(self.__dumpPath, "ab") as ofh:
+            ofh.write(b"\0" * 10)
+        self.assertEqual(tfU.fetch(url, filePath, conditional=True), FETCH_STATUS_FETCHED)
+        self.assertEqual(tfU.hash(filePath), tfU.hash(self.__dumpPath))
+
+    def testResumeAndChecksum(self):
+        """Test resuming a partial download and rejecting a download with a checksum mismatch"""
+        url = self.__baseUrl + "/taxdump.tar.gz"
+        filePath = os.path.join(self.__workPath, "taxdump.tar.gz")
+        statePath = os.path.join(self.__workPath, "state.json")
+        tfU = TaxonomyFetcher(statePath=statePath)
+        # simulate an interrupted download of the current source version
+        with open(self.__dumpPath, "rb") as ifh:
+            data = ifh.read()
+        with open(filePath + ".part", "wb") as ofh:
+            ofh.write(data[:100])
+        with open(statePath, "w", encoding="utf-8") as ofh:
+            json.dump({url: {"partial": {"etag": '"%s"' % hashlib.md5(data).hexdigest()}}}, ofh)
+        self.assertEqual(tfU.fetch(url, filePath, md5Url=url + ".md5"), FETCH_STATUS_FETCHED)
+        self.assertEqual(self.__getRequests("/taxdump.tar.gz")[-1].get("Range"), "bytes=100-")
+        self.assertEqual(tfU.hash(filePath), hashlib.md5(data).hexdigest())
+        self.assertFalse(os.path.exists(filePath + ".part"))
+        #
+        self.__writeMd5(self.__dumpPath, digest="0" * 32)
+        os.remove(filePath)
+        self.assertEqual(tfU.fetch(url, filePath, md5Url=url + ".md5"), FETCH_STATUS_FAILED)
+        self.assertFalse(os.path.exists(filePath))
+        self.assertFalse(os.path.exists(filePath + ".part"))
+
+    def testFetchAll(self):
+        """Test concurrent fetching of several sources"""
+        taskL = []
+        for fn in ["names.dmp", "nodes.dmp", "merged.dmp", "missing.dmp"]:
+            if fn != "missing.dmp":
+                shutil.copy(os.path.join(self.__dumpDirPath, fn), self.__servePath)
+            taskL.append((self.__baseUrl + "/" + fn, os.path.join(self.__workPath, fn), None))
+        statusL = TaxonomyFetcher(numThreads=4, maxAttempts=1).fetchAll(taskL)
+        self.assertEqual(statusL, [FETCH_STATUS_FETCHED] * 3 + [FETCH_STATUS_FAILED])
+        for fn in ["names.dmp", "nodes.dmp", "merged.dmp"]:
+            with open(os.path.join(self.__workPath, fn), "rb") as ifh1, open(os.path.join(self.__dumpDirPath, fn), "rb") as ifh2:
+                self.assertEqual(ifh1.read(), ifh2.read())
+
+    def testSchemeRouting(self):
+        """Test that file paths and file:// urls are copied locally and other schemes are fetched with FileUtil"""
+        statePath = os.path.join(self.__workPath, "source-state.json")
+        tfU = TaxonomyFetcher(statePath=statePath)
+        filePath = os.path.join(self.__workPath, "taxdump.tar.gz")
+        for url in [self.__dumpPath, "file://" + self.__dumpPath]:
+            self.assertEqual(tfU.fetch(url, filePath, md5Url="file://" + self.__dumpPath + ".md5", conditional=True), FETCH_STATUS_FETCHED)
+            self.assertEqual(tfU.fetch(url, filePath, conditional=True), FETCH_STATUS_UNCHANGED)
+        #
+        ftpUrl = "ftp://ftp.ncbi.nlm.nih.gov/pub/taxonomy/taxdump.tar.gz"
+        callL = []
+
+        def getFile(_, remote, local, **kwargs):
+            callL.append((remote, local))
+            shutil.copyfile(self.__dumpPath, local)
+            return True
+
+        os.remove(filePath)
+        with mock.patch.object(FileUtil, "get", autospec=True, side_effect=getFile):
+            # (no conditional requests - the source is fetched each time)
+            self.assertEqual(tfU.fetch(ftpUrl, filePath, md5Url=self.__dumpPath + ".md5", conditional=True), FETCH_STATUS_FETCHED)
+            self.assertEqual(tfU.fetch(ftpUrl, filePath, conditional=True), FETCH_STATUS_FETCHED)
+            self.__writeMd5(self.__dumpPath, digest="0" * 32)
+            self.assertEqual(tfU.fetch(ftpUrl, filePath + "-bad", md5Url=self.__dumpPath + ".md5"), FETCH_STATUS_FAILED)
+        self.assertEqual(callL, [(ftpUrl, filePath + ".part")] * 2 + [(ftpUrl, filePath + "-bad.part")])
+        self.assertTrue(os.path.exists(filePath))
+        self.assertFalse(os.path.exists(filePath + ".part") or os.path.exists(filePath + "-bad") or os.path.exists(filePath + "-bad.part"))
+        with open(statePath, "r", encoding="utf-8") as ifh:
+            self.assertNotIn(ftpUrl, json.load(ifh))
+
+    def testProviderConditionalRebuild(self):
+        """Test that an unchanged source skips the provider download and cache rebuild"""
+        url = self.__baseUrl + "/taxdump.tar.gz"
+        cachePath = os.path.join(self.__workPath, "CACHE")
+        tU = TaxonomyProvider(cachePath=cachePath, useCache=False, ncbiTaxonomyUrl=url, conditionalFetch=True)
+        self.assertEqual(tU.getScientificName(9606), "Homo sapiens")
+        namePath = os.path.join(cachePath, "NCBI", "taxonomy_names-py3.pic")
+        mTime = os.path.getmtime(namePath)
+        numRequests = len(self.__getRequests("/taxdump.tar.gz"))
+        #
+        tU = TaxonomyProvider(cachePath=cachePath, useCache=False, ncbiTaxonomyUrl=url, conditionalFetch=True)
+        self.assertEqual(tU.getScientificName(9606), "Homo sapiens")
+        self.assertEqual(os.path.getmtime(namePath), mTime)
+        self.assertEqual(len(self.__getRequests("/taxdump.tar.gz")), numRequests)
+        self.assertEqual(tU.updateCache(), {cN: {"inserted": [], "changed": [], "deleted": []} for cN in ["names", "nodes", "merged"]})
+        #
+        tU = TaxonomyProvider(cachePath=cachePath, useCache=False, ncbiTaxonomyUrl=url)
+        self.assertEqual(tU.getScientificName(9606), "Homo sapiens")
+        self.assertEqual(len(self.__getRequests("/taxdump.tar.gz")), numRequests + 1)
+
+
+def fetcherSuite():
+    suiteSelect = unittest.TestSuite()
+    suiteSelect.addTest(TaxonomyFetcherTests("testConditionalFetch"))
+    suiteSelect.addTest(TaxonomyFetcherTests("testResumeAndChecksum"))
+    suiteSelect.addTest(TaxonomyFetcherTests("testFetchAll"))
+    suiteSelect.addTest(TaxonomyFetcherTests("testSchemeRouting"))
+    suiteSelect.addTest(TaxonomyFetcherTests("testProviderConditionalRebuild"))
+    return suiteSelect
+
+
+if __name__ == "__main__":
+    mySuite = fetcherSuite()
+    unittest.TextTestRunner(verbosity=2).run(mySuite)
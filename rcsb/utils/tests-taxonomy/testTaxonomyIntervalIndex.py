@@ -0,0 +1,84 @@
+# File:    testTaxonomyIntervalIndex.py
+# Date:    16-Oct-2026
+#
+# Update:
+#
+##
+"""
+Tests for the DFS interval (nested set) index.
+
+"""
+
+__docformat__ = "restructuredtext en"
+__license__ = "Apache 2.0"
+
+import logging
+import os
+import random
+import time
+import unittest
+
+from rcsb.utils.taxonomy.TaxonomyIntervalIndex import TaxonomyIntervalIndex
+from rcsb.utils.taxonomy.TaxonomyNodeStore import TaxonomyNodeStore
+
+from taxonomyTestTree import getRandomNodeTree, iterLineage
+
+HERE = os.path.abspath(os.path.dirname(__file__))
+TOPDIR = os.path.dirname(os.path.dirname(os.path.dirname(HERE)))
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s]-%(module)s.%(funcName)s: %(message)s")
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+
+class TaxonomyIntervalIndexTests(unittest.TestCase):
+    def setUp(self):
+        self.__workPath = os.path.join(HERE, "test-output", "interval-index")
+        os.makedirs(self.__workPath, exist_ok=True)
+        # random tree in shuffled node order, plus a second root 5000 with a parent missing from the node table
+        self.__nodeD = getRandomNodeTree(2000, seed=11)
+        self.__rnd = random.Random(11)
+        self.__startTime = time.time()
+        logger.info("Starting %s at %s", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+
+    def tearDown(self):
+        endTime = time.time()
+        logger.info("Completed %s at %s (%.4f seconds)", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()), endTime - self.__startTime)
+
+    def __getLineage(self, taxId):
+        return list(iterLineage(self.__nodeD, taxId))
+
+    def testIntervalIndex(self):
+        """Test descendant tests and subtree ranges against lineages for in-memory and memory-mapped indices"""
+        nS = TaxonomyNodeStore(nodeD=self.__nodeD)
+        indexPath = os.path.join(self.__workPath, "interval-index.bin")
+        self.assertTrue(TaxonomyIntervalIndex(nodeStore=nS).write(indexPath))
+        pairL = [(self.__rnd.randrange(1, 2000), self.__rnd.randrange(1, 2000)) for _ in range(1000)] + [(7, 7), (5001, 5000), (5000, 5001), (5001, 1)]
+        for intervalIndex in [TaxonomyIntervalIndex(nodeStore=nS), TaxonomyIntervalIndex(filePath=indexPath)]:
+            self.assertEqual(len(intervalIndex), len(self.__nodeD))
+            for taxId, ancestorTaxId in pairL:
+                expected = ancestorTaxId in self.__getLineage(taxId)
+                self.assertEqual(intervalIndex.isDescendant(nS.index(taxId), nS.index(ancestorTaxId)), expected)
+            idx = nS.index(1)
+            self.assertEqual(intervalIndex.preorder(idx), 0)
+            self.assertEqual(intervalIndex.subtreeSize(idx), 1999)
+            subtreeL = sorted(nS.taxId(cIdx) for cIdx in intervalIndex.subtreeIndices(nS.index(17)))
+            self.assertEqual(subtreeL, sorted(taxId for taxId in self.__nodeD if 17 in self.__getLineage(taxId)))
+            self.assertEqual([nS.taxId(cIdx) for cIdx in intervalIndex.subtreeIndices(nS.index(5000))], [5000, 5001])
+            parentS = {parentTaxId for taxId, (parentTaxId, _) in self.__nodeD.items() if parentTaxId != taxId}
+            for taxId in [1, 17, 5000]:
+                subtreeL = [nS.taxId(cIdx) for cIdx in intervalIndex.subtreeIndices(nS.index(taxId))]
+                self.assertEqual(intervalIndex.leafCount(nS.index(taxId)), len([tId for tId in subtreeL if tId not in parentS]))
+                self.assertEqual(intervalIndex.speciesCount(nS.index(taxId)), len([tId for tId in subtreeL if self.__nodeD[tId][1] == "species"]))
+            intervalIndex.close()
+
+
+def intervalIndexSuite():
+    suiteSelect = unittest.TestSuite()
+    suiteSelect.addTest(TaxonomyIntervalIndexTests("testIntervalIndex"))
+    return suiteSelect
+
+
+if __name__ == "__main__":
+    mySuite = intervalIndexSuite()
+    unittest.TextTestRunner(verbosity=2).run(mySuite)
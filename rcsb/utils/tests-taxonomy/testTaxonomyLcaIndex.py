@@ -0,0 +1,79 @@
+# File:    testTaxonomyLcaIndex.py
+# Date:    16-Oct-2026
+#
+# Update:
+#
+##
+"""
+Tests for the binary lifting lowest common ancestor index.
+
+"""
+
+__docformat__ = "restructuredtext en"
+__license__ = "Apache 2.0"
+
+import logging
+import os
+import random
+import time
+import unittest
+
+from rcsb.utils.taxonomy.TaxonomyLcaIndex import TaxonomyLcaIndex
+from rcsb.utils.taxonomy.TaxonomyNodeStore import TaxonomyNodeStore
+
+from taxonomyTestTree import getRandomNodeTree, iterLineage
+
+HERE = os.path.abspath(os.path.dirname(__file__))
+TOPDIR = os.path.dirname(os.path.dirname(os.path.dirname(HERE)))
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s]-%(module)s.%(funcName)s: %(message)s")
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+
+class TaxonomyLcaIndexTests(unittest.TestCase):
+    def setUp(self):
+        self.__workPath = os.path.join(HERE, "test-output", "lca-index")
+        os.makedirs(self.__workPath, exist_ok=True)
+        # random tree with long chains and wide fan-out, in shuffled node order, plus a second root 5000
+        self.__nodeD = getRandomNodeTree(3000, seed=7)
+        self.__rnd = random.Random(7)
+        self.__startTime = time.time()
+        logger.info("Starting %s at %s", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+
+    def tearDown(self):
+        endTime = time.time()
+        logger.info("Completed %s at %s (%.4f seconds)", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()), endTime - self.__startTime)
+
+    def __getLineage(self, taxId):
+        return list(iterLineage(self.__nodeD, taxId))
+
+    def testLcaIndex(self):
+        """Test LCA queries against lineage intersection for in-memory and memory-mapped indices"""
+        nS = TaxonomyNodeStore(nodeD=self.__nodeD)
+        indexPath = os.path.join(self.__workPath, "lca-index.bin")
+        self.assertTrue(TaxonomyLcaIndex(nodeStore=nS).write(indexPath))
+        pairL = [(self.__rnd.randrange(1, 3000), self.__rnd.randrange(1, 3000)) for _ in range(500)] + [(7, 7), (1, 2999)]
+        for lcaIndex in [TaxonomyLcaIndex(nodeStore=nS), TaxonomyLcaIndex(filePath=indexPath)]:
+            self.assertEqual(len(lcaIndex), len(self.__nodeD))
+            for taxId1, taxId2 in pairL:
+                lineage = self.__getLineage(taxId2)
+                expected = next(taxId for taxId in self.__getLineage(taxId1) if taxId in lineage)
+                self.assertEqual(nS.taxId(lcaIndex.lca(nS.index(taxId1), nS.index(taxId2))), expected)
+            idxL = lcaIndex.lcaList([(nS.index(5001), nS.index(5000)), (nS.index(5001), nS.index(1))])
+            self.assertEqual(idxL, [nS.index(5000), -1])
+            idx = nS.index(2999)
+            self.assertEqual(lcaIndex.depth(idx), len(self.__getLineage(2999)) - 1)
+            self.assertEqual(nS.taxId(lcaIndex.ancestor(idx, 1)), self.__getLineage(2999)[-2])
+            self.assertEqual(lcaIndex.ancestor(idx, lcaIndex.depth(idx) + 1), -1)
+
+
+def lcaIndexSuite():
+    suiteSelect = unittest.TestSuite()
+    suiteSelect.addTest(TaxonomyLcaIndexTests("testLcaIndex"))
+    return suiteSelect
+
+
+if __name__ == "__main__":
+    mySuite = lcaIndexSuite()
+    unittest.TextTestRunner(verbosity=2).run(mySuite)
@@ -0,0 +1,71 @@
+# File:    testTaxonomyLruCache.py
+# Date:    16-Oct-2026
+#
+# Update:
+#
+##
+"""
+Tests for the bounded LRU memo.
+
+"""
+
+__docformat__ = "restructuredtext en"
+__license__ = "Apache 2.0"
+
+import logging
+import os
+import time
+import unittest
+
+from rcsb.utils.taxonomy.TaxonomyLruCache import TaxonomyLruCache
+
+HERE = os.path.abspath(os.path.dirname(__file__))
+TOPDIR = os.path.dirname(os.path.dirname(os.path.dirname(HERE)))
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s]-%(module)s.%(funcName)s: %(message)s")
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+
+class TaxonomyLruCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.__callL = []
+        self.__startTime = time.time()
+        logger.info("Starting %s at %s", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+
+    def tearDown(self):
+        endTime = time.time()
+        logger.info("Completed %s at %s (%.4f seconds)", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()), endTime - self.__startTime)
+
+    def __square(self, val):
+        self.__callL.append(val)
+        return val * val
+
+    def testLruEviction(self):
+        """Test memo hits, misses and least recently used eviction"""
+        memo = TaxonomyLruCache(maxSize=2)
+        self.assertEqual(memo.getOrCompute(("sq", 2), self.__square, 2), 4)
+        self.assertEqual(memo.getOrCompute(("sq", 3), self.__square, 3), 9)
+        self.assertEqual(memo.getOrCompute(("sq", 2), self.__square, 2), 4)
+        # 3 is least recently used and is evicted
+        self.assertEqual(memo.getOrCompute(("sq", 4), self.__square, 4), 16)
+        self.assertEqual(memo.getOrCompute(("sq", 2), self.__square, 2), 4)
+        self.assertEqual(memo.getOrCompute(("sq", 3), self.__square, 3), 9)
+        self.assertEqual(self.__callL, [2, 3, 4, 3])
+        self.assertEqual(memo.getStats(), {"hits": 2, "misses": 4, "evictions": 2, "size": 2, "maxSize": 2})
+        # unhashable keys are computed but not memoized
+        self.assertEqual(memo.getOrCompute(["sq", 5], self.__square, 5), 25)
+        self.assertEqual(len(memo), 2)
+        memo.clear()
+        self.assertEqual(memo.getStats()["size"], 0)
+
+
+def lruCacheSuite():
+    suiteSelect = unittest.TestSuite()
+    suiteSelect.addTest(TaxonomyLruCacheTests("testLruEviction"))
+    return suiteSelect
+
+
+if __name__ == "__main__":
+    mySuite = lruCacheSuite()
+    unittest.TextTestRunner(verbosity=2).run(mySuite)
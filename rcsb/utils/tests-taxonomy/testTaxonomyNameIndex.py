@@ -0,0 +1,108 @@
+# File:    testTaxonomyNameIndex.py
+# Date:    16-Oct-2026
+#
+# Update:
+#
+##
+"""
+Tests for the sorted organism name index.
+
+"""
+
+__docformat__ = "restructuredtext en"
+__license__ = "Apache 2.0"
+
+import logging
+import os
+import random
+import time
+import unittest
+
+from rcsb.utils.taxonomy.TaxonomyNameIndex import TaxonomyNameIndex
+from rcsb.utils.taxonomy.TaxonomyNameStore import TaxonomyNameStore
+
+HERE = os.path.abspath(os.path.dirname(__file__))
+TOPDIR = os.path.dirname(os.path.dirname(os.path.dirname(HERE)))
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s]-%(module)s.%(funcName)s: %(message)s")
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+
+class TaxonomyNameIndexTests(unittest.TestCase):
+    def setUp(self):
+        self.__workPath = os.path.join(HERE, "test-output", "name-index")
+        os.makedirs(self.__workPath, exist_ok=True)
+        # random names drawn from a small vocabulary (so that many are shared), some taxa lack alternate or scientific names
+        rnd = random.Random(19)
+        wordL = ["homo", "sapiens", "Pan", "coli", "été", "bacterium", "virus", "Escherichia", "human", " environmental samples "]
+        nameD = {}
+        for taxId in rnd.sample(range(1, 100000), 1500):
+            nmD = {}
+            if rnd.random() < 0.95:
+                nmD["sn"] = " ".join(rnd.sample(wordL, 2))
+            if rnd.random() < 0.5:
+                nmD["alt"] = rnd.choice(wordL)
+            if rnd.random() < 0.5:
+                nmD["cn"] = [" ".join(rnd.sample(wordL, 2)).lower() for _ in range(rnd.randrange(1, 4))]
+            nameD[taxId] = nmD
+        self.__nameD = nameD
+        self.__startTime = time.time()
+        logger.info("Starting %s at %s", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+
+    def tearDown(self):
+        endTime = time.time()
+        logger.info("Completed %s at %s (%.4f seconds)", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()), endTime - self.__startTime)
+
+    def __getNameMap(self):
+        """Reference name map (as formerly built on first use by TaxonomyProvider)"""
+        tD = {}
+        tSetD = {}
+
+        def addName(name, taxId):
+            tD[name.strip().upper()] = taxId
+            tSetD.setdefault(name.strip().upper(), set()).add(taxId)
+
+        for taxId, nmD in self.__nameD.items():
+            # (names up to the first missing field are indexed)
+            try:
+                addName(nmD["sn"], taxId)
+                addName(nmD["alt"], taxId)
+                for nm in sorted(set(nmD["cn"])):
+                    addName(nm, taxId)
+            except Exception:
+                pass
+        return tD, tSetD
+
+    def testNameIndex(self):
+        """Test name lookups against the reference name map for in-memory and memory-mapped indices"""
+        nS = TaxonomyNameStore(nameD=self.__nameD)
+        indexPath = os.path.join(self.__workPath, "name-index.bin")
+        self.assertTrue(TaxonomyNameIndex(nameStore=nS).write(indexPath))
+        tD, tSetD = self.__getNameMap()
+        for nameIndex in [TaxonomyNameIndex(nameStore=nS), TaxonomyNameIndex(filePath=indexPath)]:
+            self.assertEqual(len(nameIndex), len(tD))
+            self.assertEqual([nameIndex.key(kk) for kk in range(len(nameIndex))], sorted(tD, key=lambda ky: ky.encode("utf-8")))
+            for name, taxId in tD.items():
+                self.assertEqual(nameIndex.taxId(name.lower()), taxId)
+                taxIdL = nameIndex.taxIds(name)
+                self.assertEqual(taxIdL[0], taxId)
+                self.assertEqual(sorted(taxIdL), sorted(tSetD[name]))
+                self.assertEqual(nameIndex.isAmbiguous(name), len(tSetD[name]) > 1)
+            self.assertEqual(nameIndex.taxId("  Environmental Samples  "), tD["ENVIRONMENTAL SAMPLES"])
+            self.assertIsNone(nameIndex.taxId("no such organism"))
+            self.assertIsNone(nameIndex.taxId(None))
+            self.assertEqual(nameIndex.taxIds("ZZZ"), [])
+            self.assertFalse(nameIndex.isAmbiguous(""))
+            nameIndex.close()
+
+
+def nameIndexSuite():
+    suiteSelect = unittest.TestSuite()
+    suiteSelect.addTest(TaxonomyNameIndexTests("testNameIndex"))
+    return suiteSelect
+
+
+if __name__ == "__main__":
+    mySuite = nameIndexSuite()
+    unittest.TextTestRunner(verbosity=2).run(mySuite)
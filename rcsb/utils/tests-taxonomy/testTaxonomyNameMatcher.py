@@ -0,0 +1,139 @@
+# File:    testTaxonomyNameMatcher.py
+# Date:    16-Oct-2026
+#
+# Update:
+# 16-Oct-2026 matcher built from the name store - add fuzzy matching of common names of taxa with no alternate name
+#
+##
+"""
+Tests for approximate organism name matching with the trigram name matcher.
+
+"""
+
+__docformat__ = "restructuredtext en"
+__license__ = "Apache 2.0"
+
+import logging
+import os
+import random
+import time
+import unittest
+
+from rcsb.utils.taxonomy.TaxonomyNameIndex import TaxonomyNameIndex
+from rcsb.utils.taxonomy.TaxonomyNameMatcher import TaxonomyNameMatcher
+from rcsb.utils.taxonomy.TaxonomyNameStore import TaxonomyNameStore
+
+HERE = os.path.abspath(os.path.dirname(__file__))
+TOPDIR = os.path.dirname(os.path.dirname(os.path.dirname(HERE)))
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s]-%(module)s.%(funcName)s: %(message)s")
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+
+class TaxonomyNameMatcherTests(unittest.TestCase):
+    def setUp(self):
+        self.__workPath = os.path.join(HERE, "test-output", "name-matcher")
+        os.makedirs(self.__workPath, exist_ok=True)
+        rnd = random.Random(23)
+        sylL = ["ba", "ce", "di", "fo", "gu", "ha", "ki", "lo", "mu", "ne", "pa", "ri", "so", "tu", "vé"]
+        nameD = {}
+        for taxId in range(1, 1500):
+            genus = "".join(rnd.choice(sylL) for _ in range(rnd.randint(2, 4))).capitalize()
+            nmD = {"sn": "%s %s" % (genus, "".join(rnd.choice(sylL) for _ in range(rnd.randint(2, 4))))}
+            if rnd.random() < 0.2:
+                nmD["sn"] += " str. %d" % rnd.randint(1, 99)
+            nameD[taxId] = nmD
+        nameD[562] = {"sn": "Escherichia coli", "alt": "E. coli", "cn": ["E coli"]}
+        nameD[83333] = {"sn": "Escherichia coli K-12"}
+        # common names (e.g. synonyms) of a taxon with no alternate name are not in the exact name index
+        nameD[10090] = {"sn": "Mus musculus", "cn": ["house mouse", "Mus musculus domesticus"]}
+        self.__nameD = nameD
+        self.__rnd = rnd
+        self.__startTime = time.time()
+        logger.info("Starting %s at %s", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+
+    def tearDown(self):
+        endTime = time.time()
+        logger.info("Completed %s at %s (%.4f seconds)", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()), endTime - self.__startTime)
+
+    def __editDistance(self, s1, s2):
+        prevL = list(range(len(s2) + 1))
+        for ii, c1 in enumerate(s1, 1):
+            curL = [ii]
+            for jj, c2 in enumerate(s2, 1):
+                curL.append(min(prevL[jj] + 1, curL[jj - 1] + 1, prevL[jj - 1] + (c1 != c2)))
+            prevL = curL
+        return prevL[-1]
+
+    def __getNameKeys(self):
+        """Reference {normalized name: preferred taxId} over all names (the last taxon carrying a name)"""
+        keyD = {}
+        for taxId, nmD in self.__nameD.items():
+            for name in [nmD.get("sn"), nmD.get("alt")] + nmD.get("cn", []):
+                if name is not None:
+                    keyD[TaxonomyNameIndex.normalize(name)] = taxId
+        return keyD
+
+    def __getBestScores(self, keyD, name, minScore):
+        """Reference best score per taxon by exhaustive edit distance scoring"""
+        query = TaxonomyNameMatcher.matchForm(name)
+        scoreD = {}
+        for key, taxId in keyD.items():
+            keyForm = TaxonomyNameMatcher.matchForm(key)
+            score = round(1.0 - self.__editDistance(query, keyForm) / max(len(query), len(keyForm)), 4)
+            if score >= minScore and score > scoreD.get(taxId, -1.0):
+                scoreD[taxId] = score
+        return scoreD
+
+    def testNameMatcher(self):
+        """Test approximate matches against exhaustive scoring for in-memory and memory-mapped matchers"""
+        nameStore = TaxonomyNameStore(nameD=self.__nameD)
+        keyD = self.__getNameKeys()
+        matcherPath = os.path.join(self.__workPath, "name-matcher.bin")
+        self.assertTrue(TaxonomyNameMatcher(nameStore=nameStore).write(matcherPath))
+        # misspelled names (a substitution, a deletion and punctuation) and verbatim names
+        queryL = []
+        for taxId in self.__rnd.sample(sorted(self.__nameD), 15):
+            sn = self.__nameD[taxId]["sn"]
+            ii = self.__rnd.randrange(1, len(sn) - 1)
+            queryL.extend([sn[:ii] + "x" + sn[ii + 1 :], sn[:ii] + sn[ii + 1 :] + ".", sn.lower()])
+        scoreDL = [self.__getBestScores(keyD, query, 0.75) for query in queryL]
+        for nameMatcher in [TaxonomyNameMatcher(nameStore=nameStore), TaxonomyNameMatcher(filePath=matcherPath)]:
+            self.assertEqual(len(nameMatcher), len(keyD))
+            for query, scoreD, matchL in zip(queryL, scoreDL, nameMatcher.matchList(queryL, maxResults=3, minScore=0.75)):
+                expectedL = sorted(scoreD.values(), reverse=True)[:3]
+                self.assertEqual([mD["score"] for mD in matchL], expectedL, query)
+                for mD in matchL:
+                    self.assertEqual(scoreD[mD["taxId"]], mD["score"])
+            matchL = nameMatcher.match("Escherichia colli", minScore=0.7)
+            self.assertEqual([(mD["taxId"], mD["name"]) for mD in matchL], [(562, "ESCHERICHIA COLI"), (83333, "ESCHERICHIA COLI K-12")])
+            self.assertEqual(nameMatcher.match("escherichia coli k12")[0]["taxId"], 83333)
+            self.assertEqual(nameMatcher.match("E.coli", maxResults=1), [{"taxId": 562, "name": "E COLI", "score": 1.0}])
+            self.assertEqual(nameMatcher.match("Zzyzx"), [])
+            self.assertEqual(nameMatcher.match(None), [])
+            self.assertEqual(nameMatcher.match(" . "), [])
+            nameMatcher.close()
+        self.assertEqual(TaxonomyNameMatcher(nameStore=TaxonomyNameStore(nameD={})).match("Escherichia coli"), [])
+
+    def testNameMatcherCommonNames(self):
+        """Test fuzzy matching of the common names of a taxon with no alternate name"""
+        nameStore = TaxonomyNameStore(nameD=self.__nameD)
+        # (the exact name index keeps the baseline rule)
+        self.assertIsNone(TaxonomyNameIndex(nameStore=nameStore).taxId("Mus musculus domesticus"))
+        nameMatcher = TaxonomyNameMatcher(nameStore=nameStore)
+        self.assertEqual(nameMatcher.match("Mus musculus domesticus", maxResults=1), [{"taxId": 10090, "name": "MUS MUSCULUS DOMESTICUS", "score": 1.0}])
+        self.assertEqual(nameMatcher.match("mus muscullus domesticus", maxResults=1)[0]["taxId"], 10090)
+        self.assertEqual(nameMatcher.match("house mouse.", maxResults=1)[0]["name"], "HOUSE MOUSE")
+
+
+def nameMatcherSuite():
+    suiteSelect = unittest.TestSuite()
+    suiteSelect.addTest(TaxonomyNameMatcherTests("testNameMatcher"))
+    suiteSelect.addTest(TaxonomyNameMatcherTests("testNameMatcherCommonNames"))
+    return suiteSelect
+
+
+if __name__ == "__main__":
+    mySuite = nameMatcherSuite()
+    unittest.TextTestRunner(verbosity=2).run(mySuite)
@@ -0,0 +1,93 @@
+# File:    testTaxonomyNameResolver.py
+# Date:    16-Oct-2026
+#
+# Update:
+#
+##
+"""
+Tests for bulk organism name resolution.
+
+"""
+
+__docformat__ = "restructuredtext en"
+__license__ = "Apache 2.0"
+
+import gzip
+import logging
+import os
+import random
+import time
+import unittest
+
+from rcsb.utils.taxonomy.TaxonomyNameIndex import TaxonomyNameIndex
+from rcsb.utils.taxonomy.TaxonomyNameResolver import TaxonomyNameResolver
+from rcsb.utils.taxonomy.TaxonomyNameStore import TaxonomyNameStore
+
+HERE = os.path.abspath(os.path.dirname(__file__))
+TOPDIR = os.path.dirname(os.path.dirname(os.path.dirname(HERE)))
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s]-%(module)s.%(funcName)s: %(message)s")
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+
+class TaxonomyNameResolverTests(unittest.TestCase):
+    def setUp(self):
+        self.__workPath = os.path.join(HERE, "test-output", "name-resolver")
+        os.makedirs(self.__workPath, exist_ok=True)
+        rnd = random.Random(29)
+        wordL = ["homo", "sapiens", "Pan", "coli", "été", "bacterium", "virus", "Escherichia", "human"]
+        nameD = {}
+        for taxId in rnd.sample(range(1, 100000), 800):
+            nameD[taxId] = {"sn": " ".join(rnd.sample(wordL, 2)), "alt": " ".join(rnd.sample(wordL, 3))}
+        nameStore = TaxonomyNameStore(nameD=nameD)
+        self.__nameIndex = TaxonomyNameIndex(nameStore=nameStore)
+        self.__indexPath = os.path.join(self.__workPath, "name-index.bin")
+        self.assertTrue(self.__nameIndex.write(self.__indexPath))
+        # repeated names in varying case and spacing, unknown names and non-string values
+        nameL = [nmD["sn"] for nmD in nameD.values()] + [nmD["alt"] for nmD in nameD.values()]
+        self.__queryL = [rnd.choice([nm, nm.upper(), "  %s " % nm.lower()]) for nm in rnd.choices(nameL, k=5000)]
+        self.__queryL.extend(["homo homo sapiens", "", None, 9606])
+        rnd.shuffle(self.__queryL)
+        self.__startTime = time.time()
+        logger.info("Starting %s at %s", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+
+    def tearDown(self):
+        endTime = time.time()
+        logger.info("Completed %s at %s (%.4f seconds)", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()), endTime - self.__startTime)
+
+    def __getExpected(self, nameList):
+        rL = []
+        for name in nameList:
+            taxIdL = self.__nameIndex.taxIds(name) if isinstance(name, str) else []
+            rL.append((name, taxIdL[0] if taxIdL else None, "unresolved" if not taxIdL else "ambiguous" if len(taxIdL) > 1 else "resolved"))
+        return rL
+
+    def testResolveNames(self):
+        """Test in-process and multi-process bulk resolution against single name lookups"""
+        expectedL = self.__getExpected(self.__queryL)
+        self.assertTrue(any(status == "ambiguous" for _, _, status in expectedL))
+        self.assertTrue(any(status == "resolved" for _, _, status in expectedL))
+        self.assertEqual(sum(status == "unresolved" for _, _, status in expectedL), 4)
+        tnR = TaxonomyNameResolver(nameIndex=self.__nameIndex, batchSize=700)
+        self.assertEqual(list(tnR.resolve(iter(self.__queryL))), expectedL)
+        tnR = TaxonomyNameResolver(filePath=self.__indexPath, numProc=2, batchSize=3000, chunkSize=100)
+        self.assertEqual(list(tnR.resolve(self.__queryL)), expectedL)
+        self.assertEqual(list(tnR.resolve([])), [])
+        #
+        nameL = [nm for nm in self.__queryL if isinstance(nm, str)]
+        filePath = os.path.join(self.__workPath, "names.txt.gz")
+        with gzip.open(filePath, "wt", encoding="utf-8") as ofh:
+            ofh.write("".join("%s\n" % nm for nm in nameL))
+        self.assertEqual(list(tnR.resolveFile(filePath)), self.__getExpected(nameL))
+
+
+def nameResolverSuite():
+    suiteSelect = unittest.TestSuite()
+    suiteSelect.addTest(TaxonomyNameResolverTests("testResolveNames"))
+    return suiteSelect
+
+
+if __name__ == "__main__":
+    mySuite = nameResolverSuite()
+    unittest.TextTestRunner(verbosity=2).run(mySuite)
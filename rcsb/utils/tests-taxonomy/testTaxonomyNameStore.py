@@ -0,0 +1,77 @@
+# File:    testTaxonomyNameStore.py
+# Date:    16-Oct-2026
+#
+# Update:
+#
+##
+"""
+Tests for the compact string-pool taxonomy name store.
+
+"""
+
+__docformat__ = "restructuredtext en"
+__license__ = "Apache 2.0"
+
+import logging
+import os
+import time
+import unittest
+
+from rcsb.utils.taxonomy.TaxonomyNameStore import TaxonomyNameStore
+
+HERE = os.path.abspath(os.path.dirname(__file__))
+TOPDIR = os.path.dirname(os.path.dirname(os.path.dirname(HERE)))
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s]-%(module)s.%(funcName)s: %(message)s")
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+
+class TaxonomyNameStoreTests(unittest.TestCase):
+    def setUp(self):
+        self.__workPath = os.path.join(HERE, "test-output", "name-store")
+        os.makedirs(self.__workPath, exist_ok=True)
+        self.__nameD = {
+            1: {"sn": "root", "cn": ["all"]},
+            562: {"sn": "Escherichia coli", "alt": "E. coli", "cn": ["E. coli", "Bacterium coli", "E. coli"]},
+            9606: {"sn": "Homo sapiens", "cn": ["human", "man", "human"], "alt": "man"},
+            7: {"cn": ["nodeless"]},
+            10: {"sn": "Cellvibrio été"},
+        }
+        self.__startTime = time.time()
+        logger.info("Starting %s at %s", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+
+    def tearDown(self):
+        endTime = time.time()
+        logger.info("Completed %s at %s (%.4f seconds)", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()), endTime - self.__startTime)
+
+    def testNameStore(self):
+        """Test name store lookups for in-memory and memory-mapped stores"""
+        storePath = os.path.join(self.__workPath, "name-store.bin")
+        self.assertTrue(TaxonomyNameStore(nameD=self.__nameD).write(storePath))
+        for nS in [TaxonomyNameStore(nameD=self.__nameD), TaxonomyNameStore(filePath=storePath)]:
+            self.assertEqual(len(nS), len(self.__nameD))
+            self.assertEqual(dict(nS.nameD), self.__nameD)
+            self.assertEqual(list(nS.nameD), list(self.__nameD))
+            self.assertEqual(nS.index(424242), -1)
+            self.assertEqual(nS.index("9606"), -1)
+            idx = nS.index(9606)
+            self.assertEqual(nS.scientificName(idx), "Homo sapiens")
+            self.assertEqual(nS.alternateName(idx), "man")
+            self.assertEqual(nS.commonNames(idx), ["human", "man", "human"])
+            self.assertEqual(nS.sortedCommonNames(idx), ["human", "man"])
+            self.assertEqual(nS.sortedCommonNames(nS.index(562)), ["Bacterium coli", "E. coli"])
+            self.assertIsNone(nS.scientificName(nS.index(7)))
+            self.assertFalse(nS.hasCommonNames(nS.index(10)))
+            self.assertEqual(nS.scientificName(nS.index(10)), "Cellvibrio été")
+
+
+def nameStoreSuite():
+    suiteSelect = unittest.TestSuite()
+    suiteSelect.addTest(TaxonomyNameStoreTests("testNameStore"))
+    return suiteSelect
+
+
+if __name__ == "__main__":
+    mySuite = nameStoreSuite()
+    unittest.TextTestRunner(verbosity=2).run(mySuite)
@@ -0,0 +1,91 @@
+# File:    testTaxonomyNodeStore.py
+# Date:    16-Oct-2026
+#
+# Update:
+#
+##
+"""
+Tests for the compact array-backed taxonomy node store.
+
+"""
+
+__docformat__ = "restructuredtext en"
+__license__ = "Apache 2.0"
+
+import logging
+import os
+import time
+import unittest
+
+from rcsb.utils.taxonomy.TaxonomyNodeStore import TaxonomyNodeStore
+
+HERE = os.path.abspath(os.path.dirname(__file__))
+TOPDIR = os.path.dirname(os.path.dirname(os.path.dirname(HERE)))
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s]-%(module)s.%(funcName)s: %(message)s")
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+
+class TaxonomyNodeStoreTests(unittest.TestCase):
+    def setUp(self):
+        self.__workPath = os.path.join(HERE, "test-output", "node-store")
+        os.makedirs(self.__workPath, exist_ok=True)
+        # 77 is a node whose parent (88) is missing from the node table
+        self.__nodeD = {1: (1, "no rank"), 2: (1, "domain"), 9606: (9605, "species"), 562: (2, "species"), 9605: (2, "genus"), 77: (88, "species"), 63221: (9606, "subspecies")}
+        self.__startTime = time.time()
+        logger.info("Starting %s at %s", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+
+    def tearDown(self):
+        endTime = time.time()
+        logger.info("Completed %s at %s (%.4f seconds)", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()), endTime - self.__startTime)
+
+    def testNodeStore(self):
+        """Test node store lookups for in-memory and memory-mapped stores"""
+        storePath = os.path.join(self.__workPath, "node-store.bin")
+        mergeD = {12: 562, 3: 9606, 424242: 1}
+        self.assertTrue(TaxonomyNodeStore(nodeD=self.__nodeD, mergeD=mergeD).write(storePath))
+        for nS in [TaxonomyNodeStore(nodeD=self.__nodeD, mergeD=mergeD), TaxonomyNodeStore(filePath=storePath)]:
+            self.assertEqual(len(nS), len(self.__nodeD))
+            self.assertEqual(dict(nS.nodeD), self.__nodeD)
+            self.assertEqual(list(nS.nodeD), list(self.__nodeD))
+            self.assertEqual(nS.index(424242), -1)
+            self.assertEqual(nS.index("9606"), -1)
+            self.assertNotIn(88, nS.nodeD)
+            self.assertEqual(nS.rank(nS.index(9605)), "genus")
+            self.assertEqual(nS.getRankList(), ["no rank", "domain", "species", "genus", "subspecies"])
+            self.assertEqual(nS.parentTaxId(nS.index(77)), 88)
+            self.assertEqual(nS.parentIndex(nS.index(77)), -1)
+            self.assertEqual([nS.taxId(idx) for idx in nS.lineageIndices(nS.index(63221))], [63221, 9606, 9605, 2, 1])
+            self.assertEqual(nS.children(1), [1, 2])
+            self.assertEqual(nS.children(2), [562, 9605])
+            self.assertEqual(nS.children(88), [77])
+            self.assertEqual(nS.children(63221), [])
+            self.assertEqual(nS.children("2"), [])
+            self.assertEqual(nS.bfsTaxIds(1), [1, 2, 562, 9605, 9606, 63221])
+            self.assertEqual(nS.bfsTaxIds(9605), [9605, 9606, 63221])
+            self.assertEqual(nS.bfsTaxIds(88), [88, 77])
+            self.assertEqual(nS.bfsTaxIds(424242), [424242])
+            self.assertEqual(nS.bfsTaxIds("2"), ["2"])
+            self.assertEqual(nS.section("childStart").tolist(), [0, 2, 4, 5, 5, 6, 6, 6])
+            self.assertEqual(nS.section("childIndex").tolist(), [0, 1, 3, 4, 6, 2])
+            self.assertEqual(dict(nS.mergeD), mergeD)
+            self.assertEqual(list(nS.mergeD), [3, 12, 424242])
+            self.assertEqual(nS.mergedTaxId(12), 562)
+            self.assertIsNone(nS.mergedTaxId(9606))
+            self.assertIsNone(nS.mergedTaxId("12"))
+            self.assertNotIn(9606, nS.mergeD)
+        self.assertEqual(len(TaxonomyNodeStore(nodeD={})), 0)
+        self.assertEqual(TaxonomyNodeStore(nodeD={}).bfsTaxIds(1), [1])
+        self.assertEqual(len(TaxonomyNodeStore(nodeD=self.__nodeD).mergeD), 0)
+
+
+def nodeStoreSuite():
+    suiteSelect = unittest.TestSuite()
+    suiteSelect.addTest(TaxonomyNodeStoreTests("testNodeStore"))
+    return suiteSelect
+
+
+if __name__ == "__main__":
+    mySuite = nodeStoreSuite()
+    unittest.TextTestRunner(verbosity=2).run(mySuite)
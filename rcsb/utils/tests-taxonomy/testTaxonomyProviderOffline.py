@@ -0,0 +1,565 @@
+# File:    testTaxonomyProviderOffline.py
+# Date:    16-Oct-2026
+#
+# Update:
+#
+##
+"""
+Tests for TaxonomyProvider loading options using a small local taxonomy dump (no network access).
+
+"""
+
+__docformat__ = "restructuredtext en"
+__license__ = "Apache 2.0"
+
+import concurrent.futures
+import json
+import logging
+import multiprocessing
+import os
+import tarfile
+import time
+import unittest
+
+import numpy as np
+
+from rcsb.utils.taxonomy.TaxonomyProvider import TaxonomyProvider
+
+HERE = os.path.abspath(os.path.dirname(__file__))
+TOPDIR = os.path.dirname(os.path.dirname(os.path.dirname(HERE)))
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s]-%(module)s.%(funcName)s: %(message)s")
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+
+def sharedMemoryWorker(args):
+    name, taxId = args
+    tU = TaxonomyProvider(sharedMemoryName=name)
+    ret = (tU.getLineage(taxId), tU.getScientificName(taxId), tU.getMergedTaxId(12))
+    tU.releaseSharedMemory()
+    return ret
+
+
+class TaxonomyProviderOfflineTests(unittest.TestCase):
+    def setUp(self):
+        self.__workPath = os.path.join(HERE, "test-output", "offline")
+        self.__cachePath = os.path.join(self.__workPath, "CACHE")
+        self.__dumpDirPath = os.path.join(HERE, "test-data", "taxdump-mini")
+        self.__dumpPath = os.path.join(self.__workPath, "taxdump.tar.gz")
+        os.makedirs(self.__workPath, exist_ok=True)
+        with tarfile.open(self.__dumpPath, "w:gz") as tarF:
+            for fn in sorted(os.listdir(self.__dumpDirPath)):
+                tarF.add(os.path.join(self.__dumpDirPath, fn), arcname=fn)
+        self.__tU = TaxonomyProvider(cachePath=self.__cachePath, useCache=False, ncbiTaxonomyUrl=self.__dumpPath)
+        self.__startTime = time.time()
+        logger.info("Starting %s at %s", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+
+    def tearDown(self):
+        endTime = time.time()
+        logger.info("Completed %s at %s (%.4f seconds)", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()), endTime - self.__startTime)
+
+    def __writeUpdateDump(self):
+        """Write a modified copy of the test dump and return its path."""
+        updateDirPath = os.path.join(self.__workPath, "taxdump-update")
+        os.makedirs(updateDirPath, exist_ok=True)
+        # merge 63221 into 9606, add 999999 below 9606, rename 9605 and change the rank of 9604
+        for fn in ["names.dmp", "nodes.dmp", "merged.dmp"]:
+            with open(os.path.join(self.__dumpDirPath, fn), "r", encoding="utf-8") as ifh:
+                lineL = [line for line in ifh if not line.startswith("63221\t")]
+            if fn == "names.dmp":
+                lineL = [line.replace("\thumans\t", "\thominins\t") for line in lineL]
+                lineL.append("999999\t|\tHomo sp. Altai\t|\t\t|\tscientific name\t|\n")
+            elif fn == "nodes.dmp":
+                lineL = [line.replace("9604\t|\t9443\t|\tfamily", "9604\t|\t9443\t|\tsuperfamily") for line in lineL]
+                lineL.append("999999\t|\t9606\t|\tno rank\t|\t\t|\n")
+            else:
+                lineL.append("63221\t|\t9606\t|\n")
+            with open(os.path.join(updateDirPath, fn), "w", encoding="utf-8") as ofh:
+                ofh.write("".join(lineL))
+        updatePath = os.path.join(self.__workPath, "taxdump-update.tar.gz")
+        with tarfile.open(updatePath, "w:gz") as tarF:
+            for fn in sorted(os.listdir(updateDirPath)):
+                tarF.add(os.path.join(updateDirPath, fn), arcname=fn)
+        return updatePath
+
+    def testUpdateCache(self):
+        """Test incremental cache update from a modified taxonomy dump"""
+        updatePath = self.__writeUpdateDump()
+        #
+        tU = TaxonomyProvider(cachePath=self.__cachePath, useCache=True)
+        changeD = tU.updateCache(urlTarget=updatePath)
+        self.assertEqual(changeD["nodes"], {"inserted": [999999], "changed": [9604], "deleted": [63221]})
+        self.assertEqual(changeD["names"], {"inserted": [999999], "changed": [9605], "deleted": [63221]})
+        self.assertEqual(changeD["merged"], {"inserted": [63221], "changed": [], "deleted": []})
+        self.assertTrue(os.path.exists(os.path.join(self.__cachePath, "NCBI", "taxonomy_changes.json")))
+        self.assertEqual(tU.getMergedTaxId(63221), 9606)
+        self.assertEqual(tU.getChildren(9606), [741158, 999999])
+        #
+        rU = TaxonomyProvider(cachePath=os.path.join(self.__workPath, "CACHE-rebuild"), useCache=False, ncbiTaxonomyUrl=updatePath)
+        uU = TaxonomyProvider(cachePath=self.__cachePath, useCache=True)
+        for taxId in [9604, 9605, 9606, 63221, 999999, 562]:
+            self.assertEqual(uU.getLineageWithNames(taxId), rU.getLineageWithNames(taxId))
+            self.assertEqual(uU.getRank(taxId), rU.getRank(taxId))
+        #
+        namePath = os.path.join(self.__cachePath, "NCBI", "taxonomy_names-py3.pic")
+        mTime = os.path.getmtime(namePath)
+        changeD = uU.updateCache(urlTarget=updatePath)
+        self.assertFalse(any(vL for cD in changeD.values() for vL in cD.values()))
+        self.assertEqual(os.path.getmtime(namePath), mTime)
+
+    def testUpdateCacheFormatSwitch(self):
+        """Test that the snapshot cache format is not served stale after an update in pickle mode"""
+        tU = TaxonomyProvider(cachePath=self.__cachePath, useCache=True, cacheFormat="snapshot")
+        self.assertEqual(tU.getChildren(9606), [63221, 741158])
+        tU = TaxonomyProvider(cachePath=self.__cachePath, useCache=True)
+        changeD = tU.updateCache(urlTarget=self.__writeUpdateDump())
+        self.assertEqual(changeD["nodes"]["inserted"], [999999])
+        for cacheFormat in ["snapshot", "pickle", "snapshot"]:
+            tU = TaxonomyProvider(cachePath=self.__cachePath, useCache=True, cacheFormat=cacheFormat)
+            self.assertEqual(tU.getMergedTaxId(63221), 9606)
+            self.assertEqual(tU.getChildren(9606), [741158, 999999])
+            self.assertEqual(tU.getScientificName(999999), "Homo sp. Altai")
+            self.assertEqual(tU.getRank(9604), "superfamily")
+
+    def testLazyLoading(self):
+        """Test lazy per-component loading"""
+        tU = TaxonomyProvider(cachePath=self.__cachePath, useCache=True, lazy=True)
+        self.assertEqual(tU.getLoadedComponents(), [])
+        self.assertEqual(tU.getLineage(9606), self.__tU.getLineage(9606))
+        self.assertTrue(tU.isEukaryota(9606))
+        self.assertEqual(tU.compareTaxons(9597, 9598), self.__tU.compareTaxons(9597, 9598))
+        self.assertEqual(tU.getLoadedComponents(), ["nodes", "merged", "nodeStore", "intervalIndex"])
+        self.assertEqual(tU.getScientificName(9606), "Homo sapiens")
+        self.assertIn("names", tU.getLoadedComponents())
+        #
+        tU = TaxonomyProvider(cachePath=self.__cachePath, useCache=True, components=["nodes", "nodeStore"])
+        self.assertEqual(tU.getLoadedComponents(), ["nodes", "nodeStore"])
+        self.assertEqual(tU.getChildren(9606), [63221, 741158])
+        self.assertEqual(tU.getTaxId("Homo sapiens"), 9606)
+        # (name lookups use the cached name index without loading the names)
+        self.assertEqual(sorted(tU.getLoadedComponents()), ["nameMap", "nodeStore", "nodes"])
+        self.assertEqual(tU.getTaxId(" homo SAPIENS "), 9606)
+        self.assertIsNone(tU.getTaxId("Homo sapiens nonexistens"))
+        self.assertIsNone(tU.getTaxId(None))
+        self.assertEqual(tU.getNameTaxIds("human"), [9606])
+        self.assertFalse(tU.isAmbiguousName("human"))
+        self.assertEqual(tU.getNameTaxIds("unknown organism"), [])
+
+    def testWarmup(self):
+        """Test background warmup and concurrent first use of lazily loaded structures"""
+        tU = TaxonomyProvider(cachePath=self.__cachePath, useCache=True, lazy=True)
+        future = tU.warmup(numThreads=3)
+        self.assertEqual(future.result(timeout=60), {cN: True for cN in ["nodeStore", "nameStore", "lcaIndex", "intervalIndex", "rankedLineage", "nameMap"]})
+        self.assertEqual(tU.getLoadedComponents(), ["names", "nodes", "nodeStore", "nameStore", "lcaIndex", "intervalIndex", "rankedLineage", "nameMap"])
+        self.assertEqual(tU.warmup(["nameMap", "nameMap"]).result(timeout=60), {"nameMap": True})
+        self.assertEqual(tU.warmup(["unknown"]).result(timeout=60), {"unknown": False})
+        self.assertEqual(tU.warmup([]).result(timeout=60), {})
+        #
+        taxIdL = [9606, 9598, 9597, 63221, 562, 9443] * 10
+        expectedL = [(self.__tU.getLineage(taxId), self.__tU.getLowestCommonAncestor(taxId, 9606), self.__tU.getTaxId(self.__tU.getScientificName(taxId))) for taxId in taxIdL]
+        tU = TaxonomyProvider(cachePath=self.__cachePath, useCache=True, lazy=True)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+            rL = list(executor.map(lambda taxId: (tU.getLineage(taxId), tU.getLowestCommonAncestor(taxId, 9606), tU.getTaxId(tU.getScientificName(taxId))), taxIdL))
+        self.assertEqual(rL, expectedL)
+
+    def testInstrumentation(self):
+        """Test method timers, counters and load phase timings"""
+        self.assertEqual(self.__tU.getStats(), {})
+        publishedL = []
+        tU = TaxonomyProvider(cachePath=self.__cachePath, useCache=False, ncbiTaxonomyUrl=self.__dumpPath, statsHook=publishedL.append)
+        self.assertEqual(len(publishedL), 1)
+        phaseD = publishedL[0]["phases"]
+        for phase in ["load", "download", "parseNames", "parseNodes", "parseMerged", "pickleWrite", "build.nodeStore", "build.nameStore", "build.nameMap"]:
+            self.assertEqual(phaseD[phase]["count"], 1, phase)
+            self.assertGreaterEqual(phaseD[phase]["totalSeconds"], 0.0)
+        self.assertEqual(tU.getLineage(12), tU.getLineage(562))
+        self.assertIsNone(tU.getScientificName(99999999))
+        self.assertEqual(tU.getScientificName(9606), "Homo sapiens")
+        self.assertIsNone(tU.getTaxId("unknown organism"))
+        self.assertEqual(tU.getLowestCommonAncestor(9606, 562), 131567)
+        statsD = tU.getStats()
+        methodD = statsD["methods"]
+        self.assertEqual(methodD["getScientificName"]["calls"], 2)
+        self.assertEqual(methodD["getScientificName"]["misses"], 1)
+        self.assertEqual(sum(methodD["getScientificName"]["histogram"].values()), 2)
+        self.assertEqual(methodD["getTaxId"]["misses"], 1)
+        self.assertGreaterEqual(methodD["getLineage"]["calls"], 2)
+        self.assertGreater(methodD["getLineage"]["totalSeconds"], 0.0)
+        self.assertGreaterEqual(statsD["counters"]["mergedRedirects"], 1)
+        self.assertTrue("open.lcaIndex" in statsD["phases"] or "build.lcaIndex" in statsD["phases"])
+        # handled exceptions are counted
+        self.assertIsNone(tU.getDepths(["not a taxId"]))
+        self.assertEqual(tU.getStats()["counters"]["exceptions.getDepths"], 1)
+        self.assertEqual(tU.publishStats()["methods"]["getTaxId"]["calls"], 1)
+        self.assertEqual(len(publishedL), 2)
+        tU.resetStats()
+        self.assertEqual(tU.getStats(), {"methods": {}, "counters": {}, "phases": {}})
+        # only the outermost query method call is recorded, with method-specific misses
+        self.assertTrue(tU.isBacteria(12))
+        self.assertFalse(tU.isBacteria(9606))
+        self.assertFalse(tU.isBacteria(99999999))
+        self.assertEqual(tU.getChildren(63221), [])
+        self.assertEqual(len(tU.getLineageWithNames(9606)), len(self.__tU.getLineageWithNames(9606)))
+        tU.warmup(["intervalIndex"]).result()
+        methodD = tU.getStats()["methods"]
+        self.assertEqual(sorted(methodD), ["getChildren", "getLineageWithNames", "isBacteria"])
+        self.assertEqual((methodD["isBacteria"]["calls"], methodD["isBacteria"]["misses"]), (3, 1))
+        self.assertEqual((methodD["getChildren"]["calls"], methodD["getChildren"]["misses"]), (1, 1))
+        tU.resetStats()
+        #
+        tU = TaxonomyProvider(cachePath=self.__cachePath, useCache=True, lazy=True, instrument=True)
+        self.assertEqual(tU.getRank(9606), "species")
+        phaseD = tU.getStats()["phases"]
+        self.assertEqual(sorted(phaseD), ["cacheLoad.nodes", "load"])
+
+    def testMemoryReport(self):
+        """Test the memory report and memory budget for optional derived structures"""
+        # (build and cache the structures, then open them memory-mapped)
+        self.assertTrue(self.__tU.loadComponents(["lcaIndex", "intervalIndex", "nameMap"]))
+        self.assertEqual(self.__tU.getMemoryReport()["components"]["lcaIndex"]["backing"], "heap")
+        tU = TaxonomyProvider(cachePath=self.__cachePath, useCache=True, memoSize=16)
+        self.assertTrue(tU.loadComponents(["lcaIndex", "intervalIndex", "nameMap"]))
+        tU.getLineage(9606)
+        reportD = tU.getMemoryReport()
+        componentD = reportD["components"]
+        for component in ["merged", "nodeStore", "nameStore", "lcaIndex", "intervalIndex", "nameMap", "memo"]:
+            self.assertGreater(componentD[component]["bytes"], 0, component)
+        self.assertEqual(componentD["lcaIndex"]["backing"], "mapped")
+        self.assertEqual(componentD["merged"]["backing"], "heap")
+        self.assertEqual(reportD["totalBytes"], reportD["heapBytes"] + reportD["mappedBytes"])
+        self.assertEqual(reportD["totalBytes"], sum(uD["bytes"] for uD in componentD.values()))
+        self.assertIsNone(reportD["memoryBudget"])
+        self.assertTrue(tU.releaseComponents(["lcaIndex", "nameMap"]))
+        self.assertFalse(tU.releaseComponents(["nodeStore"]))
+        self.assertNotIn("lcaIndex", tU.getLoadedComponents())
+        self.assertEqual(tU.getLowestCommonAncestor(9606, 562), 131567)
+        self.assertIn("lcaIndex", tU.getLoadedComponents())
+        #
+        # other optional structures are released to make room
+        lcaBytes = componentD["lcaIndex"]["bytes"]
+        budget = reportD["totalBytes"] - componentD["intervalIndex"]["bytes"] - componentD["memo"]["bytes"]
+        tU = TaxonomyProvider(cachePath=self.__cachePath, useCache=True, memoryBudget=budget, instrument=True)
+        self.assertTrue(tU.loadComponents(["nameMap", "intervalIndex", "lcaIndex"]))
+        self.assertIn("lcaIndex", tU.getLoadedComponents())
+        self.assertNotIn("nameMap", tU.getLoadedComponents())
+        self.assertLessEqual(tU.getMemoryReport()["totalBytes"], budget)
+        self.assertEqual(tU.getStats()["counters"]["memoryBudgetReleases"], 1)
+        # ... or the structure is not opened
+        budget = tU.getMemoryReport()["totalBytes"] - lcaBytes - componentD["intervalIndex"]["bytes"] + lcaBytes // 2
+        tU = TaxonomyProvider(cachePath=self.__cachePath, useCache=True, memoryBudget=budget, instrument=True)
+        self.assertFalse(tU.loadComponents(["lcaIndex"]))
+        self.assertEqual(tU.getLowestCommonAncestor(9606, 562), 131567)
+        self.assertEqual(tU.getScientificName(9606), "Homo sapiens")
+        self.assertEqual(tU.getStats()["counters"]["memoryBudgetRefusals"], 2)
+        self.assertEqual(tU.getStats()["counters"]["memoryBudgetFallbacks"], 1)
+
+    def testMemoryBudgetFallbacks(self):
+        """Test that queries needing optional structures refused by the memory budget fall back to node store walks or raise"""
+        rU = self.__tU
+        tU = TaxonomyProvider(cachePath=self.__cachePath, useCache=True, memoryBudget=1)
+        taxIdL = [9606, 63221, 741158, 562, 511145, 2697049, 10239, 2, 1, 12908, 1354003, 37012, 424242, 99999999]
+        for taxId in taxIdL:
+            for ancestorTaxId in [1, 2, 2759, 9604, 10239, 424242]:
+                self.assertEqual(tU.isDescendantOf(taxId, ancestorTaxId), rU.isDescendantOf(taxId, ancestorTaxId), (taxId, ancestorTaxId))
+            self.assertEqual(tU.isBacteria(taxId), rU.isBacteria(taxId), taxId)
+            self.assertEqual(tU.isEukaryota(taxId), rU.isEukaryota(taxId), taxId)
+            self.assertEqual(tU.getDomainClass(taxId), rU.getDomainClass(taxId), taxId)
+            self.assertEqual(tU.getSubtreeStats(taxId), rU.getSubtreeStats(taxId), taxId)
+            self.assertEqual(tU.getRankedLineage(taxId), rU.getRankedLineage(taxId), taxId)
+            self.assertEqual(tU.getAncestorAtRank(taxId, "genus"), rU.getAncestorAtRank(taxId, "genus"), taxId)
+            for refTaxId in [9606, 562, 9598]:
+                self.assertEqual(tU.getLowestCommonAncestor(taxId, refTaxId), rU.getLowestCommonAncestor(taxId, refTaxId), (taxId, refTaxId))
+        self.assertEqual(tU.isDescendantOfList(taxIdL, 2759), rU.isDescendantOfList(taxIdL, 2759))
+        self.assertEqual(tU.getLowestCommonAncestors([(63221, 741158), (562, 9606)]), {(63221, 741158): 9606, (562, 9606): 131567})
+        for kwD in [{}, {"startTaxId": 2759}, {"filterD": {9606: True, 562: True, 10239: True, 741158: True, 37012: True, 424242: True}}, {"startTaxId": 9604, "rootTaxId": 9604}]:
+            self.assertEqual(tU.exportNodeList(**kwD), rU.exportNodeList(**kwD), kwD)
+        for startTaxId, rootTaxId in [(1, 1), (9604, 9604), (2759, 1)]:
+            filterD = {int(dD["id"]): True for dD in rU.exportNodeList(startTaxId=startTaxId, rootTaxId=rootTaxId)}
+            filterD[startTaxId] = True
+            self.assertEqual(tU.exportNodeList(startTaxId=startTaxId, rootTaxId=rootTaxId, filterD=filterD), rU.exportNodeList(startTaxId=startTaxId, rootTaxId=rootTaxId))
+        # no fallback - the refusal is raised rather than reported as a miss
+        for func, args in [(tU.getTaxId, ("Homo sapiens",)), (tU.getNameTaxIds, ("human",)), (tU.matchOrganismName, ("Homo sapeins",)), (tU.getDepths, ([9606],))]:
+            with self.assertRaises(MemoryError):
+                func(*args)
+        self.assertFalse(any(cN in tU.getLoadedComponents() for cN in ["lcaIndex", "intervalIndex", "rankedLineage", "nameMap", "nameMatcher"]))
+
+    def testLowestCommonAncestor(self):
+        """Test lowest common ancestor lookups"""
+        self.assertEqual(self.__tU.getLowestCommonAncestor(63221, 741158), 9606)
+        self.assertEqual(self.__tU.getLowestCommonAncestor(9606, 9606), 9606)
+        self.assertEqual(self.__tU.getLowestCommonAncestorGen(9597, 9606), 207598)
+        self.assertEqual(self.__tU.getLowestCommonAncestor(562, 9606), 131567)
+        self.assertEqual(self.__tU.getLowestCommonAncestor(2697049, 562), 1)
+        self.assertIsNone(self.__tU.getLowestCommonAncestor(424242, 562))
+        pairL = [(83333, 511145), (10090, 9606), (183925, 562), (424242, 1)]
+        self.assertEqual(self.__tU.getLowestCommonAncestors(pairL), {(83333, 511145): 83333, (10090, 9606): 40674, (183925, 562): 131567})
+        self.assertTrue(os.path.exists(os.path.join(self.__cachePath, "NCBI", "taxonomy_lca_index.bin")))
+
+    def testDomainClass(self):
+        """Test interval index descendant tests and domain classification"""
+        tU = self.__tU
+        self.assertTrue(tU.isDescendantOf(9606, 9606))
+        self.assertTrue(tU.isDescendantOf(741158, 40674))
+        self.assertTrue(tU.isDescendantOf(37012, 9605))
+        self.assertTrue(tU.isDescendantOf(562, 1354003))
+        self.assertFalse(tU.isDescendantOf(40674, 9606))
+        self.assertFalse(tU.isDescendantOf(424242, 1))
+        self.assertEqual(tU.isDescendantOfList([9606, 10090, 562, 424242, 12], 40674), [True, True, False, False, False])
+        self.assertEqual(tU.isDescendantOfList([9606, 562], 424242), [False, False])
+        #
+        self.assertTrue(tU.isBacteria(12))
+        self.assertTrue(tU.isEukaryota(9606))
+        self.assertTrue(tU.isVirus(2697049))
+        self.assertTrue(tU.isArchaea(183925))
+        self.assertTrue(tU.isOther(81077))
+        self.assertTrue(tU.isUnclassified(12429))
+        self.assertFalse(tU.isBacteria(9606))
+        self.assertFalse(tU.isBacteria(1))
+        taxIdL = [511145, 183925, 9606, 2697049, 81077, 12429, 1, 424242, 2509511]
+        classL = ["bacteria", "archaea", "eukaryota", "virus", "other", "unclassified", None, None, "virus"]
+        self.assertEqual(tU.getDomainClassList(taxIdL), classL)
+        self.assertEqual([tU.getDomainClass(taxId) for taxId in taxIdL], classL)
+        self.assertTrue(os.path.exists(os.path.join(self.__cachePath, "NCBI", "taxonomy_interval_index.bin")))
+        #
+        cU = TaxonomyProvider(cachePath=self.__cachePath, useCache=True)
+        self.assertEqual(cU.getDomainClassList(taxIdL), classL)
+
+    def testMemoization(self):
+        """Test memoized lineage and name lineage results"""
+        tU = TaxonomyProvider(cachePath=self.__cachePath, useCache=True, memoSize=4)
+        self.assertEqual(self.__tU.getMemoStats(), {})
+        for _ in range(3):
+            for taxId in [9606, 562]:
+                self.assertEqual(tU.getLineage(taxId), tuple(self.__tU.getLineage(taxId)))
+                self.assertEqual(tU.getLineageWithNames(taxId), tuple(self.__tU.getLineageWithNames(taxId)))
+        self.assertIs(tU.getLineage(9606), tU.getLineage(9606))
+        self.assertEqual(tU.getLineageScientificNames(9606), tuple(self.__tU.getLineageScientificNames(9606)))
+        self.assertEqual(tU.getParentScientificName(9606, depth=2), self.__tU.getParentScientificName(9606, depth=2))
+        statD = tU.getMemoStats()
+        self.assertEqual(statD["maxSize"], 4)
+        self.assertEqual(statD["size"], 4)
+        self.assertGreaterEqual(statD["evictions"], 2)
+        self.assertGreaterEqual(statD["hits"], 8)
+        tU.clearMemo()
+        self.assertEqual(tU.getMemoStats()["size"], 0)
+
+    def testBatchQueries(self):
+        """Test vectorized batch queries against the single identifier methods"""
+        tU = self.__tU
+        taxIdL = [9606, 63221, 37012, 562, 12, 1, 131567, 2697049, 2509511, 424242, 511145, 81077]
+        taxIdA = np.array(taxIdL)
+        self.assertEqual(tU.getMergedTaxIds(taxIdA).tolist(), [tU.getMergedTaxId(taxId) for taxId in taxIdL])
+        self.assertEqual(tU.getParentTaxids(taxIdL).tolist(), [tU.getParentTaxid(taxId) or -1 for taxId in taxIdL])
+        rankL = tU.getRankList()
+        self.assertEqual([rankL[code] if code >= 0 else None for code in tU.getRankCodes(iter(taxIdL))], [tU.getRank(tU.getMergedTaxId(taxId)) for taxId in taxIdL])
+        depthA = tU.getDepths(taxIdA)
+        self.assertEqual(depthA.tolist(), [len(tU.getLineage(taxId)) if taxId not in (1, 424242) else (0 if taxId == 1 else -1) for taxId in taxIdL])
+        self.assertEqual(tU.getAncestorsAtDepth(taxIdA, 2).tolist(), [2759, 2759, 2759, 2, 2, -1, -1, 2559587, 2559587, -1, 2, 81077])
+        flatA, offsetA = tU.getLineages(taxIdA)
+        self.assertEqual(len(offsetA), len(taxIdL) + 1)
+        for ii, taxId in enumerate(taxIdL):
+            self.assertEqual(flatA[offsetA[ii] : offsetA[ii + 1]].tolist(), tU.getLineage(taxId))
+        #
+        flatA, offsetA = tU.getLineages([])
+        self.assertEqual((len(flatA), offsetA.tolist()), (0, [0]))
+
+    def testCompareTaxonPairs(self):
+        """Test batch taxon comparison against compareTaxons() (including nodes with a parent missing from the node table)"""
+        orphanDirPath = os.path.join(self.__workPath, "taxdump-orphan")
+        os.makedirs(orphanDirPath, exist_ok=True)
+        for fn in ["names.dmp", "nodes.dmp", "merged.dmp"]:
+            with open(os.path.join(self.__dumpDirPath, fn), "r", encoding="utf-8") as ifh:
+                lineL = ifh.readlines()
+            if fn == "names.dmp":
+                lineL.extend(["%d\t|\tOrphan %d\t|\t\t|\tscientific name\t|\n" % (taxId, taxId) for taxId in [999995, 999996, 999997]])
+            elif fn == "nodes.dmp":
+                lineL.extend(["999997\t|\t888888\t|\tstrain\t|\t\t|\n", "999996\t|\t888888\t|\tspecies\t|\t\t|\n", "999995\t|\t999996\t|\tno rank\t|\t\t|\n"])
+            else:
+                lineL.extend(["777777\t|\t999995\t|\n", "777776\t|\t888888\t|\n"])
+            with open(os.path.join(orphanDirPath, fn), "w", encoding="utf-8") as ofh:
+                ofh.write("".join(lineL))
+        orphanPath = os.path.join(self.__workPath, "taxdump-orphan.tar.gz")
+        with tarfile.open(orphanPath, "w:gz") as tarF:
+            for fn in sorted(os.listdir(orphanDirPath)):
+                tarF.add(os.path.join(orphanDirPath, fn), arcname=fn)
+        tU = TaxonomyProvider(cachePath=os.path.join(self.__workPath, "CACHE-orphan"), useCache=False, ncbiTaxonomyUrl=orphanPath)
+        #
+        with open(os.path.join(self.__dumpDirPath, "nodes.dmp"), "r", encoding="utf-8") as ifh:
+            taxIdL = [int(line.split("\t")[0]) for line in ifh]
+        taxIdL += [12, 37012, 2509511, 424242, 888888, 999995, 999996, 999997, 777777, 777776]
+        pairL = [(qId, rId) for qId in taxIdL for rId in taxIdL]
+        statusA, lcaA, rankA = tU.compareTaxonPairs(pairL)
+        statusL = tU.getCompareStatusList()
+        rankL = tU.getRankList()
+        resultL = [(statusL[code], lcaId if lcaId >= 0 else None, rankL[rankCode] if rankCode >= 0 else None) for code, lcaId, rankCode in zip(statusA, lcaA.tolist(), rankA)]
+        self.assertEqual(resultL, [tU.compareTaxons(qId, rId) for qId, rId in pairL])
+        self.assertIn("lowest common ancestor", statusL[statusA[pairL.index((999997, 999995))]])
+        self.assertEqual(lcaA[pairL.index((999997, 999995))], 888888)
+        #
+        statusA, lcaA, rankA = tU.compareTaxonPairs(np.array(pairL[:10]))
+        self.assertEqual(len(statusA), 10)
+
+    def testRankedLineage(self):
+        """Test ancestor lookups at major ranks"""
+        tU = self.__tU
+        self.assertTrue(os.path.exists(os.path.join(self.__cachePath, "NCBI", "taxonomy_ranked_lineage.bin")))
+        self.assertEqual(tU.getAncestorAtRank(741158, "genus"), 9605)
+        self.assertEqual(tU.getAncestorAtRank(9606, "species"), 9606)
+        self.assertEqual(tU.getAncestorAtRank(37012, "family"), 9604)
+        self.assertEqual(tU.getAncestorAtRank(511145, "phylum"), 1224)
+        self.assertIsNone(tU.getAncestorAtRank(9606, "subspecies"))
+        self.assertIsNone(tU.getAncestorAtRank(424242, "genus"))
+        self.assertEqual(tU.getRankedLineage(2697049), {"realm": 2559587, "species": 694009})
+        self.assertEqual(tU.getRankedLineage(1), {})
+        taxIdL = [741158, 562, 2697049, 12, 424242, 1]
+        self.assertEqual(tU.getAncestorsAtRank(taxIdL, "genus").tolist(), [9605, 561, -1, 561, -1, -1])
+        self.assertEqual(tU.getAncestorsAtRank(np.array(taxIdL), "domain").tolist(), [2759, 2, -1, 2, -1, -1])
+        self.assertIsNone(tU.getAncestorsAtRank(taxIdL, "tribe"))
+        # ranked lineage matches the lineage ranks
+        for taxId in [741158, 562, 2697049, 81077, 183925]:
+            rD = {tU.getRank(tId): tId for tId in tU.getLineage(taxId) if tU.getRank(tId) in tU.getRankedLineageRanks()}
+            self.assertEqual(tU.getRankedLineage(taxId), rD)
+
+    def testDescendants(self):
+        """Test DFS slice descendant enumeration and subtree statistics"""
+        tU = self.__tU
+        self.assertEqual(sorted(tU.getDescendants(10239).tolist()), sorted(tU.getBfsTraverseList(10239)[1:]))
+        self.assertEqual(tU.getDescendants(9605, includeSelf=True).tolist(), [9605, 9606, 63221, 741158])
+        self.assertEqual(sorted(tU.getDescendants(1).tolist()), sorted(tU.getBfsTraverseList(1)[1:]))
+        self.assertEqual(tU.getDescendants(9443, rank="species").tolist(), [9597, 9598, 9606])
+        self.assertEqual(tU.getDescendants(9443, maxDepth=1).tolist(), [9604])
+        self.assertEqual(tU.getDescendants(9604, maxDepth=2, includeSelf=True).tolist(), [9604, 207598, 9596, 9605])
+        self.assertEqual(tU.getDescendants(9443, rank="tribe").tolist(), [])
+        self.assertEqual(tU.getDescendants(37012).tolist(), [63221, 741158])
+        self.assertEqual(tU.getDescendants(424242).tolist(), [])
+        #
+        self.assertEqual(tU.getSubtreeStats(9605), {"size": 4, "leaves": 2, "species": 1})
+        self.assertEqual(tU.getSubtreeStats(1)["size"], len(tU.getBfsTraverseList(1)))
+        self.assertEqual(tU.getSpeciesCount(9443), 3)
+        self.assertEqual(tU.getLeafCount(2759), len([tId for tId in tU.getBfsTraverseList(2759) if not tU.getChildren(tId)]))
+        self.assertEqual(tU.getSubtreeSize(741158), 1)
+        self.assertIsNone(tU.getSubtreeSize(424242))
+
+    def testExportNodeListStream(self):
+        """Test streaming node list export against the in-memory node list export"""
+        tU = self.__tU
+        for kwD in [{}, {"startTaxId": 2759}, {"filterD": {9606: True, 562: True, 10239: True, 741158: True, 37012: True, 424242: True}}, {"startTaxId": 9604, "rootTaxId": 9604}]:
+            dL = tU.exportNodeList(**kwD)
+            jsonPath = os.path.join(self.__workPath, "node-list.json")
+            self.assertEqual(tU.exportNodeListStream(filePath=jsonPath, **kwD), len(dL))
+            with open(jsonPath, "r", encoding="utf-8") as ifh:
+                self.assertEqual(json.load(ifh), dL)
+            jsonlPath = os.path.join(self.__workPath, "node-list.jsonl")
+            self.assertEqual(tU.exportNodeListStream(filePath=jsonlPath, fmt="jsonl", **kwD), len(dL))
+            with open(jsonlPath, "r", encoding="utf-8") as ifh:
+                self.assertEqual([json.loads(line) for line in ifh], dL)
+        dL = tU.exportNodeList(filterD={9606: True, 562: True, 741158: True})
+        self.assertEqual([dD["id"] for dD in dL], ["562", "9606", "741158"])
+        self.assertEqual([dD["depth"] for dD in dL], [len(tU.getLineage(int(dD["id"]))) - 1 for dD in dL])
+        self.assertIsNone(tU.exportNodeListStream(fmt="xml"))
+
+    def testExportNodeListFilteredRoot(self):
+        """Test filtered node list exports including the root taxon (no root record is exported)"""
+        tU = self.__tU
+        filterD = {1: True, 9605: True, 9606: True}
+        dL = tU.exportNodeList(filterD=filterD)
+        self.assertEqual([dD["id"] for dD in dL], ["9605", "9606"])
+        jsonlPath = os.path.join(self.__workPath, "node-list-root.jsonl")
+        self.assertEqual(tU.exportNodeListStream(filePath=jsonlPath, fmt="jsonl", filterD=filterD), 2)
+        with open(jsonlPath, "r", encoding="utf-8") as ifh:
+            self.assertEqual([json.loads(line) for line in ifh], dL)
+        # filtered exports of every taxon below the start match the unfiltered export (record depths from the LCA index)
+        for startTaxId, rootTaxId in [(1, 1), (9604, 9604), (9604, 1), (2759, 1)]:
+            filterD = {int(dD["id"]): True for dD in tU.exportNodeList(startTaxId=startTaxId, rootTaxId=rootTaxId)}
+            filterD[startTaxId] = True
+            dL = tU.exportNodeList(startTaxId=startTaxId, rootTaxId=rootTaxId, filterD=filterD)
+            self.assertEqual(dL, tU.exportNodeList(startTaxId=startTaxId, rootTaxId=rootTaxId))
+            self.assertNotIn(None, dL)
+
+    def testNameMatching(self):
+        """Test approximate organism name matching"""
+        tU = self.__tU
+        self.assertEqual(tU.matchOrganismName("Homo sapiens")[0], {"taxId": 9606, "name": "HOMO SAPIENS", "score": 1.0})
+        self.assertEqual(tU.matchOrganismName("Homo sapeins")[0]["taxId"], 9606)
+        self.assertEqual(tU.matchOrganismName("Escherichia-coli.")[0]["taxId"], 562)
+        self.assertEqual(tU.matchOrganismName("Quercus robur"), [])
+        self.assertEqual([mL[0]["taxId"] if mL else None for mL in tU.matchOrganismNameList(["homo sapien", "Pan troglodites", "xyz"])], [9606, 9598, None])
+        # a GenBank common name of a taxon with no alternate name (not an exact match - see getTaxId())
+        self.assertIsNone(tU.getTaxId("chimpanzee"))
+        self.assertEqual(tU.matchOrganismName("chimpanze", maxResults=1)[0], {"taxId": 9598, "name": "CHIMPANZEE", "score": 0.9})
+        self.assertTrue(os.path.exists(os.path.join(self.__cachePath, "NCBI", "taxonomy_name_matcher.bin")))
+        tU = TaxonomyProvider(cachePath=self.__cachePath, useCache=True, components=["nameMatcher"])
+        self.assertEqual(tU.getLoadedComponents(), ["nameMatcher"])
+        self.assertEqual(tU.matchOrganismName("Pan paniscuss", maxResults=1)[0]["taxId"], 9597)
+
+    def testResolveOrganismNames(self):
+        """Test bulk organism name resolution"""
+        tU = self.__tU
+        nameL = ["Homo sapiens", "HUMAN", "Homo sapiens", "Quercus robur", None] * 3
+        expectedL = [(nm, tU.getTaxId(nm) if nm else None, "resolved" if tU.getTaxId(nm) else "unresolved") for nm in nameL]
+        self.assertEqual(list(tU.resolveOrganismNames(nameL)), expectedL)
+        self.assertEqual(list(tU.resolveOrganismNames(nameL, numProc=2, batchSize=4)), expectedL)
+        filePath = os.path.join(self.__workPath, "organism-names.txt")
+        with open(filePath, "w", encoding="utf-8") as ofh:
+            ofh.write("Homo sapiens\nunknown organism\n")
+        self.assertEqual(list(tU.resolveOrganismNames(filePath=filePath)), [("Homo sapiens", 9606, "resolved"), ("unknown organism", None, "unresolved")])
+
+    def testSharedMemory(self):
+        """Test attaching to taxonomy tables published in shared memory"""
+        name = self.__tU.publishSharedMemory()
+        self.assertIsNotNone(name)
+        try:
+            self.assertEqual(self.__tU.publishSharedMemory(), name)
+            tU = TaxonomyProvider(sharedMemoryName=name)
+            for taxId in [9606, 562, 9598, 2697049, 63221]:
+                self.assertEqual(tU.getLineageWithNames(taxId), self.__tU.getLineageWithNames(taxId))
+                self.assertEqual(tU.getCommonNames(taxId), self.__tU.getCommonNames(taxId))
+            self.assertEqual(tU.getChildren(9606), [63221, 741158])
+            self.assertEqual(tU.getTaxId("Homo sapiens"), 9606)
+            self.assertEqual(tU.getDomainClassList([9606, 562, 2697049]), ["eukaryota", "bacteria", "virus"])
+            self.assertEqual(tU.getParentTaxids([9606, 37012, 63221]).tolist(), [9605, 9605, 9606])
+            self.assertEqual(tU.getAncestorAtRank(741158, "genus"), 9605)
+            # one copy of each store - the merged identifiers are node store sections
+            componentD = tU.getMemoryReport()["components"]
+            self.assertNotIn("snapshot", componentD)
+            self.assertEqual(componentD["nodeStore"]["backing"], "shared")
+            self.assertEqual(tU.getMergedTaxId(12), 562)
+            self.assertEqual(tU.getMergedTaxIds([12, 9606]).tolist(), [562, 9606])
+            self.assertTrue(tU.releaseSharedMemory())
+            #
+            taxIdL = [9606, 562, 2697049]
+            with multiprocessing.Pool(2) as pool:
+                retL = pool.map(sharedMemoryWorker, [(name, taxId) for taxId in taxIdL])
+            self.assertEqual(retL, [(self.__tU.getLineage(taxId), self.__tU.getScientificName(taxId), 562) for taxId in taxIdL])
+        finally:
+            self.assertTrue(self.__tU.releaseSharedMemory())
+
+
+def providerOfflineSuite():
+    suiteSelect = unittest.TestSuite()
+    suiteSelect.addTest(TaxonomyProviderOfflineTests("testLazyLoading"))
+    suiteSelect.addTest(TaxonomyProviderOfflineTests("testUpdateCache"))
+    suiteSelect.addTest(TaxonomyProviderOfflineTests("testUpdateCacheFormatSwitch"))
+    suiteSelect.addTest(TaxonomyProviderOfflineTests("testSharedMemory"))
+    suiteSelect.addTest(TaxonomyProviderOfflineTests("testLowestCommonAncestor"))
+    suiteSelect.addTest(TaxonomyProviderOfflineTests("testDomainClass"))
+    suiteSelect.addTest(TaxonomyProviderOfflineTests("testMemoization"))
+    suiteSelect.addTest(TaxonomyProviderOfflineTests("testBatchQueries"))
+    suiteSelect.addTest(TaxonomyProviderOfflineTests("testCompareTaxonPairs"))
+    suiteSelect.addTest(TaxonomyProviderOfflineTests("testRankedLineage"))
+    suiteSelect.addTest(TaxonomyProviderOfflineTests("testDescendants"))
+    suiteSelect.addTest(TaxonomyProviderOfflineTests("testExportNodeListStream"))
+    suiteSelect.addTest(TaxonomyProviderOfflineTests("testExportNodeListFilteredRoot"))
+    suiteSelect.addTest(TaxonomyProviderOfflineTests("testNameMatching"))
+    suiteSelect.addTest(TaxonomyProviderOfflineTests("testResolveOrganismNames"))
+    suiteSelect.addTest(TaxonomyProviderOfflineTests("testWarmup"))
+    suiteSelect.addTest(TaxonomyProviderOfflineTests("testInstrumentation"))
+    suiteSelect.addTest(TaxonomyProviderOfflineTests("testMemoryReport"))
+    suiteSelect.addTest(TaxonomyProviderOfflineTests("testMemoryBudgetFallbacks"))
+    return suiteSelect
+
+
+if __name__ == "__main__":
+    mySuite = providerOfflineSuite()
+    unittest.TextTestRunner(verbosity=2).run(mySuite)
@@ -0,0 +1,74 @@
+# File:    testTaxonomyRankedLineage.py
+# Date:    16-Oct-2026
+#
+# Update:
+#
+##
+"""
+Tests for the ranked lineage table.
+
+"""
+
+__docformat__ = "restructuredtext en"
+__license__ = "Apache 2.0"
+
+import logging
+import os
+import time
+import unittest
+
+from rcsb.utils.taxonomy.TaxonomyNodeStore import TaxonomyNodeStore
+from rcsb.utils.taxonomy.TaxonomyRankedLineage import RANKED_LINEAGE_RANKS, TaxonomyRankedLineage
+
+from taxonomyTestTree import getRandomNodeTree, iterLineage
+
+HERE = os.path.abspath(os.path.dirname(__file__))
+TOPDIR = os.path.dirname(os.path.dirname(os.path.dirname(HERE)))
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s]-%(module)s.%(funcName)s: %(message)s")
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+
+class TaxonomyRankedLineageTests(unittest.TestCase):
+    def setUp(self):
+        self.__workPath = os.path.join(HERE, "test-output", "ranked-lineage")
+        os.makedirs(self.__workPath, exist_ok=True)
+        # random tree with random ranks in shuffled node order, plus a subtree 5000 below a parent missing from the node table
+        self.__nodeD = getRandomNodeTree(3000, seed=17, rankList=["no rank", "clade", "subfamily"] + RANKED_LINEAGE_RANKS[3:])
+        self.__startTime = time.time()
+        logger.info("Starting %s at %s", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+
+    def tearDown(self):
+        endTime = time.time()
+        logger.info("Completed %s at %s (%.4f seconds)", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()), endTime - self.__startTime)
+
+    def __getAncestorAtRank(self, taxId, rank):
+        return next((tId for tId in iterLineage(self.__nodeD, taxId) if self.__nodeD[tId][1] == rank), None)
+
+    def testRankedLineage(self):
+        """Test ranked ancestors against lineage walks for in-memory and memory-mapped tables"""
+        nS = TaxonomyNodeStore(nodeD=self.__nodeD)
+        tablePath = os.path.join(self.__workPath, "ranked-lineage.bin")
+        self.assertTrue(TaxonomyRankedLineage(nodeStore=nS).write(tablePath))
+        for rankedLineage in [TaxonomyRankedLineage(nodeStore=nS), TaxonomyRankedLineage(filePath=tablePath)]:
+            self.assertEqual(len(rankedLineage), len(self.__nodeD))
+            self.assertEqual(rankedLineage.ranks(), RANKED_LINEAGE_RANKS)
+            for taxId in self.__nodeD:
+                for rank in ["genus", "family", "species", "superkingdom"]:
+                    aIdx = rankedLineage.ancestorIndex(nS.index(taxId), rank)
+                    self.assertEqual(nS.taxId(aIdx) if aIdx >= 0 else None, self.__getAncestorAtRank(taxId, rank))
+            self.assertEqual(rankedLineage.ancestorIndex(nS.index(5001), "genus"), nS.index(5000))
+            self.assertEqual(rankedLineage.ancestorIndex(nS.index(5001), "subfamily"), -1)
+            rankedLineage.close()
+
+
+def rankedLineageSuite():
+    suiteSelect = unittest.TestSuite()
+    suiteSelect.addTest(TaxonomyRankedLineageTests("testRankedLineage"))
+    return suiteSelect
+
+
+if __name__ == "__main__":
+    mySuite = rankedLineageSuite()
+    unittest.TextTestRunner(verbosity=2).run(mySuite)
@@ -0,0 +1,98 @@
+# File:    testTaxonomySnapshot.py
+# Date:    16-Oct-2026
+#
+# Update:
+# 16-Oct-2026 snapshot mode is served from the node and name stores (no separate snapshot file)
+#
+##
+"""
+Tests for the memory-mapped (node and name store) taxonomy snapshot cache format.
+
+"""
+
+__docformat__ = "restructuredtext en"
+__license__ = "Apache 2.0"
+
+import logging
+import os
+import tarfile
+import time
+import unittest
+
+from rcsb.utils.taxonomy.TaxonomyProvider import TaxonomyProvider
+
+HERE = os.path.abspath(os.path.dirname(__file__))
+TOPDIR = os.path.dirname(os.path.dirname(os.path.dirname(HERE)))
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s]-%(module)s.%(funcName)s: %(message)s")
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+
+class TaxonomySnapshotTests(unittest.TestCase):
+    def setUp(self):
+        self.__workPath = os.path.join(HERE, "test-output", "snapshot")
+        self.__cachePath = os.path.join(self.__workPath, "CACHE")
+        self.__dumpDirPath = os.path.join(HERE, "test-data", "taxdump-mini")
+        self.__dumpPath = os.path.join(self.__workPath, "taxdump.tar.gz")
+        os.makedirs(self.__workPath, exist_ok=True)
+        with tarfile.open(self.__dumpPath, "w:gz") as tarF:
+            for fn in sorted(os.listdir(self.__dumpDirPath)):
+                tarF.add(os.path.join(self.__dumpDirPath, fn), arcname=fn)
+        self.__taxIdList = [9606, 63221, 741158, 562, 511145, 2697049, 10239, 2, 1, 12908, 1354003, 37012, 424242]
+        self.__startTime = time.time()
+        logger.info("Starting %s at %s", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+
+    def tearDown(self):
+        endTime = time.time()
+        logger.info("Completed %s at %s (%.4f seconds)", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()), endTime - self.__startTime)
+
+    def testSnapshotStoreViews(self):
+        """Test the snapshot cache format serves names, nodes and merged data from the memory-mapped stores"""
+        cachePath = os.path.join(self.__workPath, "CACHE-views")
+        TaxonomyProvider(cachePath=cachePath, useCache=False, ncbiTaxonomyUrl=self.__dumpPath)
+        sU = TaxonomyProvider(cachePath=cachePath, useCache=True, cacheFormat="snapshot")
+        usageD = sU.getMemoryReport()["components"]
+        for cN in ["names", "nodes", "merged"]:
+            self.assertEqual(usageD[cN]["backing"], "view")
+        for cN in ["nodeStore", "nameStore"]:
+            self.assertEqual(usageD[cN]["backing"], "mapped")
+        self.assertNotIn("snapshot", usageD)
+        self.assertFalse(any(fn.endswith("snapshot.bin") for fn in os.listdir(os.path.join(cachePath, "NCBI"))))
+        self.assertEqual(sU.getMergedTaxId(12), 562)
+
+    def testSnapshotProvider(self):
+        """Test provider getters on the snapshot cache format match the pickle cache format"""
+        tU = TaxonomyProvider(cachePath=self.__cachePath, useCache=False, ncbiTaxonomyUrl=self.__dumpPath)
+        self.assertEqual(tU.getScientificName(9606), "Homo sapiens")
+        # served from the existing store cache
+        sU = TaxonomyProvider(cachePath=self.__cachePath, useCache=True, cacheFormat="snapshot")
+        # built directly from source
+        fU = TaxonomyProvider(cachePath=os.path.join(self.__workPath, "CACHE-fresh"), useCache=False, ncbiTaxonomyUrl=self.__dumpPath, cacheFormat="snapshot")
+        for pU in [sU, fU]:
+            for taxId in self.__taxIdList:
+                self.assertEqual(pU.getMergedTaxId(taxId), tU.getMergedTaxId(taxId))
+                self.assertEqual(pU.getRank(taxId), tU.getRank(taxId))
+                self.assertEqual(pU.getScientificName(taxId), tU.getScientificName(taxId))
+                self.assertEqual(pU.getAlternateName(taxId), tU.getAlternateName(taxId))
+                self.assertEqual(pU.getCommonNames(taxId), tU.getCommonNames(taxId))
+                self.assertEqual(pU.getParentTaxid(taxId), tU.getParentTaxid(taxId))
+                self.assertEqual(pU.getLineage(taxId), tU.getLineage(taxId))
+                self.assertEqual(pU.getLineageWithNames(taxId), tU.getLineageWithNames(taxId))
+                self.assertEqual(pU.isVirus(taxId), tU.isVirus(taxId))
+                self.assertEqual(pU.getChildren(taxId), tU.getChildren(taxId))
+            self.assertEqual(pU.getTaxId("human"), 9606)
+            self.assertEqual(pU.getLowestCommonAncestor(63221, 741158), 9606)
+            self.assertEqual(pU.compareTaxons(9597, 9598), tU.compareTaxons(9597, 9598))
+
+
+def snapshotSuite():
+    suiteSelect = unittest.TestSuite()
+    suiteSelect.addTest(TaxonomySnapshotTests("testSnapshotStoreViews"))
+    suiteSelect.addTest(TaxonomySnapshotTests("testSnapshotProvider"))
+    return suiteSelect
+
+
+if __name__ == "__main__":
+    mySuite = snapshotSuite()
+    unittest.TextTestRunner(verbosity=2).run(mySuite)
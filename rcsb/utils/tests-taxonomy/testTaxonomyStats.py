@@ -0,0 +1,99 @@
+# File:    testTaxonomyStats.py
+# Date:    16-Oct-2026
+#
+# Update:
+# 16-Oct-2026 add nested call and miss predicate tests
+#
+##
+"""
+Tests for the provider instrumentation statistics.
+
+"""
+
+__docformat__ = "restructuredtext en"
+__license__ = "Apache 2.0"
+
+import logging
+import os
+import time
+import unittest
+
+from rcsb.utils.taxonomy.TaxonomyStats import TaxonomyStats, isEmptyResult
+
+HERE = os.path.abspath(os.path.dirname(__file__))
+TOPDIR = os.path.dirname(os.path.dirname(os.path.dirname(HERE)))
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s]-%(module)s.%(funcName)s: %(message)s")
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+
+class TaxonomyStatsTests(unittest.TestCase):
+    def setUp(self):
+        self.__startTime = time.time()
+        logger.info("Starting %s at %s", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+
+    def tearDown(self):
+        endTime = time.time()
+        logger.info("Completed %s at %s (%.4f seconds)", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()), endTime - self.__startTime)
+
+    def __lookup(self, val):
+        if val < 0:
+            raise ValueError("negative value")
+        return val if val > 0 else None
+
+    def testStats(self):
+        """Test method timers, counters, phases and the stats hook"""
+        publishedL = []
+        stats = TaxonomyStats(hook=publishedL.append)
+        lookup = stats.wrap("lookup", self.__lookup)
+        self.assertEqual([lookup(1), lookup(0), lookup(2)], [1, None, 2])
+        with self.assertRaises(ValueError):
+            lookup(-1)
+        stats.count("mergedRedirects")
+        stats.count("mergedRedirects", 2)
+        stats.countException("lookup")
+        with stats.phase("parseNames"):
+            time.sleep(0.01)
+        with self.assertRaises(KeyError):
+            with stats.phase("parseNodes"):
+                raise KeyError("failing phase")
+        statsD = stats.publish()
+        self.assertEqual(publishedL, [statsD])
+        mD = statsD["methods"]["lookup"]
+        self.assertEqual((mD["calls"], mD["misses"], mD["exceptions"]), (4, 1, 1))
+        self.assertEqual(sum(mD["histogram"].values()), 4)
+        self.assertEqual(list(mD["histogram"])[0], "<=1e-06")
+        self.assertLessEqual(mD["maxSeconds"], mD["totalSeconds"])
+        self.assertEqual(statsD["counters"], {"mergedRedirects": 3, "exceptions": 1, "exceptions.lookup": 1})
+        self.assertGreaterEqual(statsD["phases"]["parseNames"]["totalSeconds"], 0.01)
+        self.assertEqual(statsD["phases"]["parseNodes"]["count"], 1)
+        stats.reset()
+        self.assertEqual(stats.getStats(), {"methods": {}, "counters": {}, "phases": {}})
+        # hook failures are ignored
+        self.assertEqual(TaxonomyStats(hook=lambda statsD: 1 / 0).publish()["counters"], {})
+
+    def testNestedCalls(self):
+        """Test that only the outermost instrumented call is recorded and method-specific miss predicates"""
+        stats = TaxonomyStats()
+        lookup = stats.wrap("lookup", self.__lookup)
+        lookupList = stats.wrap("lookupList", lambda valList: [lookup(val) for val in valList if lookup(val)], isMiss=isEmptyResult)
+        self.assertEqual(lookupList([1, 0, 2]), [1, 2])
+        self.assertEqual(lookupList([0]), [])
+        with self.assertRaises(ValueError):
+            lookupList([-1])
+        self.assertEqual(lookup(0), None)
+        methodD = stats.getStats()["methods"]
+        self.assertEqual({name: (mD["calls"], mD["misses"], mD["exceptions"]) for name, mD in methodD.items()}, {"lookupList": (3, 1, 1), "lookup": (1, 1, 0)})
+
+
+def statsSuite():
+    suiteSelect = unittest.TestSuite()
+    suiteSelect.addTest(TaxonomyStatsTests("testStats"))
+    suiteSelect.addTest(TaxonomyStatsTests("testNestedCalls"))
+    return suiteSelect
+
+
+if __name__ == "__main__":
+    mySuite = statsSuite()
+    unittest.TextTestRunner(verbosity=2).run(mySuite)
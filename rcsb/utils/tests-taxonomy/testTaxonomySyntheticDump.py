@@ -0,0 +1,80 @@
+# File:    testTaxonomySyntheticDump.py
+# Date:    16-Oct-2026
+#
+# Update:
+#
+##
+"""
+Tests for the synthetic taxonomy dump generator.
+
+"""
+
+__docformat__ = "restructuredtext en"
+__license__ = "Apache 2.0"
+
+import collections
+import logging
+import os
+import time
+import unittest
+
+from rcsb.utils.taxonomy.TaxonomyProvider import TaxonomyProvider
+from rcsb.utils.taxonomy.TaxonomySyntheticDump import TaxonomySyntheticDump
+
+HERE = os.path.abspath(os.path.dirname(__file__))
+TOPDIR = os.path.dirname(os.path.dirname(os.path.dirname(HERE)))
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s]-%(module)s.%(funcName)s: %(message)s")
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+
+class TaxonomySyntheticDumpTests(unittest.TestCase):
+    def setUp(self):
+        self.__workPath = os.path.join(HERE, "test-output", "synthetic")
+        os.makedirs(self.__workPath, exist_ok=True)
+        self.__startTime = time.time()
+        logger.info("Starting %s at %s", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+
+    def tearDown(self):
+        endTime = time.time()
+        logger.info("Completed %s at %s (%.4f seconds)", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()), endTime - self.__startTime)
+
+    def testSyntheticDump(self):
+        """Test loading a synthetic taxonomy dump"""
+        numNodes = 5000
+        sD = TaxonomySyntheticDump(numNodes, seed=7)
+        tarPath = sD.writeTarDump(os.path.join(self.__workPath, "taxdump-synthetic.tar.gz"))
+        self.assertEqual(len({sD.taxId(idx) for idx in range(numNodes)}), numNodes)
+        self.assertEqual([sD.nodeIndex(sD.taxId(idx)) for idx in range(numNodes)], list(range(numNodes)))
+        self.assertEqual(sD.nodeIndex(-1), -1)
+        #
+        tU = TaxonomyProvider(cachePath=os.path.join(self.__workPath, "CACHE"), useCache=False, ncbiTaxonomyUrl=tarPath)
+        self.assertEqual(len(tU.getBfsTraverseList(1)), numNodes)
+        depthD = collections.Counter()
+        rankD = collections.Counter()
+        for idx in range(0, numNodes, 7):
+            taxId = sD.taxId(idx)
+            self.assertEqual(tU.getParentTaxid(taxId), sD.taxId(sD.parentIndex(idx)))
+            self.assertEqual(tU.getScientificName(taxId), sD.scientificName(idx))
+            self.assertEqual(tU.getRank(taxId), sD.rank(idx))
+            depthD[len(tU.getLineage(taxId))] += 1
+            rankD[tU.getRank(taxId)] += 1
+        # varied depths and mostly species
+        self.assertGreater(len(depthD), 5)
+        self.assertEqual(rankD.most_common(1)[0][0], "species")
+        for oldTaxId, taxId in sD.mergedTaxIds():
+            self.assertEqual(tU.getMergedTaxId(oldTaxId), taxId)
+        self.assertEqual(tU.getTaxId("Bacteria"), 2)
+        self.assertEqual(sD.sampleTaxIds(10), TaxonomySyntheticDump(numNodes, seed=7).sampleTaxIds(10))
+
+
+def syntheticDumpSuite():
+    suiteSelect = unittest.TestSuite()
+    suiteSelect.addTest(TaxonomySyntheticDumpTests("testSyntheticDump"))
+    return suiteSelect
+
+
+if __name__ == "__main__":
+    mySuite = syntheticDumpSuite()
+    unittest.TextTestRunner(verbosity=2).run(mySuite)